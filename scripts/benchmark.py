@@ -0,0 +1,521 @@
+#!/usr/bin/env python3
+
+# Copyright 2024 Kersten Henrik Breuer
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+#
+
+"""Benchmarks for profiling the performance of this package during development.
+Run a benchmark via `./scripts/benchmark.py <name>`, see `--help` for all available
+benchmarks.
+"""
+
+import collections
+import datetime
+import enum
+import pathlib
+import sys
+import threading
+import timeit
+import tracemalloc
+import uuid
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from fractions import Fraction
+from functools import partial
+from typing import Annotated, TypedDict, cast
+
+import typer
+from arcticfreeze import (
+    Converter,
+    FreezeOptions,
+    FrozenDict,
+    FrozenList,
+    FrozenTable,
+    ValidationCache,
+    compile_freezer,
+    deep_sizeof,
+    freeze,
+)
+from arcticfreeze._internal._converters import STANDARD_CONVERTERS
+from arcticfreeze._internal.resolve import get_converter_resolver
+from immutabledict import immutabledict
+
+app = typer.Typer()
+
+
+@app.callback()
+def main():
+    """Benchmarks for profiling the performance of this package."""
+
+
+def measure_memory_per_instance(factory: Callable[[int], object], count: int) -> float:
+    """Measure the memory in bytes allocated per instance created by the factory."""
+    tracemalloc.start()
+    instances = [factory(index) for index in range(count)]
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del instances
+    return allocated / count
+
+
+def create_mapping(mapping_type: type, keys: list[str], value: int) -> object:
+    """Create a mapping of the given type mapping all keys to the same value."""
+    return mapping_type(dict.fromkeys(keys, value))
+
+
+@app.command()
+def memory(count: int = 100_000):
+    """Compare the memory per instance of FrozenDict to immutabledict (which was used
+    as base class of FrozenDict before) for different numbers of keys.
+    """
+    typer.echo(f"{'keys':>6} {'immutabledict':>14} {'FrozenDict':>11} {'ratio':>6}")
+    for size in (1, 2, 3, 5, 8, 9, 16, 64):
+        keys = [f"key{index}" for index in range(size)]
+        reference = measure_memory_per_instance(
+            partial(create_mapping, immutabledict, keys), count
+        )
+        observed = measure_memory_per_instance(
+            partial(create_mapping, FrozenDict, keys), count
+        )
+        typer.echo(
+            f"{size:>6} {reference:>14.1f} {observed:>11.1f}"
+            + f" {observed / reference:>6.2f}"
+        )
+
+
+@app.command()
+def key_sharing(count: int = 100_000):
+    """Compare the memory per record of FrozenDicts created one by one (each storing
+    its own keys) to records frozen together (sharing a single table of keys) for
+    different numbers of keys.
+    """
+    typer.echo(f"{'keys':>6} {'unshared':>9} {'shared':>7} {'ratio':>6}")
+    for size in (2, 4, 8, 9, 16, 32, 64):
+        # the values are created in advance, so that only the mappings are measured:
+        records = [
+            {f"key{key}": index for key in range(size)} for index in range(count)
+        ]
+        tracemalloc.start()
+        unshared = [FrozenDict(record) for record in records]
+        unshared_bytes, _ = tracemalloc.get_traced_memory()
+        del unshared
+        tracemalloc.stop()
+
+        tracemalloc.start()
+        shared = freeze(records)
+        shared_bytes, _ = tracemalloc.get_traced_memory()
+        del shared
+        tracemalloc.stop()
+        typer.echo(
+            f"{size:>6} {unshared_bytes / count:>9.1f} {shared_bytes / count:>7.1f}"
+            + f" {shared_bytes / unshared_bytes:>6.2f}"
+        )
+
+
+@app.command()
+def batch(count: int = 1_000_000, repeat: int = 3):
+    """Compare freezing a list of Decimals using a converter with and without batch
+    conversion.
+    """
+    data = [Decimal(index) for index in range(count)]
+    per_object = Converter(input_type=Decimal)
+    batched = Converter(input_type=Decimal, convert_batch=lambda objs, _: objs)
+
+    for name, converter in (("per object", per_object), ("batch", batched)):
+        seconds = min(
+            timeit.repeat(
+                partial(freeze, data, add_converters=[converter]),
+                number=1,
+                repeat=repeat,
+            )
+        )
+        typer.echo(f"{name:>10}: {seconds:.3f}s")
+
+
+@app.command()
+def slicing(count: int = 1_000_000, page_size: int = 1000, repeat: int = 3):
+    """Compare paging through a large tuple to paging through an equal FrozenList."""
+
+    def page_through(items):
+        return [
+            items[start : start + page_size] for start in range(0, count, page_size)
+        ]
+
+    for name, items in (
+        ("tuple", tuple(range(count))),
+        ("FrozenList", FrozenList(range(count))),
+    ):
+        seconds = min(
+            timeit.repeat(
+                partial(page_through, items),
+                number=1,
+                repeat=repeat,
+            )
+        )
+        typer.echo(f"{name:>10}: {seconds * 1000:.3f}ms")
+
+
+@app.command()
+def threads(payloads: int = 2000, max_threads: int = 8):
+    """Measure the throughput of freezing independent payloads on multiple threads.
+    Scales with the number of cores only on free-threaded (no-GIL) builds.
+    """
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    typer.echo(f"GIL enabled: {is_gil_enabled}")
+    data = [
+        {"id": index, "tags": ["a", "b"], "values": {"x": [1.0, 2.0], "y": None}}
+        for index in range(payloads)
+    ]
+
+    baseline = None
+    thread_count = 1
+    while thread_count <= max_threads:
+        barrier = threading.Barrier(thread_count + 1)
+
+        def work(barrier=barrier):
+            barrier.wait()
+            for payload in data:
+                freeze(payload)
+
+        with ThreadPoolExecutor(max_workers=thread_count) as executor:
+            futures = [executor.submit(work) for _ in range(thread_count)]
+            barrier.wait()
+            start = timeit.default_timer()
+            for future in futures:
+                future.result()
+            seconds = timeit.default_timer() - start
+
+        throughput = thread_count * payloads / seconds
+        baseline = baseline or throughput
+        typer.echo(
+            f"{thread_count:>3} threads: {throughput:>10.0f} payloads/s"
+            + f" (speedup {throughput / baseline:.2f})"
+        )
+        thread_count *= 2
+
+
+class _Item(TypedDict):
+    name: str
+    price: float
+    tags: list[str]
+    attributes: dict[str, int]
+
+
+@app.command()
+def compiled(count: int = 10_000, repeat: int = 3):
+    """Compare freezing data with a static shape using `freeze` to using a freezer
+    compiled for its type hint.
+    """
+    data = {
+        f"group{index}": [
+            {
+                "name": "item",
+                "price": 1.5,
+                "tags": ["a", "b", "c"],
+                "attributes": {"x": 1, "y": 2},
+            }
+            for _ in range(5)
+        ]
+        for index in range(count // 5)
+    }
+    freeze_compiled = compile_freezer(dict[str, list[_Item]])
+
+    for name, function in (("freeze", freeze), ("compiled", freeze_compiled)):
+        seconds = min(timeit.repeat(partial(function, data), number=1, repeat=repeat))
+        typer.echo(f"{name:>10}: {seconds:.3f}s")
+
+
+@app.command()
+def table(count: int = 100_000, repeat: int = 3):
+    """Compare freezing, the memory usage, and summing a column of a list of records
+    frozen to a tuple of FrozenDicts to a FrozenTable.
+    """
+    records = [
+        {"id": index, "name": f"item{index % 100}", "price": index / 7, "stock": 3}
+        for index in range(count)
+    ]
+    for sequence_type, sum_prices in (
+        (tuple, lambda frozen: sum(record["price"] for record in frozen)),
+        (FrozenTable, lambda frozen: sum(frozen.column("price"))),
+    ):
+        freeze_seconds = min(
+            timeit.repeat(
+                partial(freeze, records, sequence_type=sequence_type),
+                number=1,
+                repeat=repeat,
+            )
+        )
+        frozen = freeze(records, sequence_type=sequence_type)
+        sum_seconds = min(
+            timeit.repeat(
+                partial(sum_prices, frozen),
+                number=1,
+                repeat=repeat,
+            )
+        )
+        typer.echo(
+            f"{sequence_type.__name__:>11}: freeze {freeze_seconds * 1000:.1f}ms,"
+            + f" {deep_sizeof(frozen) / 1e6:.1f}MB, column sum"
+            + f" {sum_seconds * 1000:.2f}ms"
+        )
+
+
+@app.command()
+def consume(count: int = 100_000):
+    """Compare the peak memory usage of freezing a list of records to freezing it
+    while consuming it, relative to the memory used by the list itself.
+    """
+
+    def create_records() -> list:
+        return [
+            {"id": index, "name": f"item{index}", "tags": [f"tag{index}"] * 3}
+            for index in range(count)
+        ]
+
+    for consume in (False, True):
+        tracemalloc.start()
+        records = create_records()
+        input_bytes, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        start = timeit.default_timer()
+        frozen = freeze(records, options=FreezeOptions(consume=consume))
+        seconds = timeit.default_timer() - start
+        del records
+        _, peak_bytes = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del frozen
+        typer.echo(
+            f"consume={consume!s:>5}: peak {peak_bytes / input_bytes:.2f}x the input,"
+            + f" {seconds * 1000:.0f}ms"
+        )
+
+
+@app.command()
+def builder(count: int = 1_000_000, repeat: int = 3):
+    """Compare building a large FrozenDict from a dict to using a builder."""
+    items = [(f"key{index}", index) for index in range(count)]
+
+    def from_dict() -> FrozenDict:
+        dict_ = {}
+        for key, value in items:
+            dict_[key] = value
+        return FrozenDict(dict_)
+
+    def from_builder() -> FrozenDict:
+        builder = FrozenDict.builder()
+        for key, value in items:
+            builder[key] = value
+        return builder.freeze()
+
+    for name, build in (("dict", from_dict), ("builder", from_builder)):
+        seconds = min(timeit.repeat(build, number=1, repeat=repeat))
+        tracemalloc.start()
+        frozen = build()
+        _, peak_bytes = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del frozen
+        typer.echo(f"{name:>8}: {seconds * 1000:.0f}ms, peak {peak_bytes / 1e6:.1f}MB")
+
+
+@app.command()
+def validation(count: int = 10_000, size: int = 50):
+    """Compare validating the same frozen config repeatedly with and without a
+    validation cache.
+    """
+    from pydantic import BaseModel
+
+    class Model(BaseModel):
+        config: FrozenDict[str, int]
+
+    class CachedModel(BaseModel):
+        config: Annotated[FrozenDict[str, int], ValidationCache()]
+
+    config = FrozenDict({f"key{index}": index for index in range(size)})
+    for model in (Model, CachedModel):
+        seconds = timeit.timeit(partial(model, config=config), number=count)
+        typer.echo(
+            f"{model.__name__:>11}: {seconds / count * 1e6:.2f}µs per validation"
+        )
+
+
+class _State(enum.Enum):
+    ACTIVE = 1
+    INACTIVE = 2
+
+
+@app.command()
+def stdlib(count: int = 100_000, repeat: int = 3):
+    """Freeze records consisting of values of standard library types and report the
+    types that are resolved by superclass (if enabled).
+    """
+    records = [
+        {
+            "id": uuid.uuid4(),
+            "created": datetime.datetime.now(tz=datetime.timezone.utc),
+            "price": Decimal(index) / 100,
+            "ratio": Fraction(index, 7),
+            "path": pathlib.Path(f"data/{index}.json"),
+            "state": _State.ACTIVE,
+            "counts": collections.Counter({"a": index}),
+            "attributes": collections.OrderedDict(x=1),
+        }
+        for index in range(count)
+    ]
+    for by_superclass in (False, True):
+        seconds = min(
+            timeit.repeat(
+                partial(freeze, records, by_superclass=by_superclass),
+                number=1,
+                repeat=repeat,
+            )
+        )
+        resolver = get_converter_resolver(
+            STANDARD_CONVERTERS, by_superclass=by_superclass
+        )
+        fallbacks = sorted(
+            input_type.__name__
+            for input_type, converter in resolver._cache.items()
+            if converter is not None
+            and converter.input_type is not input_type
+            and not converter.match_subclasses
+        )
+        typer.echo(
+            f"by_superclass={by_superclass!s:>5}: {seconds * 1000:.0f}ms, resolved by"
+            + f" superclass: {', '.join(fallbacks) or 'none'}"
+        )
+
+
+@app.command()
+def projection(count: int = 10_000, repeat: int = 3):
+    """Compare freezing whole documents and selecting a few values afterwards to
+    freezing the selected paths only.
+    """
+    documents = [
+        {
+            "id": index,
+            "meta": {
+                "owner": f"user{index}",
+                "tags": [f"tag{tag}" for tag in range(10)],
+            },
+            "payload": {f"field{field}": [field, {"x": field}] for field in range(20)},
+        }
+        for index in range(count)
+    ]
+    selected = ["*.id", "*.meta.owner"]
+    for name, function in (
+        ("freeze all", lambda: freeze(documents)),
+        ("include", lambda: freeze(documents, options=FreezeOptions(include=selected))),
+        (
+            "exclude",
+            lambda: freeze(
+                documents, options=FreezeOptions(exclude=["*.payload", "*.meta.tags"])
+            ),
+        ),
+    ):
+        seconds = min(timeit.repeat(function, number=1, repeat=repeat))
+        tracemalloc.start()
+        frozen = function()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        del frozen
+        typer.echo(f"{name:>10}: {seconds * 1000:.0f}ms, peak {peak / 1e6:.1f}MB")
+
+
+@app.command()
+def iterators(count: int = 100_000):
+    """Compare the peak memory usage of freezing a generator of records to freezing
+    the list of the generated records.
+    """
+
+    def generate() -> Iterator:
+        return ({"id": index, "tags": [index, index + 1]} for index in range(count))
+
+    for name, function in (
+        ("list", lambda: freeze(list(generate()))),
+        ("generator", lambda: freeze(generate())),
+    ):
+        tracemalloc.start()
+        frozen = function()
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del frozen
+        typer.echo(
+            f"{name:>9}: peak {peak / 1e6:.1f}MB ({peak / current:.2f}x the result)"
+        )
+
+
+@app.command()
+def transforms(count: int = 100_000, repeat: int = 3):
+    """Compare normalizing records before freezing them to transforming them while
+    freezing, and report the memory of string keys with and without interning.
+    """
+    records = [
+        {"ID": str(index), "Name": f"item{index}", "Note": None}
+        for index in range(count)
+    ]
+
+    def normalize(value: object) -> object:
+        if isinstance(value, dict):
+            return {
+                key.lower(): normalize(child)
+                for key, child in value.items()
+                if child is not None
+            }
+        if isinstance(value, list):
+            return [normalize(child) for child in value]
+        return int(value) if isinstance(value, str) and value.isdigit() else value
+
+    options = FreezeOptions(
+        key_transform=str.lower,
+        value_transform=lambda value: (
+            int(value) if isinstance(value, str) and value.isdigit() else value
+        ),
+        drop_if=lambda value: value is None,
+    )
+    for name, function in (
+        ("normalize", lambda: freeze(normalize(records))),
+        ("transform", lambda: freeze(records, options=options)),
+    ):
+        seconds = min(timeit.repeat(function, number=1, repeat=repeat))
+        tracemalloc.start()
+        frozen = function()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        del frozen
+        typer.echo(f"{name:>10}: {seconds * 1000:.0f}ms, peak {peak / 1e6:.1f}MB")
+
+    # keys created separately (e.g. by parsing one document at a time) are only
+    # shared by the frozen results if interned:
+    for intern_keys in (False, True):
+        frozen = [
+            cast(
+                FrozenDict,
+                freeze(
+                    {"".join(("field", str(field))): field for field in range(10)},
+                    options=FreezeOptions(intern_keys=intern_keys),
+                ),
+            )
+            for _ in range(count // 10)
+        ]
+        keys = {id(key): key for mapping in frozen for key in mapping}
+        typer.echo(
+            f"intern_keys={intern_keys!s:>5}: {len(keys)} distinct key objects,"
+            + f" {sum(map(sys.getsizeof, keys.values())) / 1e6:.1f}MB"
+        )
+
+
+if __name__ == "__main__":
+    app()
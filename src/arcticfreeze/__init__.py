@@ -14,18 +14,61 @@
 
 """A package to produce deeply (recursively) frozen Python data structures."""
 
-from importlib.metadata import version
-
-from ._internal._converters import STANDARD_CONVERTERS, Converter
-from ._internal.freeze import ConverterNotFoundError, freeze
+from ._internal._converters import (
+    STANDARD_CONVERTERS,
+    Converter,
+    FreezeContext,
+    get_freeze_context,
+)
+from ._internal.cache import FreezeCache, ValidationCache
+from ._internal.canonical import content_digest, encode_canonical, iter_canonical
+from ._internal.compile import compile_freezer
+from ._internal.diff import Change, frozen_diff
+from ._internal.freeze import ConverterNotFoundError, freeze, freeze_measured
 from ._internal.frozendict import FrozenDict
+from ._internal.frozenlist import FrozenList
+from ._internal.frozentable import FrozenTable
+from ._internal.index import FrozenIndex, index_paths
+from ._internal.limits import FreezeLimitExceededError
+from ._internal.options import FreezeOptions
+from ._internal.refreeze import refreeze
+from ._internal.sizeof import MemoryUsage, deep_sizeof, measure_memory
 
 __all__ = [
+    "Change",
     "ConverterNotFoundError",
     "freeze",
+    "freeze_measured",
     "STANDARD_CONVERTERS",
     "Converter",
+    "FreezeContext",
+    "get_freeze_context",
+    "compile_freezer",
+    "content_digest",
+    "encode_canonical",
+    "iter_canonical",
+    "FreezeCache",
+    "FreezeLimitExceededError",
+    "FreezeOptions",
     "FrozenDict",
+    "FrozenIndex",
+    "FrozenList",
+    "FrozenTable",
+    "frozen_diff",
+    "index_paths",
+    "MemoryUsage",
+    "deep_sizeof",
+    "measure_memory",
+    "refreeze",
+    "ValidationCache",
 ]
 
-__version__ = version(__package__)
+
+def __getattr__(name: str):
+    # The version is looked up lazily as importing `importlib.metadata` is expensive:
+    if name == "__version__":
+        from importlib.metadata import version
+
+        globals()["__version__"] = package_version = version(__package__)
+        return package_version
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -14,10 +14,14 @@
 
 """Main entrypoint of the package."""
 
+import sys
+
+from arcticfreeze._internal.cli import main
+
 
 def run():
     """Run the package."""
-    ...
+    sys.exit(main())
 
 
 if __name__ == "__main__":
@@ -21,6 +21,8 @@ from .base import (
     STANDARD_NON_PRIMITIVE_IMMUTABLE_PRIORITY,
     STANDARD_PRIMITIVE_PRIORITY,
     Converter,
+    FreezeContext,
+    get_freeze_context,
 )
 from .standard import STANDARD_CONVERTERS
 
@@ -30,4 +32,6 @@ __all__ = [
     "STANDARD_NON_PRIMITIVE_IMMUTABLE_PRIORITY",
     "STANDARD_PRIMITIVE_PRIORITY",
     "Converter",
+    "FreezeContext",
+    "get_freeze_context",
 ]
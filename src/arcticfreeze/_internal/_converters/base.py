@@ -14,8 +14,14 @@
 
 """Classes, constants, and utils for defining converters."""
 
+import collections
+import sys
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
-from typing import Callable, Final, Generic, TypeVar
+from typing import TYPE_CHECKING, Callable, Final, Generic, Optional, TypeVar
+
+if TYPE_CHECKING:
+    from arcticfreeze._internal.options import FreezeOptions
 
 DEFAULT_PRIORITY: Final = 0
 STANDARD_PRIMITIVE_PRIORITY: Final = 200
@@ -44,6 +50,8 @@ class Converter(Generic[InputObject]):
             Importantly, the callable passed in (2) does not make any assumption on the
             type of children objects passed to it (in that way it differs from the
             type-specific convert function).
+            The context of the freeze engine, e.g. whether items are dropped, can
+            be retrieved from the callable passed in (2), see `get_freeze_context`.
             By default a no-op function is used as convert callable is that returns the
             object unchanged.
         priority:
@@ -55,6 +63,21 @@ class Converter(Generic[InputObject]):
             converters for types that are already considered immutable have a priority
             of 100; the standard converters for mutable types (such as list, dict, set,
             etc.) have a priority of -100.
+        convert_batch:
+            An optional callable to convert multiple objects at once. It takes the
+            same arguments as the convert callable except that a sequence of objects
+            is passed as first argument and it must return a sequence of frozen objects
+            of the same length and order. If defined, it is used by the standard
+            converters for sequences, sets, and mappings for each run of consecutive
+            children that are handled by this converter instead of calling the convert
+            callable once per child. This allows to provide vectorized conversions for
+            collections of many objects of the same type.
+        match_subclasses:
+            If `True`, this converter also matches subclasses of the input type
+            without considering superclasses in general (see the `by_superclass`
+            argument of the `freeze` function). Converters matching the exact type
+            take precedence. This is used by the standard converter for enum members,
+            as every enum is a separate subclass of `enum.Enum`.
     """
 
     input_type: type[InputObject]
@@ -62,3 +85,167 @@ class Converter(Generic[InputObject]):
         lambda obj, _: obj
     )
     priority: int = DEFAULT_PRIORITY
+    convert_batch: Optional[
+        Callable[[Sequence[InputObject], Callable[[object], object]], Sequence[object]]
+    ] = None
+    match_subclasses: bool = False
+
+
+@dataclass(frozen=True)
+class FreezeContext:
+    """A class describing what the freeze engine supports beyond freezing a single
+    child. It is attached to the `freeze_child` callable passed to the convert
+    callables and can be retrieved using `get_freeze_context`.
+
+    Attributes:
+        key_tables:
+            The key tables shared by the FrozenDicts created by the freeze engine
+            (see `FrozenDict._from_keys_and_values`), or `None` if keys are not shared.
+        consume:
+            Whether the children of the object to convert may be replaced in place
+            (see the `consume` attribute of `FreezeOptions` and `consume_children`).
+        freeze_many:
+            An optional callable to freeze multiple children at once using the batch
+            conversions of the converters (see `freeze_children`).
+        freeze_key:
+            An optional callable to freeze a mapping key, which is used instead of
+            `freeze_child` if set (see `freeze_keys`).
+        drop_if:
+            The optional predicate for mapping values to drop (see the `drop_if`
+            attribute of `FreezeOptions`).
+        value_transform:
+            The optional transform applied to every child by `freeze_child` (see the
+            `value_transform` attribute of `FreezeOptions`).
+        limited:
+            Whether the freeze engine enforces limits, in which case every node must
+            be frozen using `freeze_child` instead of bypassing it.
+    """
+
+    key_tables: Optional[dict] = None
+    consume: bool = False
+    freeze_many: Optional[Callable[[Iterable], list]] = None
+    freeze_key: Optional[Callable[[object], object]] = None
+    drop_if: Optional[Callable[[object], bool]] = None
+    value_transform: Optional[Callable[[object], object]] = None
+    limited: bool = False
+
+
+# The context of `freeze_child` callables without one attached:
+DEFAULT_FREEZE_CONTEXT: Final = FreezeContext()
+
+
+def get_freeze_context(freeze_child: Callable[[object], object]) -> FreezeContext:
+    """Get the context attached to the `freeze_child` callable passed to a convert
+    callable, or the default context if none is attached (e.g. if the convert
+    callable is called directly).
+    """
+    return getattr(freeze_child, "freeze_context", DEFAULT_FREEZE_CONTEXT)
+
+
+def set_freeze_context(
+    freeze_child: Callable[[object], object], context: FreezeContext
+) -> None:
+    """Attach the context to a `freeze_child` callable created by a freeze engine."""
+    freeze_child.freeze_context = context  # type: ignore[attr-defined]
+
+
+def freeze_children(
+    children: Iterable, freeze_child: Callable[[object], object]
+) -> list:
+    """Freeze multiple children of an object using the `freeze_child` callable passed
+    to a convert callable. If supported by the freeze engine, batch conversions
+    defined by converters are used for runs of consecutive children.
+    """
+    freeze_many = get_freeze_context(freeze_child).freeze_many
+    if freeze_many is None:
+        return [freeze_child(child) for child in children]
+    return freeze_many(children)
+
+
+def freeze_keys(keys: Iterable, freeze_child: Callable[[object], object]) -> list:
+    """Freeze the keys of a mapping using the `freeze_child` callable passed to a
+    convert callable. If supported by the freeze engine, the keys are transformed
+    (see the `key_transform` attribute of `FreezeOptions`) instead of being frozen
+    like any other child.
+    """
+    freeze_key = get_freeze_context(freeze_child).freeze_key
+    if freeze_key is None:
+        return freeze_children(keys, freeze_child)
+    return [freeze_key(key) for key in keys]
+
+
+def _intern_key(key: object) -> object:
+    """Intern the key if it is a string."""
+    return sys.intern(key) if type(key) is str else key
+
+
+def add_transforms(
+    freeze_node: Callable[[object], object], options: "FreezeOptions"
+) -> tuple[Callable[[object], object], FreezeContext]:
+    """Wrap the callable of a freeze engine freezing a single object so that the value
+    transform of the options is applied to every object except mapping keys, to which
+    the key transform (and interning) is applied instead (see `freeze_keys`). Returns
+    the callable (the callable itself if no transform is set), which must be passed
+    to the convert callables by `freeze_node` in any case, and the context exposing
+    the transforms and the `drop_if` predicate. The freeze engine completes the
+    context and attaches it to the callable using `set_freeze_context`.
+    """
+    key_transform = options.key_transform
+    value_transform = options.value_transform
+    if options.intern_keys:
+        transform_key = key_transform
+        key_transform = (
+            _intern_key
+            if transform_key is None
+            else lambda key: _intern_key(transform_key(key))
+        )
+
+    if value_transform is None:
+        freeze_child = freeze_node
+    else:
+
+        def freeze_child(child):
+            return freeze_node(value_transform(child))
+
+    freeze_key: Optional[Callable[[object], object]] = None
+    if key_transform is not None:
+
+        def freeze_transformed_key(key):
+            return freeze_node(key_transform(key))
+
+        freeze_key = freeze_transformed_key
+    elif value_transform is not None:
+        freeze_key = freeze_node
+    context = FreezeContext(
+        freeze_key=freeze_key,
+        drop_if=options.drop_if,
+        value_transform=value_transform,
+    )
+    return freeze_child, context
+
+
+def consume_children(obj: object, freeze_child: Callable[[object], object]) -> bool:
+    """Replace the children of a list, deque, or dict (values only) by their frozen
+    counterparts in place if the freeze engine consumes its input (see the `consume`
+    attribute of `FreezeOptions`). Thereby, each mutable child is released as
+    soon as it is frozen, unless it is referenced elsewhere. Returns whether the
+    children were replaced, otherwise the object is left unchanged.
+    """
+    if not get_freeze_context(freeze_child).consume:
+        return False
+    obj_type = type(obj)
+    if obj_type is dict:
+        # assigning existing keys does not change the size, which is allowed during
+        # iteration:
+        for key, value in obj.items():  # type: ignore
+            obj[key] = freeze_child(value)  # type: ignore
+    elif obj_type is list:
+        for index, child in enumerate(obj):  # type: ignore
+            obj[index] = freeze_child(child)  # type: ignore
+    elif obj_type is collections.deque:
+        # rotate through the deque as indexing is not O(1):
+        for _ in range(len(obj)):  # type: ignore
+            obj.append(freeze_child(obj.popleft()))  # type: ignore
+    else:
+        return False
+    return True
@@ -0,0 +1,160 @@
+# Copyright 2024 Kersten Henrik Breuer
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Optional converters for pandas DataFrames and Series. Importing this module
+requires pandas to be installed.
+"""
+
+from collections.abc import Sequence
+from typing import Callable, Final, Literal
+
+import numpy as np
+import pandas as pd
+
+from arcticfreeze._internal._converters.base import (
+    STANDARD_MUTABLE_PRIORITY,
+    Converter,
+)
+from arcticfreeze._internal.frozendict import FrozenDict
+
+ColumnFormat = Literal["tuple", "array"]
+
+# numpy dtype kinds whose values convert to Python primitives via `tolist`:
+_PRIMITIVE_KINDS: Final = frozenset("biuf")
+
+# numpy dtype kinds of datetimes and timedeltas:
+_DATETIME_KINDS: Final = frozenset("mM")
+
+# numpy dtype kinds that may be kept as read-only arrays:
+_ARRAY_KINDS: Final = frozenset("biufcmM")
+
+
+class FrozenColumns(FrozenDict):
+    """A frozen, column-oriented representation of a pandas DataFrame mapping column
+    names to the (frozen) column values. The row index of the DataFrame is not
+    preserved, use `DataFrame.reset_index` before freezing to keep it as a column.
+    """
+
+    __slots__ = ()
+
+    @property
+    def records(self) -> tuple[FrozenDict, ...]:
+        """A row-oriented view with one FrozenDict per row. It is materialized on
+        first access and cached afterwards.
+        """
+        return self._get_derived("records", self._build_records)
+
+    def _build_records(self) -> tuple[FrozenDict, ...]:
+        names = tuple(self)
+        columns = (
+            column.tolist() if isinstance(column, np.ndarray) else column
+            for column in self.values()
+        )
+        return tuple(FrozenDict(dict(zip(names, row))) for row in zip(*columns))
+
+
+def _get_column_values(column: pd.Series) -> list:
+    """Get the values of a Series as objects of the standard library where possible.
+    Datetimes and timedeltas (truncated to microseconds) are converted to their
+    `datetime` counterparts and missing values of these and of extension dtypes (e.g.
+    `NaT` or `pd.NA`) to `None`.
+    """
+    dtype = column.dtype
+    if isinstance(dtype, np.dtype):
+        if dtype.kind in _DATETIME_KINDS:
+            # numpy converts microseconds to datetime objects and NaT to None:
+            unit = "datetime64[us]" if dtype.kind == "M" else "timedelta64[us]"
+            return column.to_numpy().astype(unit).astype(object).tolist()
+        return column.tolist()
+    if isinstance(dtype, pd.DatetimeTZDtype):
+        return [
+            None if value is pd.NaT else value.to_pydatetime(warn=False)
+            for value in column.tolist()
+        ]
+    # extension dtypes such as "Int64" or "string" mark missing values as `pd.NA`:
+    return column.to_numpy(dtype=object, na_value=None).tolist()
+
+
+def _freeze_column_as_tuple(column: pd.Series, freeze_child: Callable) -> tuple:
+    """Convert the values of a Series to a tuple of frozen values."""
+    values = _get_column_values(column)
+    if isinstance(column.dtype, np.dtype) and column.dtype.kind in _PRIMITIVE_KINDS:
+        # `tolist` already produced Python primitives:
+        return tuple(values)
+    return tuple(map(freeze_child, values))
+
+
+def _freeze_column_as_array(column: pd.Series, freeze_child: Callable) -> object:
+    """Convert the values of a Series to a read-only numpy array. Columns without a
+    numpy-native dtype (e.g. of object dtype) are converted to tuples instead.
+    """
+    if not (isinstance(column.dtype, np.dtype) and column.dtype.kind in _ARRAY_KINDS):
+        return _freeze_column_as_tuple(column, freeze_child)
+    array = column.to_numpy(copy=True)
+    array.flags.writeable = False
+    return array
+
+
+def get_pandas_converters(
+    *, column_format: ColumnFormat = "tuple"
+) -> Sequence[Converter]:
+    """Get converters for pandas DataFrames and Series to be used via the
+    `add_converters` argument of the `freeze` function.
+
+    DataFrames are converted to `FrozenColumns` (a FrozenDict of column names to
+    column values) and Series to their values only, both using vectorized operations
+    where possible. The index of the DataFrame or Series is not preserved.
+
+    Args:
+        column_format:
+            If "tuple" (the default), column values are converted to tuples of frozen
+            values. These are hashable and can be compared with each other.
+            Datetimes and timedeltas (including time zone aware ones) are converted
+            to `datetime.datetime` and `datetime.timedelta` objects (truncated to
+            microseconds) and missing values of these and of extension dtypes (such
+            as "Int64", "boolean", or "string") to `None`.
+            If "array", columns with a numpy-native dtype are converted to read-only
+            numpy arrays sharing no memory with the source. This avoids creating one
+            Python object per value but the results are neither hashable nor
+            comparable using `==`. Other columns are still converted to tuples.
+    """
+    freeze_column = (
+        _freeze_column_as_array if column_format == "array" else _freeze_column_as_tuple
+    )
+
+    def convert_data_frame(obj: pd.DataFrame, freeze_child: Callable) -> FrozenColumns:
+        if not obj.columns.is_unique:
+            raise ValueError("Cannot freeze a DataFrame with duplicate column names.")
+        return FrozenColumns(
+            {
+                freeze_child(name): freeze_column(column, freeze_child)
+                for name, column in obj.items()
+            }
+        )
+
+    return (
+        Converter(
+            input_type=pd.DataFrame,
+            convert=convert_data_frame,
+            priority=STANDARD_MUTABLE_PRIORITY,
+        ),
+        Converter(
+            input_type=pd.Series,
+            convert=freeze_column,
+            priority=STANDARD_MUTABLE_PRIORITY,
+        ),
+    )
+
+
+PANDAS_CONVERTERS: Final = get_pandas_converters()
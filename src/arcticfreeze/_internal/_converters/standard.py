@@ -14,20 +14,119 @@
 
 """Standard converters that come with this library."""
 
+import abc
 import collections
-from collections.abc import Iterable, Mapping, Sequence
-from typing import Callable, Final
+import datetime
+import enum
+import itertools
+import sys
+import types
+from array import array
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from typing import Callable, Final, Optional
 
 from arcticfreeze._internal._converters.base import (
     STANDARD_MUTABLE_PRIORITY,
     STANDARD_NON_PRIMITIVE_IMMUTABLE_PRIORITY,
     STANDARD_PRIMITIVE_PRIORITY,
     Converter,
+    consume_children,
+    freeze_children,
+    freeze_keys,
+    get_freeze_context,
 )
 from arcticfreeze._internal.frozendict import FrozenDict
+from arcticfreeze._internal.frozenlist import FrozenList
+from arcticfreeze._internal.frozentable import FrozenTable
 
 STANDARD_PRIMITIVE_TYPES: Final = (str, int, float, bool, type(None))
 
+# Immutable types (other than the primitive ones) that are frozen as is:
+STANDARD_IMMUTABLE_LEAF_TYPES: Final = (
+    bytes,
+    complex,
+    range,
+    datetime.date,
+    datetime.datetime,
+    datetime.time,
+    datetime.timedelta,
+    datetime.timezone,
+)
+
+# Immutable types that are frozen as is by the names of their modules, which are not
+# imported by this package to keep importing it cheap, see `_LazyImmutableLeaf`:
+STANDARD_LAZY_IMMUTABLE_LEAF_TYPES: Final = {
+    "decimal": ("Decimal",),
+    "fractions": ("Fraction",),
+    "uuid": ("UUID",),
+    "pathlib": ("PurePosixPath", "PureWindowsPath", "PosixPath", "WindowsPath"),
+}
+
+
+class _LazyImmutableLeaf(abc.ABC):  # noqa: B024 - a virtual superclass only
+    """A virtual superclass of the types listed in `STANDARD_LAZY_IMMUTABLE_LEAF_TYPES`
+    (but not of their subclasses). Objects of these types can only exist once their
+    module was imported elsewhere, thus the types are looked up in the already
+    imported modules only.
+    """
+
+    @classmethod
+    def __subclasshook__(cls, subclass: type) -> bool:
+        for module_name, type_names in STANDARD_LAZY_IMMUTABLE_LEAF_TYPES.items():
+            module = sys.modules.get(module_name)
+            if module is not None and any(
+                subclass is getattr(module, type_name, None) for type_name in type_names
+            ):
+                return True
+        return False
+
+
+# Mutable mapping types (other than dict) that are converted to FrozenDicts:
+STANDARD_MAPPING_TYPES: Final = (
+    collections.OrderedDict,
+    collections.defaultdict,
+    collections.Counter,
+    collections.ChainMap,
+    collections.UserDict,
+)
+
+# Types of iterators whose items are frozen while consuming them. Iterators that are
+# infinite by design (like `itertools.count`) are not supported. However, iterators
+# wrapping other iterators (like `map` or `zip`) are only finite if their inputs are,
+# which cannot be detected, thus they are consumed regardless (use the `max_nodes`
+# limit to bound untrusted input):
+STANDARD_ITERATOR_TYPES: Final[tuple[type, ...]] = (
+    types.GeneratorType,
+    type(iter([])),
+    type(reversed([])),
+    type(iter(())),
+    type(iter("")),
+    type(iter(range(0))),
+    type(iter(set())),
+    type(iter({})),
+    type(iter({}.values())),
+    type(iter({}.items())),
+    type(iter(collections.deque())),
+    enumerate,
+    filter,
+    map,
+    reversed,
+    zip,
+    itertools.accumulate,
+    itertools.chain,
+    itertools.combinations,
+    itertools.combinations_with_replacement,
+    itertools.compress,
+    itertools.dropwhile,
+    itertools.filterfalse,
+    itertools.islice,
+    itertools.permutations,
+    itertools.product,
+    itertools.starmap,
+    itertools.takewhile,
+    itertools.zip_longest,
+)
+
 
 STANDARD_PRIMITIVE_CONVERTERS: Final[Sequence[Converter]] = tuple(
     Converter(input_type=type_, priority=STANDARD_PRIMITIVE_PRIORITY)
@@ -37,23 +136,158 @@ STANDARD_PRIMITIVE_CONVERTERS: Final[Sequence[Converter]] = tuple(
 
 def convert_sequence(obj: Sequence, freeze_child: Callable) -> tuple:
     """A convert a sequence object."""
-    return tuple(freeze_child(child) for child in obj)
+    if consume_children(obj, freeze_child):
+        return tuple(obj)
+    return tuple(freeze_children(obj, freeze_child))
+
+
+def convert_to_frozen_list(obj: Iterable, freeze_child: Callable) -> FrozenList:
+    """A convert a sequence object to a FrozenList."""
+    if consume_children(obj, freeze_child):
+        return FrozenList._from_storage(tuple(obj), None)
+    return FrozenList._from_storage(tuple(freeze_children(obj, freeze_child)), None)
+
+
+def convert_iterator(obj: Iterator, freeze_child: Callable) -> tuple:
+    """A convert an iterator streaming its frozen items into a tuple, so that each
+    item is frozen (and may be released) before the next one is produced.
+    """
+    if get_freeze_context(freeze_child).freeze_many is None:
+        return tuple(map(freeze_child, obj))
+    return tuple(freeze_children(obj, freeze_child))
+
+
+def convert_iterator_to_frozen_list(
+    obj: Iterator, freeze_child: Callable
+) -> FrozenList:
+    """A convert an iterator streaming its frozen items into a FrozenList."""
+    return FrozenList._from_storage(convert_iterator(obj, freeze_child), None)
+
+
+def _get_record_keys(obj: Sequence) -> Optional[tuple]:
+    """Get the keys shared by all records if the sequence consists of dicts with the
+    same string keys in the same order only, otherwise `None`.
+    """
+    if not obj or type(obj[0]) is not dict:
+        return None
+    keys = tuple(obj[0])
+    if not all(type(key) is str for key in keys):
+        return None
+    for record in obj:
+        if (
+            type(record) is not dict
+            or len(record) != len(keys)
+            or (tuple(record) != keys)
+        ):
+            return None
+    return keys
+
 
+def assemble_frozen_table(records: tuple) -> object:
+    """Assemble a FrozenTable from records that were frozen already. Records that are
+    not FrozenDicts with the same string keys in the same order are returned as is.
+    """
+    if not records or type(records[0]) is not FrozenDict:
+        return records
+    names = tuple(records[0])
+    if not all(type(name) is str for name in names):
+        return records
+    for record in records:
+        if type(record) is not FrozenDict or tuple(record) != names:
+            return records
+    columns = ([record[name] for record in records] for name in names)
+    return FrozenTable._from_columns(names, columns, len(records))
 
-def convert_set_like(obj: Iterable, freeze_child: Callable) -> set:
+
+def convert_to_frozen_table(obj: Sequence, freeze_child: Callable) -> object:
+    """A convert a sequence of records to a FrozenTable. Sequences that are not a
+    non-empty sequence of dicts with the same keys are converted to tuples.
+    """
+    context = get_freeze_context(freeze_child)
+    # records from which items may be dropped are not guaranteed to keep their keys:
+    if context.drop_if is not None:
+        return convert_sequence(obj, freeze_child)
+    if context.value_transform is not None or context.limited:
+        # the records are transformed and accounted for (as nodes and depth levels)
+        # like any other child, thus they are frozen as such before assembling the
+        # table:
+        return assemble_frozen_table(convert_sequence(obj, freeze_child))
+    keys = _get_record_keys(obj)
+    if keys is None:
+        return convert_sequence(obj, freeze_child)
+    names = tuple(freeze_keys(keys, freeze_child))
+    if len(set(names)) != len(names):
+        # transforming the keys made them ambiguous:
+        return convert_sequence(obj, freeze_child)
+    columns = (
+        freeze_children([record[key] for record in obj], freeze_child) for key in keys
+    )
+    return FrozenTable._from_columns(names, columns, len(obj))
+
+
+def convert_iterator_to_frozen_table(obj: Iterator, freeze_child: Callable) -> object:
+    """A convert the items of an iterator to a FrozenTable, see
+    `convert_to_frozen_table`. The items need to be collected first to check whether
+    they are records with the same keys.
+    """
+    return convert_to_frozen_table(list(obj), freeze_child)
+
+
+def convert_frozen_table(obj: FrozenTable, freeze_child: Callable) -> FrozenTable:
+    """A convert a FrozenTable column by column."""
+    columns = (freeze_children(column, freeze_child) for column in obj._columns)
+    return FrozenTable._from_columns(
+        tuple(freeze_children(obj.column_names, freeze_child)), columns, len(obj)
+    )
+
+
+def convert_set_like(obj: Iterable, freeze_child: Callable) -> frozenset:
     """A convert a set-like object."""
-    return set(freeze_child(child) for child in obj)
+    return frozenset(freeze_children(obj, freeze_child))
 
 
 def convert_mapping(obj: Mapping, freeze_child: Callable) -> FrozenDict:
     """A convert a mapping object."""
-    return FrozenDict(
-        {freeze_child(key): freeze_child(value) for key, value in obj.items()}
-    )
+    context = get_freeze_context(freeze_child)
+    # if supported by the freeze engine, drop items before freezing them:
+    drop_if = context.drop_if
+    if drop_if is not None:
+        if context.consume and type(obj) is dict:
+            # drop the items from the consumed dict itself, so that its remaining
+            # values are still replaced by their frozen counterparts below:
+            for key in [key for key, value in obj.items() if drop_if(value)]:
+                del obj[key]
+        else:
+            obj = {key: value for key, value in obj.items() if not drop_if(value)}
+    keys = freeze_keys(obj.keys(), freeze_child)
+    if consume_children(obj, freeze_child):
+        values = list(obj.values())
+    else:
+        values = freeze_children(obj.values(), freeze_child)
+    # if supported by the freeze engine, share the keys of same-shaped mappings:
+    key_tables = context.key_tables
+    if key_tables is None:
+        return FrozenDict._from_dict(dict(zip(keys, values)))
+    return FrozenDict._from_keys_and_values(keys, values, key_tables=key_tables)
 
 
 STANDARD_NON_PRIMITIVE_IMMUTABLE_CONVERTERS: Final[Sequence[Converter]] = (
-    Converter(input_type=bytes, priority=STANDARD_NON_PRIMITIVE_IMMUTABLE_PRIORITY),
+    *(
+        Converter(input_type=type_, priority=STANDARD_NON_PRIMITIVE_IMMUTABLE_PRIORITY)
+        for type_ in STANDARD_IMMUTABLE_LEAF_TYPES
+    ),
+    # ABCMeta caches the result of the subclass hook per type:
+    Converter(
+        input_type=_LazyImmutableLeaf,
+        priority=STANDARD_NON_PRIMITIVE_IMMUTABLE_PRIORITY,
+        match_subclasses=True,
+    ),
+    # enum members are singletons and every enum is a subclass of `enum.Enum`:
+    Converter(
+        input_type=enum.Enum,
+        priority=STANDARD_NON_PRIMITIVE_IMMUTABLE_PRIORITY,
+        match_subclasses=True,
+    ),
     Converter(
         input_type=tuple,
         convert=convert_sequence,
@@ -69,6 +303,16 @@ STANDARD_NON_PRIMITIVE_IMMUTABLE_CONVERTERS: Final[Sequence[Converter]] = (
         convert=convert_mapping,
         priority=STANDARD_NON_PRIMITIVE_IMMUTABLE_PRIORITY,
     ),
+    Converter(
+        input_type=FrozenList,
+        convert=convert_to_frozen_list,
+        priority=STANDARD_NON_PRIMITIVE_IMMUTABLE_PRIORITY,
+    ),
+    Converter(
+        input_type=FrozenTable,
+        convert=convert_frozen_table,
+        priority=STANDARD_NON_PRIMITIVE_IMMUTABLE_PRIORITY,
+    ),
 )
 
 STANDARD_MUTABLE_CONVERTERS: Final[Sequence[Converter]] = (
@@ -88,6 +332,91 @@ STANDARD_MUTABLE_CONVERTERS: Final[Sequence[Converter]] = (
         convert=convert_sequence,
         priority=STANDARD_MUTABLE_PRIORITY,
     ),
+    Converter(
+        input_type=collections.UserList,
+        convert=convert_sequence,
+        priority=STANDARD_MUTABLE_PRIORITY,
+    ),
+    Converter(
+        input_type=array, convert=convert_sequence, priority=STANDARD_MUTABLE_PRIORITY
+    ),
+    *(
+        Converter(
+            input_type=type_,
+            convert=convert_mapping,
+            priority=STANDARD_MUTABLE_PRIORITY,
+        )
+        for type_ in STANDARD_MAPPING_TYPES
+    ),
+    *(
+        Converter(
+            input_type=type_,
+            convert=convert_iterator,
+            priority=STANDARD_MUTABLE_PRIORITY,
+        )
+        for type_ in STANDARD_ITERATOR_TYPES
+    ),
+)
+
+# Converters to be used in addition to the standard converters to produce FrozenLists
+# instead of tuples from mutable sequences:
+FROZEN_LIST_CONVERTERS: Final[Sequence[Converter]] = (
+    Converter(
+        input_type=list,
+        convert=convert_to_frozen_list,
+        priority=STANDARD_MUTABLE_PRIORITY,
+    ),
+    Converter(
+        input_type=collections.deque,
+        convert=convert_to_frozen_list,
+        priority=STANDARD_MUTABLE_PRIORITY,
+    ),
+    Converter(
+        input_type=collections.UserList,
+        convert=convert_to_frozen_list,
+        priority=STANDARD_MUTABLE_PRIORITY,
+    ),
+    Converter(
+        input_type=array,
+        convert=convert_to_frozen_list,
+        priority=STANDARD_MUTABLE_PRIORITY,
+    ),
+    *(
+        Converter(
+            input_type=type_,
+            convert=convert_iterator_to_frozen_list,
+            priority=STANDARD_MUTABLE_PRIORITY,
+        )
+        for type_ in STANDARD_ITERATOR_TYPES
+    ),
+)
+
+# Converters to be used in addition to the standard converters to produce FrozenTables
+# instead of tuples from mutable sequences of records:
+FROZEN_TABLE_CONVERTERS: Final[Sequence[Converter]] = (
+    Converter(
+        input_type=list,
+        convert=convert_to_frozen_table,
+        priority=STANDARD_MUTABLE_PRIORITY,
+    ),
+    Converter(
+        input_type=collections.deque,
+        convert=convert_to_frozen_table,
+        priority=STANDARD_MUTABLE_PRIORITY,
+    ),
+    Converter(
+        input_type=collections.UserList,
+        convert=convert_to_frozen_table,
+        priority=STANDARD_MUTABLE_PRIORITY,
+    ),
+    *(
+        Converter(
+            input_type=type_,
+            convert=convert_iterator_to_frozen_table,
+            priority=STANDARD_MUTABLE_PRIORITY,
+        )
+        for type_ in STANDARD_ITERATOR_TYPES
+    ),
 )
 
 STANDARD_CONVERTERS: Final = (
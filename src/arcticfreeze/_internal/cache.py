@@ -0,0 +1,269 @@
+# Copyright 2024 Kersten Henrik Breuer
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Caches for the results of freezing long-lived mutable objects repeatedly and of
+validating frozen objects repeatedly.
+"""
+
+from __future__ import annotations
+
+import threading
+import weakref
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import TYPE_CHECKING, Any, Callable, Final, NamedTuple
+
+from arcticfreeze._internal.frozendict import FrozenDict
+from arcticfreeze._internal.frozenlist import FrozenList
+from arcticfreeze._internal.frozentable import FrozenTable
+from arcticfreeze._internal.pydantic_hooks import get_memoized_core_schema
+
+if TYPE_CHECKING:
+    from pydantic import GetCoreSchemaHandler
+    from pydantic_core import CoreSchema
+
+# The types of inputs whose validation results are cached by a ValidationCache:
+_FROZEN_INPUT_TYPES: Final = (FrozenDict, FrozenList, FrozenTable, tuple, frozenset)
+
+
+class _Entry(NamedTuple):
+    """A cached result together with the information needed to validate it."""
+
+    # A weak reference to the source object or the source object itself if it does
+    # not support weak references:
+    source: Any
+    is_weak: bool
+    fingerprint: Hashable
+    frozen: object
+
+
+class FreezeCache:
+    """A cache for the results of freezing source objects, to be passed to the `freeze`
+    function via the `cache` attribute of `FreezeOptions`. Repeatedly freezing the
+    same (unchanged) source object then only costs a lookup.
+
+    Entries are keyed by the identity of the source object and validated using a cheap
+    fingerprint computed from the source object on every lookup. If the fingerprint
+    changed since the result was cached, the object is frozen again. By default, the
+    fingerprint is the length of the source object. Thus, changes that do not affect
+    the length (like updating the value of an existing key) are NOT detected. Provide
+    a custom fingerprint (e.g. a version counter maintained by the source object)
+    where this matters.
+
+    Source objects supporting weak references are referenced weakly and their entries
+    are removed as soon as they are garbage collected. Other source objects (such as
+    builtin dicts and lists) are kept alive by the cache until their entry is evicted.
+    If the cache is full, the least recently used entry is evicted.
+
+    Args:
+        maxsize:
+            The maximum number of cached results.
+        fingerprint:
+            A callable computing a hashable fingerprint of a source object, which must
+            change whenever the content of the source object changes. If it raises a
+            TypeError for a source object, the result is not cached.
+
+    Examples:
+    ```python
+    from arcticfreeze import FreezeCache, FreezeOptions, freeze
+
+    registry = {"a": [1, 2]}
+    options = FreezeOptions(cache=FreezeCache(maxsize=16))
+
+    assert freeze(registry, options=options) is freeze(registry, options=options)
+    ```
+    """
+
+    def __init__(
+        self,
+        *,
+        maxsize: int = 128,
+        fingerprint: Callable[[Any], Hashable] = len,
+    ):
+        if maxsize < 1:
+            raise ValueError(f"Expected a positive maximum size, got {maxsize}.")
+        self.maxsize = maxsize
+        self.fingerprint = fingerprint
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple[int, Hashable], _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Remove all entries and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def _lookup(self, key: tuple[int, Hashable], obj: object, fingerprint: Hashable):
+        """Get the cached result for the provided key if it is still valid."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                source = entry.source() if entry.is_weak else entry.source
+                if source is obj and entry.fingerprint == fingerprint:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry
+            self.misses += 1
+            return None
+
+    def _store(
+        self,
+        key: tuple[int, Hashable],
+        obj: object,
+        fingerprint: Hashable,
+        frozen: object,
+    ) -> None:
+        """Cache a result evicting the least recently used entries if needed."""
+        try:
+            source: Any = weakref.ref(obj, self._create_remover(key))
+            is_weak = True
+        except TypeError:
+            source = obj
+            is_weak = False
+
+        with self._lock:
+            self._entries[key] = _Entry(source, is_weak, fingerprint, frozen)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def _create_remover(self, key: tuple[int, Hashable]) -> Callable:
+        """Create a weak reference callback removing the entry of a collected source
+        object. The cache itself is referenced weakly as well to not keep it alive.
+        """
+        cache_ref = weakref.ref(self)
+
+        def remove(source_ref: weakref.ref) -> None:
+            cache = cache_ref()
+            if cache is None:
+                return
+            with cache._lock:
+                entry = cache._entries.get(key)
+                # the key might have been reused by another object in the meantime:
+                if entry is not None and entry.source is source_ref:
+                    del cache._entries[key]
+
+        return remove
+
+    def get_or_freeze(
+        self,
+        obj: object,
+        freeze_obj: Callable[[object], object],
+        *,
+        context: Hashable = None,
+    ) -> object:
+        """Get the cached result of freezing the provided object or freeze it using the
+        provided callable and cache the result.
+
+        Args:
+            obj:
+                The source object.
+            freeze_obj:
+                A callable freezing the source object.
+            context:
+                Everything else the result depends on, e.g. the converters used.
+        """
+        try:
+            fingerprint = self.fingerprint(obj)
+        except TypeError:
+            return freeze_obj(obj)
+
+        key = (id(obj), context)
+        entry = self._lookup(key, obj, fingerprint)
+        if entry is not None:
+            return entry.frozen
+
+        frozen = freeze_obj(obj)
+        if self._is_cacheable(frozen):
+            self._store(key, obj, fingerprint, frozen)
+        return frozen
+
+    def _is_cacheable(self, frozen: object) -> bool:
+        """Whether the result may be shared by returning it for later lookups."""
+        return True
+
+
+class ValidationCache(FreezeCache):
+    """A cache for the results of validating frozen inputs against a field type of a
+    Pydantic model. Add an instance to the type hint of a field using
+    `typing.Annotated` to opt in. Validating the same frozen input (e.g. a FrozenDict)
+    repeatedly then only costs a lookup.
+
+    Entries are keyed by the identity of the input (see `FreezeCache`) and the
+    annotated field type, so a single instance may be used for multiple fields. Only
+    inputs of the frozen container types of this package as well as tuples and
+    frozensets are cached, and only if they are hashable (i.e. deeply immutable). All
+    other inputs and inputs failing validation are validated as usual. The cached
+    results assume that validation only depends on the input, not on the validation
+    context or strict mode passed per call.
+
+    As cached results are shared by all models validated from the same input, results
+    are only cached if they are hashable as well. Thus, results containing mutable
+    objects (e.g. lists or models that are not frozen) are never shared, such fields
+    are validated as usual.
+
+    Args:
+        maxsize:
+            The maximum number of cached results.
+
+    Examples:
+    ```python
+    from typing import Annotated
+
+    from pydantic import BaseModel
+
+    from arcticfreeze import FrozenDict, ValidationCache
+
+    class Model(BaseModel):
+        config: Annotated[FrozenDict[str, int], ValidationCache(maxsize=256)]
+
+    config = FrozenDict(a=1)
+
+    assert Model(config=config).config is Model(config=config).config
+    ```
+    """
+
+    def __init__(self, *, maxsize: int = 128):
+        # the hash of frozen container types is cached, hashing fails for mutable
+        # inputs, which are not cached thus:
+        super().__init__(maxsize=maxsize, fingerprint=hash)
+
+    def __get_pydantic_core_schema__(
+        self, source: Any, handler: GetCoreSchemaHandler
+    ) -> CoreSchema:
+        """Get the pydantic core schema wrapping the schema of the annotated type."""
+        # distinguishes the results of different annotated types:
+        context = object()
+
+        def validate(value: Any, validate_uncached: Callable[[Any], Any]) -> Any:
+            if not isinstance(value, _FROZEN_INPUT_TYPES):
+                return validate_uncached(value)
+            return self.get_or_freeze(value, validate_uncached, context=context)
+
+        return get_memoized_core_schema(handler(source), validate=validate)
+
+    def _is_cacheable(self, frozen: object) -> bool:
+        """Whether the result is hashable, i.e. deeply immutable."""
+        try:
+            hash(frozen)
+        except TypeError:
+            return False
+        return True
@@ -0,0 +1,420 @@
+# Copyright 2024 Kersten Henrik Breuer
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""A canonical, deterministic binary encoding of frozen data structures and content
+digests based on it.
+
+Every value is encoded as a one byte tag followed by its payload. Lengths and counts
+are encoded as 8 byte unsigned big-endian integers. The tags are:
+
+- `N`, `T`, `F`: None, True, and False (without payload).
+- `i`: An int as length and two's complement big-endian bytes.
+- `f`: A float as 8 byte IEEE 754 big-endian double. -0.0 and all NaNs are
+  normalized to 0.0 and a single NaN, respectively.
+- `s`: A str as length and UTF-8 bytes.
+- `b`: A bytes object as length and the bytes.
+- `c`: A complex as the real and imaginary part, each like a float (without tag).
+- `r`: A range as the length, the first item, and the step, each like an int (without
+  tag). The first item of empty ranges is 0 and the step of ranges with less than two
+  items is 1, as such ranges compare equal regardless.
+- `D`: A Decimal as length and the UTF-8 bytes of its normalized scientific notation
+  (without trailing zeros, e.g. "-15E-1"), or "0", "Infinity", "-Infinity", "NaN".
+- `Q`: A Fraction as the numerator and the denominator, each like an int.
+- `U`: A UUID as its 16 bytes.
+- `y`: A date as its proleptic Gregorian ordinal like an int.
+- `Y`: A naive datetime as length and the UTF-8 bytes of its ISO 8601 format.
+- `Z`: An aware datetime like a naive datetime, converted to UTC.
+- `h`: A naive time as the microseconds since midnight like an int.
+- `H`: An aware time like a naive time, minus its UTC offset.
+- `e`: A timedelta as its total microseconds like an int.
+- `z`: A timezone as its UTC offset in microseconds like an int.
+- `p`: A (pure) POSIX path as length and the UTF-8 bytes of its string.
+- `w`: A (pure) Windows path like a POSIX path, converted to lower case.
+- `E`: An enum member as the module and the qualified name of its enum and its name,
+  each like a str (without tag).
+- `l`: A sequence (tuple, FrozenList, or FrozenTable) as count and the encoded items.
+- `d`: A mapping as count and the encoded keys and values, sorted by encoded key.
+- `S`: A set as count and the encoded items, sorted by encoding.
+"""
+
+import datetime
+import enum
+import math
+import struct
+import sys
+import threading
+from collections.abc import Iterator, Mapping
+from typing import Any, Callable, Final, Optional
+
+from arcticfreeze._internal.frozendict import FrozenDict
+from arcticfreeze._internal.frozenlist import FrozenList
+from arcticfreeze._internal.frozentable import FrozenTable
+
+# The size of content digests in bytes:
+DIGEST_SIZE: Final = 32
+
+# Distinguishes the digests of this package from other uses of BLAKE2b:
+_DIGEST_PERSON: Final = b"arcticfreeze"
+
+# Marks the digest of a nested container within the input of a digest:
+_NESTED_DIGEST_TAG: Final = b"#"
+
+_pack_length = struct.Struct(">Q").pack
+_pack_float = struct.Struct(">d").pack
+_NAN: Final = _pack_float(math.nan)
+
+
+_MICROSECOND: Final = datetime.timedelta(microseconds=1)
+
+
+def _pack_int(obj: int) -> bytes:
+    payload = obj.to_bytes((obj.bit_length() + 8) // 8, "big", signed=True)
+    return _pack_length(len(payload)) + payload
+
+
+def _pack_normalized_float(obj: float) -> bytes:
+    if math.isnan(obj):
+        return _NAN
+    # adding 0.0 turns -0.0 into 0.0:
+    return _pack_float(obj + 0.0)
+
+
+def _pack_str(obj: str) -> bytes:
+    payload = obj.encode("utf-8")
+    return _pack_length(len(payload)) + payload
+
+
+def _encode_int(obj: int) -> bytes:
+    return b"i" + _pack_int(obj)
+
+
+def _encode_float(obj: float) -> bytes:
+    return b"f" + _pack_normalized_float(obj)
+
+
+def _encode_str(obj: str) -> bytes:
+    return b"s" + _pack_str(obj)
+
+
+def _encode_bytes(obj: bytes) -> bytes:
+    return b"b" + _pack_length(len(obj)) + obj
+
+
+def _encode_complex(obj: complex) -> bytes:
+    return b"c" + _pack_normalized_float(obj.real) + _pack_normalized_float(obj.imag)
+
+
+def _encode_range(obj: range) -> bytes:
+    # computed instead of using `len`, which fails for lengths beyond `sys.maxsize`:
+    step_sign = 1 if obj.step > 0 else -1
+    length = max(0, (obj.stop - obj.start + obj.step - step_sign) // obj.step)
+    start = obj.start if length else 0
+    step = obj.step if length > 1 else 1
+    return b"r" + _pack_int(length) + _pack_int(start) + _pack_int(step)
+
+
+def _encode_decimal(obj: Any) -> bytes:
+    if obj.is_nan():
+        text = "NaN"
+    elif obj.is_infinite():
+        text = "-Infinity" if obj.is_signed() else "Infinity"
+    elif not obj:
+        text = "0"
+    else:
+        sign, digits, exponent = obj.as_tuple()
+        coefficient = "".join(map(str, digits))
+        significant = coefficient.rstrip("0")
+        exponent += len(coefficient) - len(significant)
+        text = f"{'-' if sign else ''}{significant}E{exponent}"
+    return b"D" + _pack_str(text)
+
+
+def _encode_datetime(obj: datetime.datetime) -> bytes:
+    offset = obj.utcoffset()
+    if offset is None:
+        return b"Y" + _pack_str(obj.replace(tzinfo=None, fold=0).isoformat())
+    return b"Z" + _pack_str((obj.replace(tzinfo=None) - offset).isoformat())
+
+
+def _encode_time(obj: datetime.time) -> bytes:
+    seconds = (obj.hour * 60 + obj.minute) * 60 + obj.second
+    microseconds = seconds * 1_000_000 + obj.microsecond
+    offset = obj.utcoffset()
+    if offset is None:
+        return b"h" + _pack_int(microseconds)
+    return b"H" + _pack_int(microseconds - offset // _MICROSECOND)
+
+
+def _encode_enum(obj: enum.Enum) -> bytes:
+    enum_type = type(obj)
+    return (
+        b"E"
+        + _pack_str(enum_type.__module__)
+        + _pack_str(enum_type.__qualname__)
+        + _pack_str(obj.name)
+    )
+
+
+# The encoders of values that are not containers by type. Subclasses are matched in
+# this order, thus enums (which may subclass e.g. int) must precede all other types,
+# bool must precede int, and datetime must precede date. The dict is never modified
+# but replaced as a whole when lazy encoders are added, so that it can be iterated
+# while other threads add encoders:
+_LEAF_ENCODERS: dict[type, Callable[[Any], bytes]] = {
+    enum.Enum: _encode_enum,
+    type(None): lambda _: b"N",
+    bool: lambda obj: b"T" if obj else b"F",
+    int: _encode_int,
+    float: _encode_float,
+    str: _encode_str,
+    bytes: _encode_bytes,
+    complex: _encode_complex,
+    range: _encode_range,
+    datetime.datetime: _encode_datetime,
+    datetime.date: lambda obj: b"y" + _pack_int(obj.toordinal()),
+    datetime.time: _encode_time,
+    datetime.timedelta: lambda obj: b"e" + _pack_int(obj // _MICROSECOND),
+    datetime.timezone: lambda obj: b"z"
+    + _pack_int(obj.utcoffset(None) // _MICROSECOND),
+}
+
+# The encoders of types of modules that are not imported by this package (see
+# `STANDARD_LAZY_IMMUTABLE_LEAF_TYPES`) by module name, which are added to the leaf
+# encoders once the module was imported elsewhere:
+_LAZY_LEAF_ENCODERS: Final[dict[str, Callable[[Any], dict[type, Callable]]]] = {
+    "decimal": lambda module: {module.Decimal: _encode_decimal},
+    "fractions": lambda module: {
+        module.Fraction: lambda obj: (
+            b"Q" + _pack_int(obj.numerator) + _pack_int(obj.denominator)
+        )
+    },
+    "uuid": lambda module: {module.UUID: lambda obj: b"U" + obj.bytes},
+    "pathlib": lambda module: {
+        module.PurePosixPath: lambda obj: b"p" + _pack_str(str(obj)),
+        module.PureWindowsPath: lambda obj: b"w" + _pack_str(str(obj).lower()),
+    },
+}
+
+# Serializes adding lazy encoders, reading the encoders does not require it:
+_lazy_leaf_encoders_lock = threading.Lock()
+
+
+def _add_lazy_leaf_encoders() -> bool:
+    """Add the lazy leaf encoders of all imported modules to the leaf encoders. Returns
+    whether any encoder was added.
+    """
+    global _LEAF_ENCODERS
+
+    with _lazy_leaf_encoders_lock:
+        added: dict[type, Callable[[Any], bytes]] = {}
+        for module_name in tuple(_LAZY_LEAF_ENCODERS):
+            module = sys.modules.get(module_name)
+            if module is not None:
+                added.update(_LAZY_LEAF_ENCODERS.pop(module_name)(module))
+        if added:
+            _LEAF_ENCODERS = {**_LEAF_ENCODERS, **added}
+    return bool(added)
+
+
+# The tags of containers by type, subclasses are matched as well:
+_CONTAINER_TAGS: Final[dict[type, bytes]] = {
+    FrozenDict: b"d",
+    tuple: b"l",
+    FrozenList: b"l",
+    FrozenTable: b"l",
+    frozenset: b"S",
+    set: b"S",
+}
+
+
+def _encode_leaf(obj: object) -> bytes:
+    """Encode a value that is not a container.
+
+    Raises:
+        TypeError: If the value is of an unsupported type.
+    """
+    encode = _LEAF_ENCODERS.get(type(obj))
+    if encode is None and _LAZY_LEAF_ENCODERS and _add_lazy_leaf_encoders():
+        encode = _LEAF_ENCODERS.get(type(obj))
+    if encode is None:
+        for type_, encode_by_superclass in _LEAF_ENCODERS.items():
+            if isinstance(obj, type_):
+                encode = encode_by_superclass
+                break
+        else:
+            raise TypeError(f"Cannot canonically encode an object of type {type(obj)}.")
+    return encode(obj)
+
+
+def _get_container_tag(obj: object) -> Optional[bytes]:
+    """Get the tag of a container or `None` if the value is not a container."""
+    tag = _CONTAINER_TAGS.get(type(obj))
+    if tag is not None or type(obj) in _LEAF_ENCODERS:
+        return tag
+    if isinstance(obj, Mapping):
+        return b"d"
+    for type_, tag in _CONTAINER_TAGS.items():
+        if isinstance(obj, type_):
+            return tag
+    return None
+
+
+def iter_canonical(frozen: object) -> Iterator[bytes]:
+    """Lazily encode a frozen data structure in the canonical binary encoding. Yields
+    chunks of bytes, whose concatenation is the encoding. The data structure is walked
+    iteratively, i.e. without recursion, except for mapping keys and set items, which
+    need to be encoded completely for sorting them.
+
+    Mappings, tuples, FrozenLists, FrozenTables, sets, and the immutable standard
+    library types frozen as is by the standard converters (see the module
+    documentation for the complete list) are supported. Equal data structures have
+    equal encodings, except for values that compare equal but are of different types
+    (e.g. `1`, `1.0`, `True`, and `Decimal(1)`).
+
+    Raises:
+        TypeError: If the data structure contains a value of an unsupported type.
+    """
+    # entries are tuples of a flag whether the second item is an already encoded
+    # chunk and the chunk or object to encode, respectively:
+    stack: list[tuple[bool, Any]] = [(False, frozen)]
+    while stack:
+        is_chunk, item = stack.pop()
+        if is_chunk:
+            yield item
+            continue
+
+        tag = _get_container_tag(item)
+        if tag is None:
+            yield _encode_leaf(item)
+        elif tag == b"d":
+            entries = sorted(
+                (encode_canonical(key), value) for key, value in item.items()
+            )
+            yield b"d" + _pack_length(len(entries))
+            for encoded_key, value in reversed(entries):
+                stack.append((False, value))
+                stack.append((True, encoded_key))
+        elif tag == b"l":
+            yield b"l" + _pack_length(len(item))
+            stack.extend((False, child) for child in reversed(item))
+        else:
+            encoded_items = sorted(map(encode_canonical, item))
+            yield b"S" + _pack_length(len(encoded_items))
+            yield from encoded_items
+
+
+def _encode_into(obj: Any, chunks: list[bytes]) -> None:
+    """Append the canonical encoding of the provided object to the list of chunks."""
+    encode = _LEAF_ENCODERS.get(type(obj))
+    if encode is not None:
+        chunks.append(encode(obj))
+        return
+
+    tag = _get_container_tag(obj)
+    if tag is None:
+        chunks.append(_encode_leaf(obj))
+    elif tag == b"d":
+        chunks.append(b"d" + _pack_length(len(obj)))
+        for encoded_key, value in sorted(
+            (encode_canonical(key), value) for key, value in obj.items()
+        ):
+            chunks.append(encoded_key)
+            _encode_into(value, chunks)
+    elif tag == b"l":
+        chunks.append(b"l" + _pack_length(len(obj)))
+        for child in obj:
+            _encode_into(child, chunks)
+    else:
+        chunks.append(b"S" + _pack_length(len(obj)))
+        chunks.extend(sorted(map(encode_canonical, obj)))
+
+
+def encode_canonical(frozen: object) -> bytes:
+    """Encode a frozen data structure in the canonical binary encoding, see the
+    documentation of `iter_canonical` for details.
+    """
+    chunks: list[bytes] = []
+    _encode_into(frozen, chunks)
+    return chunks[0] if len(chunks) == 1 else b"".join(chunks)
+
+
+def _digest_entry(obj: object) -> bytes:
+    """Get the representation of a child within the input of the digest of its parent.
+    Containers are represented by their own digest, so that the cached digests of
+    FrozenDicts and FrozenLists are reused.
+    """
+    encode = _LEAF_ENCODERS.get(type(obj))
+    if encode is not None:
+        return encode(obj)
+    if _get_container_tag(obj) is None:
+        return _encode_leaf(obj)
+    return _NESTED_DIGEST_TAG + content_digest(obj)
+
+
+def _compute_digest(frozen: Any) -> bytes:
+    # imported on first use as loading OpenSSL slows down importing this package:
+    import hashlib
+
+    tag = _get_container_tag(frozen)
+    if tag is None:
+        return hashlib.blake2b(
+            _encode_leaf(frozen), digest_size=DIGEST_SIZE, person=_DIGEST_PERSON
+        ).digest()
+
+    if tag == b"d":
+        entries = b"".join(
+            sorted(
+                _digest_entry(key) + _digest_entry(value)
+                for key, value in frozen.items()
+            )
+        )
+    elif tag == b"l":
+        entries = b"".join(map(_digest_entry, frozen))
+    else:
+        entries = b"".join(sorted(map(_digest_entry, frozen)))
+    return hashlib.blake2b(
+        tag + _pack_length(len(frozen)) + entries,
+        digest_size=DIGEST_SIZE,
+        person=_DIGEST_PERSON,
+    ).digest()
+
+
+def content_digest(frozen: object) -> bytes:
+    """Get a stable BLAKE2b digest of the content of a frozen data structure, e.g. for
+    content addressing. It is equal for equal data structures across processes,
+    interpreters, and platforms (with the exceptions mentioned in the documentation of
+    `iter_canonical`).
+
+    The digest follows the structure of the canonical encoding, but nested containers
+    are included via their own digest (like in a Merkle tree). The digests of
+    FrozenDicts and FrozenLists are cached on the instances, so that the digest of a
+    shared subtree is only computed once.
+
+    Raises:
+        TypeError: If the data structure contains a value of an unsupported type.
+
+    Examples:
+    ```python
+    from arcticfreeze import content_digest, freeze
+
+    first = freeze({"a": [1, 2], "b": {b"x", b"y"}})
+    second = freeze({"b": {b"y", b"x"}, "a": [1, 2]})
+
+    assert content_digest(first) == content_digest(second)
+    ```
+    """
+    if isinstance(frozen, (FrozenDict, FrozenList, FrozenTable)):
+        return frozen._get_derived(content_digest, lambda: _compute_digest(frozen))
+    return _compute_digest(frozen)
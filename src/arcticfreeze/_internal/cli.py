@@ -0,0 +1,315 @@
+# Copyright 2024 Kersten Henrik Breuer
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A command line interface for freezing, validating, and profiling data files."""
+
+import argparse
+import json
+import sys
+import time
+from collections.abc import Iterator, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Final, Optional, TextIO
+
+from arcticfreeze._internal._converters import STANDARD_CONVERTERS
+from arcticfreeze._internal.freeze import custom_freeze
+from arcticfreeze._internal.frozenlist import FrozenList
+from arcticfreeze._internal.frozentable import FrozenTable
+from arcticfreeze._internal.resolve import (
+    ConverterNotFoundError,
+    get_converter_resolver,
+)
+
+STDIN_PATH: Final = "-"
+FORMATS_BY_SUFFIX: Final = {
+    ".json": "json",
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+    ".yaml": "yaml",
+    ".yml": "yaml",
+}
+
+
+@dataclass
+class Stats:
+    """Statistics collected while processing a data file."""
+
+    documents: int = 0
+    nodes: int = 0
+    containers: int = 0
+    max_depth: int = 0
+    load_seconds: float = 0.0
+    freeze_seconds: float = 0.0
+
+    def add_tree(self, frozen: object) -> None:
+        """Count the nodes of a frozen tree."""
+        self.documents += 1
+        stack = [(frozen, 1)]
+        while stack:
+            node, depth = stack.pop()
+            self.nodes += 1
+            self.max_depth = max(self.max_depth, depth)
+            if isinstance(node, Mapping):
+                children: Iterator = iter((*node.keys(), *node.values()))
+            elif isinstance(node, (tuple, FrozenList, FrozenTable, frozenset)):
+                children = iter(node)
+            else:
+                continue
+            self.containers += 1
+            stack.extend((child, depth + 1) for child in children)
+
+    def __str__(self) -> str:
+        return (
+            f"documents: {self.documents}, nodes: {self.nodes}, containers:"
+            + f" {self.containers}, max depth: {self.max_depth}, load:"
+            + f" {self.load_seconds:.3f}s, freeze: {self.freeze_seconds:.3f}s"
+        )
+
+
+@dataclass
+class FileResult:
+    """The result of processing a single data file."""
+
+    path: str
+    problems: list[str] = field(default_factory=list)
+    stats: Stats = field(default_factory=Stats)
+
+
+def find_unconvertible(
+    obj: object, *, by_superclass: bool, path: str = ""
+) -> Iterator[str]:
+    """Walk the provided (not yet frozen) object and yield a description of every
+    value for which no standard converter exists, including its location.
+    """
+    resolve = get_converter_resolver(
+        STANDARD_CONVERTERS, by_superclass=by_superclass
+    ).resolve
+    stack: list[tuple[str, object]] = [(path, obj)]
+    while stack:
+        location, node = stack.pop()
+        try:
+            resolve(type(node))
+        except ConverterNotFoundError:
+            yield f"{location or '<root>'}: no converter for type {type(node)}"
+            continue
+
+        prefix = f"{location}." if location else ""
+        if isinstance(node, Mapping):
+            items = list(node.items())
+            stack.extend((f"{prefix}{key}", value) for key, value in reversed(items))
+            stack.extend((f"{prefix}<key {key!r}>", key) for key, _ in items)
+        elif isinstance(node, (list, tuple)):
+            stack.extend(
+                (f"{prefix}{index}", child)
+                for index, child in reversed(list(enumerate(node)))
+            )
+        elif isinstance(node, (set, frozenset)):
+            stack.extend((f"{prefix}*", child) for child in node)
+
+
+def _load_documents(
+    stream: TextIO, data_format: str, result: FileResult
+) -> Iterator[tuple[str, object]]:
+    """Parse the documents contained in the stream lazily. Yields tuples of a
+    location prefix and the parsed document. Lines of JSONL files that cannot be
+    parsed are added to the problems of the provided result and skipped.
+    """
+    stats = result.stats
+    if data_format == "jsonl":
+        for line_number, line in enumerate(stream, start=1):
+            if not line.strip():
+                continue
+            start = time.perf_counter()
+            try:
+                document = json.loads(line)
+            except json.JSONDecodeError as error:
+                result.problems.append(
+                    f"{result.path}:{line_number}: failed to parse: {error.msg}"
+                    + f" (column {error.pos + 1})"
+                )
+                continue
+            finally:
+                stats.load_seconds += time.perf_counter() - start
+            yield f"line {line_number}", document
+        return
+
+    start = time.perf_counter()
+    if data_format == "yaml":
+        try:
+            import yaml
+        except ImportError as error:
+            raise RuntimeError(
+                "Reading YAML requires PyYAML, please install the `yaml` extra."
+            ) from error
+        try:
+            document = yaml.safe_load(stream)
+        except yaml.YAMLError as error:
+            raise ValueError(str(error)) from error
+    else:
+        document = json.load(stream)
+    stats.load_seconds += time.perf_counter() - start
+    yield "", document
+
+
+def process_file(
+    path: str,
+    *,
+    data_format: Optional[str] = None,
+    check: bool = False,
+    by_superclass: bool = False,
+) -> FileResult:
+    """Load, validate or freeze, and profile the documents of a single data file.
+    Use "-" as path to read from stdin.
+    """
+    result = FileResult(path=path)
+    if data_format is None:
+        data_format = FORMATS_BY_SUFFIX.get(Path(path).suffix.lower(), "json")
+
+    try:
+        with (
+            open(path, encoding="utf-8")
+            if path != STDIN_PATH
+            else nullcontext(sys.stdin)
+        ) as stream:
+            for location, document in _load_documents(stream, data_format, result):
+                if check:
+                    result.stats.documents += 1
+                    result.problems.extend(
+                        find_unconvertible(
+                            document, by_superclass=by_superclass, path=location
+                        )
+                    )
+                    continue
+
+                start = time.perf_counter()
+                try:
+                    frozen = custom_freeze(
+                        document,
+                        converters=STANDARD_CONVERTERS,
+                        by_superclass=by_superclass,
+                    )
+                except ConverterNotFoundError:
+                    # locate all values that could not be frozen:
+                    result.problems.extend(
+                        find_unconvertible(
+                            document, by_superclass=by_superclass, path=location
+                        )
+                    )
+                    continue
+                except ValueError as error:
+                    result.problems.append(
+                        f"{location or '<root>'}: failed to freeze: {error}"
+                    )
+                    continue
+                result.stats.freeze_seconds += time.perf_counter() - start
+                result.stats.add_tree(frozen)
+    except OSError as error:
+        result.problems.append(f"failed to read: {error}")
+    except ValueError as error:
+        result.problems.append(f"failed to parse: {error}")
+
+    return result
+
+
+def _create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="arcticfreeze",
+        description=(
+            "Deep freeze the content of JSON, JSONL, or YAML files using the standard"
+            + " converters to validate that they can be frozen and to profile them."
+        ),
+    )
+    parser.add_argument(
+        "paths",
+        nargs="*",
+        default=[STDIN_PATH],
+        help='The data files to process. Use "-" to read from stdin (the default).',
+    )
+    parser.add_argument(
+        "--format",
+        choices=sorted(set(FORMATS_BY_SUFFIX.values())),
+        default=None,
+        dest="data_format",
+        help="The format of the data files. By default, it is derived from the file"
+        + " suffix (falling back to json).",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Only validate that all values can be frozen and report the location of"
+        + " every value for which no converter exists.",
+    )
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="Print node counts, maximum depth, and timings per file. Cannot be"
+        + " combined with --check, which does not freeze the data.",
+    )
+    parser.add_argument(
+        "--by-superclass",
+        action="store_true",
+        help="Match converters by superclass, see the documentation of `freeze`.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="The number of processes to use for processing multiple files in"
+        + " parallel.",
+    )
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Run the command line interface with the given arguments (defaults to
+    `sys.argv`). Returns the exit code, which is non-zero if any problem was found.
+    """
+    parser = _create_parser()
+    args = parser.parse_args(argv)
+    if args.check and args.stats:
+        parser.error("--stats cannot be combined with --check")
+    options = {
+        "data_format": args.data_format,
+        "check": args.check,
+        "by_superclass": args.by_superclass,
+    }
+
+    if args.workers > 1 and len(args.paths) > 1 and STDIN_PATH not in args.paths:
+        with ProcessPoolExecutor(max_workers=args.workers) as executor:
+            futures = [
+                executor.submit(process_file, path, **options) for path in args.paths
+            ]
+            results: Iterator[FileResult] = (future.result() for future in futures)
+            return _report(results, stats=args.stats)
+
+    results = (process_file(path, **options) for path in args.paths)
+    return _report(results, stats=args.stats)
+
+
+def _report(results: Iterator[FileResult], *, stats: bool) -> int:
+    """Print the results and return the exit code."""
+    exit_code = 0
+    for result in results:
+        status = f"{len(result.problems)} problem(s)" if result.problems else "ok"
+        if stats:
+            status += f" ({result.stats})"
+        print(f"{result.path}: {status}")
+        for problem in result.problems:
+            print(f"  {problem}")
+        if result.problems:
+            exit_code = 1
+    return exit_code
@@ -0,0 +1,340 @@
+# Copyright 2024 Kersten Henrik Breuer
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Functionality for compiling freeze functions specialized for a given type hint."""
+
+import collections
+import collections.abc
+import sys
+import typing
+from collections.abc import Sequence
+from typing import Any, Callable, Final, Optional
+
+from arcticfreeze._internal._converters import Converter
+from arcticfreeze._internal._converters.standard import (
+    convert_mapping,
+    convert_sequence,
+    convert_set_like,
+    convert_to_frozen_list,
+)
+from arcticfreeze._internal.freeze import assemble_converters, create_freezer
+from arcticfreeze._internal.frozendict import FrozenDict
+from arcticfreeze._internal.frozenlist import FrozenList
+from arcticfreeze._internal.resolve import (
+    ConverterNotFoundError,
+    ConverterResolver,
+    get_converter_resolver,
+)
+
+Freezer = Callable[[Any], Any]
+
+if sys.version_info >= (3, 10):
+    from typing import is_typeddict
+else:
+
+    def is_typeddict(hint: Any) -> bool:
+        """Check whether the hint is a TypedDict class (`typing.is_typeddict` is only
+        available from Python 3.10 on).
+        """
+        return (
+            isinstance(hint, type)
+            and issubclass(hint, dict)
+            and hasattr(hint, "__total__")
+            and hasattr(hint, "__annotations__")
+        )
+
+
+# The converter used by converters that return the object as is:
+_IDENTITY_CONVERT: Final = Converter.convert  # type: ignore[misc]
+
+# The runtime types that may be passed for hints of the following origins:
+_SEQUENCE_ORIGINS: Final = {
+    list: (list, tuple, collections.deque),
+    tuple: (list, tuple, collections.deque),
+    collections.abc.Sequence: (list, tuple, collections.deque),
+    collections.abc.MutableSequence: (list, collections.deque),
+    collections.deque: (collections.deque,),
+}
+_MAPPING_ORIGINS: Final = {
+    dict: (dict, FrozenDict),
+    collections.abc.Mapping: (dict, FrozenDict),
+    collections.abc.MutableMapping: (dict,),
+    FrozenDict: (dict, FrozenDict),
+}
+_SET_ORIGINS: Final = {
+    set: (set, frozenset),
+    frozenset: (set, frozenset),
+    collections.abc.Set: (set, frozenset),
+    collections.abc.MutableSet: (set,),
+}
+
+
+class _Compiler:
+    """Compiles freezers for type hints, falling back to the generic freezer for hints
+    (or parts of them) that cannot be specialized.
+    """
+
+    def __init__(self, resolver: ConverterResolver):
+        self._resolver = resolver
+        self._generic = create_freezer(resolver)
+        self._compiled: dict[object, Freezer] = {}
+
+    def _resolve(self, input_type: type) -> Optional[Converter]:
+        try:
+            return self._resolver.resolve(input_type)
+        except ConverterNotFoundError:
+            return None
+
+    def _leaf_type(self, hint: object) -> Optional[type]:
+        """Get the type if the hint is a type that is frozen as is, otherwise `None`."""
+        if hint is None:
+            hint = type(None)
+        # parametrized generics (e.g. `list[int]`) are instances of type on Python 3.9:
+        if not isinstance(hint, type) or typing.get_origin(hint) is not None:
+            return None
+        converter = self._resolve(hint)
+        if converter is None or converter.convert is not _IDENTITY_CONVERT:
+            return None
+        return hint
+
+    def _input_types(self, candidates: Sequence[type], *converts: Callable) -> tuple:
+        """Get the candidate types frozen by one of the given standard converters."""
+        return tuple(
+            candidate
+            for candidate in candidates
+            if (converter := self._resolve(candidate)) is not None
+            and converter.convert in converts
+        )
+
+    def compile(self, hint: object) -> Freezer:
+        """Compile a freezer for the given type hint. Compiled freezers are memoized per
+        hint, which also supports recursive hints (e.g. a TypedDict referring to
+        itself).
+        """
+        try:
+            return self._compiled[hint]
+        except KeyError:
+            pass
+
+        # a placeholder for recursive references while the hint is being compiled:
+        compiled: list[Freezer] = []
+        self._compiled[hint] = lambda obj: compiled[0](obj)
+        freezer = self._compile(hint)
+        compiled.append(freezer)
+        self._compiled[hint] = freezer
+        return freezer
+
+    def _compile(self, hint: Any) -> Freezer:
+        generic = self._generic
+
+        leaf_type = self._leaf_type(hint)
+        if leaf_type is not None:
+            return lambda obj: obj if type(obj) is leaf_type else generic(obj)
+
+        if is_typeddict(hint):
+            return self._compile_typed_dict(hint)
+
+        origin = typing.get_origin(hint)
+        args = typing.get_args(hint)
+        if origin is typing.Annotated:
+            return self.compile(args[0])
+        if hasattr(hint, "__supertype__"):  # typing.NewType
+            return self.compile(hint.__supertype__)
+        if origin is None and isinstance(hint, type):
+            # bare generic types like `list` or `dict`:
+            origin = hint
+
+        return self._compile_container(origin, args) or generic
+
+    def _compile_container(
+        self, origin: Any, args: tuple[Any, ...]
+    ) -> Optional[Freezer]:
+        """Compile a freezer for a container hint or return `None` if the hint is not
+        a supported container hint (e.g. a union).
+        """
+        if origin is tuple and len(args) == 2 and args[1] is Ellipsis:
+            return self._compile_sequence(origin, args[0])
+        if origin is tuple and args and Ellipsis not in args:
+            return self._compile_fixed_tuple(args)
+        if origin in _SEQUENCE_ORIGINS and len(args) <= 1:
+            return self._compile_sequence(origin, args[0] if args else Any)
+        if origin in _MAPPING_ORIGINS and len(args) in (0, 2):
+            key_hint, value_hint = args or (Any, Any)
+            return self._compile_mapping(origin, key_hint, value_hint)
+        if origin in _SET_ORIGINS and len(args) <= 1:
+            return self._compile_set(origin, args[0] if args else Any)
+        return None
+
+    def _compile_sequence(self, origin: object, item_hint: object) -> Freezer:
+        generic = self._generic
+        to_tuple = self._input_types(_SEQUENCE_ORIGINS[origin], convert_sequence)  # type: ignore
+        to_frozen_list = self._input_types(
+            _SEQUENCE_ORIGINS[origin],  # type: ignore
+            convert_to_frozen_list,
+        )
+        freeze_item = self.compile(item_hint)
+        leaf_type = self._leaf_type(item_hint)
+        leaf_types = set() if leaf_type is None else {leaf_type}
+
+        def freeze_sequence(obj):
+            obj_type = type(obj)
+            if obj_type in to_tuple:
+                as_frozen_list = False
+            elif obj_type in to_frozen_list:
+                as_frozen_list = True
+            else:
+                return generic(obj)
+
+            # checking the types of leaves at once is much faster than per item:
+            if leaf_types and set(map(type, obj)) <= leaf_types:
+                items = tuple(obj)
+            else:
+                items = tuple(map(freeze_item, obj))
+            return FrozenList._from_storage(items, None) if as_frozen_list else items
+
+        return freeze_sequence
+
+    def _compile_fixed_tuple(self, item_hints: Sequence[object]) -> Freezer:
+        generic = self._generic
+        input_types = self._input_types(_SEQUENCE_ORIGINS[tuple], convert_sequence)
+        freeze_items = tuple(map(self.compile, item_hints))
+
+        def freeze_fixed_tuple(obj):
+            if type(obj) not in input_types or len(obj) != len(freeze_items):
+                return generic(obj)
+            return tuple(
+                freeze_item(item) for freeze_item, item in zip(freeze_items, obj)
+            )
+
+        return freeze_fixed_tuple
+
+    def _compile_mapping(
+        self, origin: object, key_hint: object, value_hint: object
+    ) -> Freezer:
+        generic = self._generic
+        input_types = self._input_types(_MAPPING_ORIGINS[origin], convert_mapping)  # type: ignore
+        freeze_key = self.compile(key_hint)
+        freeze_value = self.compile(value_hint)
+        key_type = self._leaf_type(key_hint)
+        key_types = set() if key_type is None else {key_type}
+        value_type = self._leaf_type(value_hint)
+        value_types = set() if value_type is None else {value_type}
+
+        def freeze_mapping(obj):
+            if type(obj) not in input_types:
+                return generic(obj)
+            # checking the types of leaves at once is much faster than per item:
+            keys = obj.keys()
+            if not (key_types and set(map(type, keys)) <= key_types):
+                keys = map(freeze_key, keys)
+            values = obj.values()
+            if not (value_types and set(map(type, values)) <= value_types):
+                values = map(freeze_value, values)
+            return FrozenDict._from_dict(dict(zip(keys, values)))
+
+        return freeze_mapping
+
+    def _compile_typed_dict(self, hint: type) -> Freezer:
+        generic = self._generic
+        input_types = self._input_types((dict, FrozenDict), convert_mapping)
+        key_types = {str} if self._leaf_type(str) is str else set()
+        value_hints = typing.get_type_hints(hint)
+        freeze_values = {key: self.compile(value) for key, value in value_hints.items()}
+        # the values of these keys are frozen as is if they have the hinted type:
+        leaf_types = {
+            key: leaf_type
+            for key, value in value_hints.items()
+            if (leaf_type := self._leaf_type(value)) is not None
+        }
+
+        def freeze_typed_dict(obj):
+            if type(obj) not in input_types or not set(map(type, obj)) <= key_types:
+                return generic(obj)
+            frozen = {}
+            for key, value in obj.items():
+                if type(value) is leaf_types.get(key):
+                    frozen[key] = value
+                else:
+                    frozen[key] = freeze_values.get(key, generic)(value)
+            return FrozenDict._from_dict(frozen)
+
+        return freeze_typed_dict
+
+    def _compile_set(self, origin: object, item_hint: object) -> Freezer:
+        generic = self._generic
+        input_types = self._input_types(_SET_ORIGINS[origin], convert_set_like)  # type: ignore
+        freeze_item = self.compile(item_hint)
+
+        def freeze_set(obj):
+            if type(obj) not in input_types:
+                return generic(obj)
+            return convert_set_like(obj, freeze_item)
+
+        return freeze_set
+
+
+def compile_freezer(
+    type_hint: object,
+    *,
+    add_converters: Optional[Sequence[Converter]] = None,
+    by_superclass: bool = False,
+    sequence_type: type = tuple,
+) -> Callable[[object], object]:
+    """Compile a function to deep freeze objects of the given type once, so that
+    freezing many objects of the same (static) shape is faster than using `freeze`.
+
+    The type hint is read once and a freeze function specialized for it is composed.
+    Objects matching the hint are frozen without looking up the converter per node,
+    while the result is the same as the result of `freeze`. Supported hints are
+    the types frozen as is by the converters (e.g. `str` or `int`), lists, tuples,
+    sequences, deques, dicts, mappings, FrozenDicts, sets, and TypedDicts with
+    (arbitrarily nested) type arguments, as well as `Annotated` and `NewType`.
+    Wherever the hint is `Any`, a union (including `Optional`), or of another kind
+    (e.g. a dataclass), and wherever an object does not match the hint, the generic
+    conversion of `freeze` is used instead.
+
+    Args:
+        type_hint:
+            The type hint describing the objects to be frozen.
+        add_converters:
+            See the documentation of the `freeze` function. Converters for types
+            referenced by the hint are respected: Nodes are only specialized if they
+            would be frozen by the respective standard converter.
+        by_superclass:
+            See the documentation of the `freeze` function.
+        sequence_type:
+            See the documentation of the `freeze` function.
+
+    Examples:
+    ```python
+    from typing import TypedDict
+
+    from arcticfreeze import compile_freezer, freeze
+
+
+    class Item(TypedDict):
+        name: str
+        tags: list[str]
+
+
+    freeze_items = compile_freezer(dict[str, list[Item]])
+    items = {"a": [{"name": "x", "tags": ["t"]}]}
+
+    assert freeze_items(items) == freeze(items)
+    ```
+    """
+    converters = assemble_converters(add_converters, sequence_type=sequence_type)
+    resolver = get_converter_resolver(converters, by_superclass=by_superclass)
+    return _Compiler(resolver).compile(type_hint)
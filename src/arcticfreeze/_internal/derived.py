@@ -0,0 +1,55 @@
+# Copyright 2024 Kersten Henrik Breuer
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""A thread-safe cache for data derived from the content of immutable instances."""
+
+import threading
+from collections.abc import Hashable
+from typing import Any, Callable, Optional, Protocol, TypeVar
+
+_T = TypeVar("_T")
+
+# Only acquired when the cache of an instance is created, i.e. at most once per
+# instance, so that concurrent lookups do not contend for it:
+_creation_lock = threading.Lock()
+
+
+class SupportsDerived(Protocol):
+    """An immutable instance with a slot for caching derived data."""
+
+    _derived: Optional[dict[Hashable, Any]]
+
+
+def get_derived(
+    instance: SupportsDerived, key: Hashable, compute: Callable[[], _T]
+) -> _T:
+    """Get data derived from the (immutable) content of the provided instance. It is
+    computed using the provided callable on first access and cached on the instance
+    afterwards.
+
+    This is safe to be called concurrently from multiple threads (also without the
+    GIL). If multiple threads compute the same data concurrently, all of them return
+    the result of the thread that stored it first.
+    """
+    derived = instance._derived
+    if derived is None:
+        with _creation_lock:
+            derived = instance._derived
+            if derived is None:
+                derived = instance._derived = {}
+    try:
+        return derived[key]
+    except KeyError:
+        return derived.setdefault(key, compute())
@@ -0,0 +1,138 @@
+# Copyright 2024 Kersten Henrik Breuer
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Functionality for comparing two frozen data structures and locating their
+differences.
+"""
+
+from collections.abc import Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Literal, Optional
+
+from arcticfreeze._internal.frozendict import FrozenDict
+from arcticfreeze._internal.frozenlist import FrozenList
+from arcticfreeze._internal.frozentable import FrozenTable
+
+Path = tuple[object, ...]
+
+
+@dataclass(frozen=True)
+class Change:
+    """A single difference between two frozen data structures.
+
+    Attributes:
+        path:
+            The keys (for mappings) and indices (for sequences) leading from the root
+            of the compared structures to the changed value. An empty tuple refers to
+            the root itself.
+        kind:
+            Either "added" (the value only exists in the new structure), "removed"
+            (the value only exists in the old structure), or "changed" (the value
+            exists in both structures but differs).
+        old:
+            The value in the old structure or `None` if it was added.
+        new:
+            The value in the new structure or `None` if it was removed.
+    """
+
+    path: Path
+    kind: Literal["added", "removed", "changed"]
+    old: object = None
+    new: object = None
+
+
+def _cached_hash(obj: object) -> Optional[int]:
+    """Return the hash of the provided object if it is already known without
+    computing it, otherwise `None`.
+    """
+    return obj._hash if isinstance(obj, (FrozenDict, FrozenList, FrozenTable)) else None
+
+
+def _diff_mappings(old: Mapping, new: Mapping, path: Path) -> Iterator[Change]:
+    """Yield the differences between two mappings."""
+    for key, old_value in old.items():
+        if key in new:
+            yield from _diff(old_value, new[key], (*path, key))
+        else:
+            yield Change(path=(*path, key), kind="removed", old=old_value)
+
+    for key, new_value in new.items():
+        if key not in old:
+            yield Change(path=(*path, key), kind="added", new=new_value)
+
+
+def _diff_sequences(
+    old: Sequence[object], new: Sequence[object], path: Path
+) -> Iterator[Change]:
+    """Yield the differences between two sequences comparing them position by
+    position.
+    """
+    for index, (old_value, new_value) in enumerate(zip(old, new)):
+        yield from _diff(old_value, new_value, (*path, index))
+
+    for index in range(len(new), len(old)):
+        yield Change(path=(*path, index), kind="removed", old=old[index])
+
+    for index in range(len(old), len(new)):
+        yield Change(path=(*path, index), kind="added", new=new[index])
+
+
+def _diff(old: object, new: object, path: Path) -> Iterator[Change]:
+    """Yield the differences between two frozen objects located at the given path."""
+    if old is new:
+        return
+
+    if isinstance(old, Mapping) and isinstance(new, Mapping):
+        old_hash = _cached_hash(old)
+        if old_hash is not None and old_hash == _cached_hash(new) and old == new:
+            return
+        yield from _diff_mappings(old, new, path)
+    elif type(old) is type(new) and type(old) in (tuple, FrozenList, FrozenTable):
+        old_hash = _cached_hash(old)
+        if old_hash is not None and old_hash == _cached_hash(new) and old == new:
+            return
+        yield from _diff_sequences(old, new, path)  # type: ignore
+    elif type(old) is not type(new) or old != new:
+        yield Change(path=path, kind="changed", old=old, new=new)
+
+
+def frozen_diff(old: object, new: object) -> Iterator[Change]:
+    """Walk two frozen data structures in parallel and lazily yield their differences.
+
+    Mappings are compared key by key and tuples as well as FrozenLists position by
+    position. All other values (including sets) are compared as a whole. Subtrees that
+    are identical objects (as commonly produced when sharing unchanged parts between
+    snapshots) or whose already cached hashes prove equality are skipped without
+    descending into them.
+
+    Args:
+        old: The previous frozen data structure.
+        new: The new frozen data structure.
+
+    Returns:
+        An iterator over `Change` objects. Changes in the removed or changed parts of a
+        mapping are yielded in the key order of the old mapping, followed by additions
+        in the key order of the new mapping.
+
+    Examples:
+    ```python
+    from arcticfreeze import freeze, frozen_diff
+
+    old = freeze({"db": {"host": "a", "port": 1}})
+    new = freeze({"db": {"host": "b", "port": 1}})
+
+    assert [change.path for change in frozen_diff(old, new)] == [("db", "host")]
+    ```
+    """
+    return _diff(old, new, ())
@@ -14,17 +14,125 @@
 
 """High-level functions for deep freezing mutable objects."""
 
-from collections.abc import Sequence
-from typing import Optional
+import collections
+from collections.abc import Iterable, Sequence
+from dataclasses import replace
+from typing import Callable, Final, Optional
 
 from arcticfreeze._internal._converters import (
     STANDARD_CONVERTERS,
     Converter,
 )
+from arcticfreeze._internal._converters.base import (
+    add_transforms,
+    get_freeze_context,
+    set_freeze_context,
+)
+from arcticfreeze._internal._converters.standard import (
+    FROZEN_LIST_CONVERTERS,
+    FROZEN_TABLE_CONVERTERS,
+)
+from arcticfreeze._internal.frozenlist import FrozenList
+from arcticfreeze._internal.frozentable import FrozenTable
+from arcticfreeze._internal.limits import create_limited_freezer
+from arcticfreeze._internal.options import DEFAULT_OPTIONS, FreezeOptions
+from arcticfreeze._internal.project import freeze_projected
 from arcticfreeze._internal.resolve import (
     ConverterNotFoundError,  # noqa: F401 - a shortcut
-    get_converter_by_type,
+    ConverterResolver,
+    get_converter_resolver,
+)
+from arcticfreeze._internal.sizeof import MemoryUsage, measure_memory
+
+# The types of objects that are cleared after freezing them when consuming them:
+_CONSUMABLE_TYPES: Final = (list, dict, set, collections.deque)
+
+# The standard converters producing FrozenLists, combined once so that the same
+# sequence object is used by every call (see `get_converter_resolver`):
+_FROZEN_LIST_STANDARD_CONVERTERS: Final = (
+    *STANDARD_CONVERTERS,
+    *FROZEN_LIST_CONVERTERS,
 )
+_FROZEN_TABLE_STANDARD_CONVERTERS: Final = (
+    *STANDARD_CONVERTERS,
+    *FROZEN_TABLE_CONVERTERS,
+)
+
+
+def create_batch_freezer(
+    resolve: Callable[[type], Converter], freeze_child: Callable[[object], object]
+) -> Callable[[Iterable], list]:
+    """Create a callable that freezes multiple children at once. Runs of consecutive
+    children resolving to the same converter are passed to the batch conversion of
+    that converter (if defined) instead of freezing them one by one.
+    """
+
+    def convert_batch(converter: Converter, batch: list) -> Sequence:
+        frozen = converter.convert_batch(batch, freeze_child)  # type: ignore
+        if len(frozen) != len(batch):
+            raise ValueError(
+                f"The batch conversion for type {converter.input_type} returned"
+                + f" {len(frozen)} objects for {len(batch)} inputs."
+            )
+        return frozen
+
+    def freeze_many(children: Iterable) -> list:
+        frozen: list = []
+        batch: list = []
+        batch_type: Optional[type] = None
+        batch_converter: Optional[Converter] = None
+        for child in children:
+            child_type = type(child)
+            if child_type is batch_type:
+                batch.append(child)
+                continue
+            converter = resolve(child_type)
+            if converter is batch_converter:
+                batch_type = child_type
+                batch.append(child)
+                continue
+            if batch:
+                frozen.extend(convert_batch(batch_converter, batch))  # type: ignore
+                batch = []
+                batch_type = batch_converter = None
+            if converter.convert_batch is None:
+                frozen.append(converter.convert(child, freeze_child))
+            else:
+                batch_type, batch_converter = child_type, converter
+                batch.append(child)
+        if batch:
+            frozen.extend(convert_batch(batch_converter, batch))  # type: ignore
+        return frozen
+
+    return freeze_many
+
+
+def create_freezer(
+    resolver: ConverterResolver, options: FreezeOptions = DEFAULT_OPTIONS
+) -> Callable[[object], object]:
+    """Create a callable to freeze an object and its children using the converters
+    resolved by the provided resolver. FrozenDicts created by the callable share
+    their keys with each other where possible.
+
+    If set in the provided options, the value transform is applied to every object
+    before resolving its converter, except for mapping keys, to which the key
+    transform is applied instead. Batch conversion is not used with a value transform
+    as it would bypass the transform. The limits of the options are not enforced,
+    see `create_limited_freezer`.
+    """
+    resolve = resolver.resolve
+
+    def freeze_node(node):
+        return resolve(type(node)).convert(node, freeze_child)
+
+    freeze_child, context = add_transforms(freeze_node, options)
+    context = replace(context, key_tables={})
+    if resolver.has_batch_converters and options.value_transform is None:
+        context = replace(
+            context, freeze_many=create_batch_freezer(resolve, freeze_child)
+        )
+    set_freeze_context(freeze_child, context)
+    return freeze_child
 
 
 def custom_freeze(
@@ -32,6 +140,7 @@ def custom_freeze(
     *,
     converters: Sequence[Converter],
     by_superclass: bool = False,
+    options: Optional[FreezeOptions] = None,
 ) -> object:
     """Deep freeze the provided object using the provided converts. If the provided
     object is a nested data structure, it will start by freezing the lowest level
@@ -53,21 +162,79 @@ def custom_freeze(
             sub-class may define additional attributes that are not present in the
             superclass and thus not considered during the conversion. Thus by default,
             this option is set to `False`.
+        options:
+            Optionally customize how the object is frozen, see the documentation of
+            `FreezeOptions`.
 
     Raises:
         ConverterNotFoundError:
             If no converter for the given object type could be found.
+        FreezeLimitExceededError:
+            If one of the limits was exceeded.
     """
-    converter = get_converter_by_type(
-        input_type=type(obj), converters=converters, by_superclass=by_superclass
+    if options is None:
+        options = DEFAULT_OPTIONS
+    resolver = get_converter_resolver(converters, by_superclass=by_superclass)
+
+    if options.limited:
+        # batch conversion is not used as it would bypass the accounting per node:
+        freeze_child = create_limited_freezer(resolver.resolve, options)
+    else:
+        freeze_child = create_freezer(resolver, options)
+
+    freeze_root = freeze_child
+    if options.projected:
+
+        def freeze_root(root):
+            return freeze_projected(
+                root,
+                freeze_child,
+                resolver.resolve,
+                include=options.include,
+                exclude=options.exclude,
+            )
+
+    if options.cache is not None:
+        # the resolver is cached per set of converters and by superclass, all other
+        # options changing the result are part of the context:
+        return options.cache.get_or_freeze(
+            obj, freeze_root, context=(resolver, options)
+        )
+    if not options.consume:
+        return freeze_root(obj)
+
+    set_freeze_context(
+        freeze_child, replace(get_freeze_context(freeze_child), consume=True)
     )
+    frozen = freeze_root(obj)
+    # the children of the object were replaced in place, which keeps them alive as
+    # long as the object, thus it is cleared (unless it is the result itself):
+    if type(obj) in _CONSUMABLE_TYPES and frozen is not obj:
+        obj.clear()  # type: ignore
+    return frozen
 
-    # prepare a callable to freeze children:
-    def freeze_child(child):
-        return custom_freeze(child, converters=converters, by_superclass=by_superclass)
 
-    # then freeze the object itself:
-    return converter.convert(obj, freeze_child)
+def assemble_converters(
+    add_converters: Optional[Sequence[Converter]] = None,
+    *,
+    sequence_type: type = tuple,
+) -> Sequence[Converter]:
+    """Combine the standard converters with the optionally provided additional
+    converters, see the documentation of the `freeze` function for details.
+    """
+    if sequence_type is tuple:
+        converters: Sequence[Converter] = STANDARD_CONVERTERS
+    elif sequence_type is FrozenList:
+        converters = _FROZEN_LIST_STANDARD_CONVERTERS
+    elif sequence_type is FrozenTable:
+        converters = _FROZEN_TABLE_STANDARD_CONVERTERS
+    else:
+        raise ValueError(
+            "Expected tuple, FrozenList, or FrozenTable as sequence type, got"
+            + f" {sequence_type}."
+        )
+
+    return converters if add_converters is None else (*converters, *add_converters)
 
 
 def freeze(
@@ -75,12 +242,19 @@ def freeze(
     *,
     add_converters: Optional[Sequence[Converter]] = None,
     by_superclass: bool = False,
+    sequence_type: type = tuple,
+    options: Optional[FreezeOptions] = None,
 ) -> object:
     """Deep freeze the provided object. If the provided object is a nested data
     structure, it will start by freezing the lowest level children and then work its
     way up to the root object. For each child object as well as the root object, the
     object type is used to find the appropriate converter.
 
+    Mappings with the same string keys (e.g. records) that are frozen by the same call
+    share a single table of keys, see `FrozenDict`. Please note that this saves less
+    memory for small mappings (with up to 8 keys), which store their keys compactly
+    anyway.
+
     Args:
         obj:
             The object to be deep frozen.
@@ -99,14 +273,64 @@ def freeze(
             sub-class may define additional attributes that are not present in the
             superclass and thus not considered during the conversion. Thus by default,
             this option is set to `False`.
+        sequence_type:
+            The type to convert mutable sequences (lists and deques) to. Either
+            `tuple` (the default), `FrozenList`, or `FrozenTable`. In contrast to
+            tuples, FrozenLists can be sliced without copying their items.
+            If `FrozenTable`, sequences of dicts with the same string keys are
+            stored column-wise (all other sequences are converted to tuples).
+            Finite iterators of the standard library (e.g. generators, `map`, or
+            `itertools.chain` objects) are consumed and converted to the same type,
+            freezing each item as soon as it is produced. Iterators wrapping
+            infinite ones (e.g. `map(str, itertools.count())`) are consumed as well,
+            thus they never finish unless the `max_nodes` option is set.
+        options:
+            Optionally customize how the object is frozen, e.g. to limit the
+            resources used for freezing untrusted input, to freeze only parts of the
+            object, or to normalize keys and values while freezing. See the
+            documentation of `FreezeOptions`.
 
     Raises:
         ConverterNotFoundError:
             If no converter for the given object type could be found.
+        FreezeLimitExceededError:
+            If one of the limits was exceeded.
+    """
+    converters = assemble_converters(add_converters, sequence_type=sequence_type)
+    return custom_freeze(
+        obj,
+        converters=converters,
+        by_superclass=by_superclass,
+        options=options,
+    )
+
+
+def freeze_measured(
+    obj: object,
+    *,
+    add_converters: Optional[Sequence[Converter]] = None,
+    by_superclass: bool = False,
+    sequence_type: type = tuple,
+    options: Optional[FreezeOptions] = None,
+) -> tuple[object, MemoryUsage]:
+    """Deep freeze the provided object like `freeze` and measure the memory used by
+    the result. Returns a tuple of the frozen object and its `MemoryUsage`, see the
+    documentation of `measure_memory`. All arguments are passed on to `freeze`.
+
+    Examples:
+    ```python
+    from arcticfreeze import freeze_measured
+
+    frozen, usage = freeze_measured({"a": [1, 2]})
+
+    assert usage.total_bytes > 0
+    ```
     """
-    converters = (
-        STANDARD_CONVERTERS
-        if add_converters is None
-        else (*STANDARD_CONVERTERS, *add_converters)
+    frozen = freeze(
+        obj,
+        add_converters=add_converters,
+        by_superclass=by_superclass,
+        sequence_type=sequence_type,
+        options=options,
     )
-    return custom_freeze(obj, converters=converters, by_superclass=by_superclass)
+    return frozen, measure_memory(frozen)
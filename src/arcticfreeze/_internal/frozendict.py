@@ -19,24 +19,143 @@ without requiring Pydantic as a dependency.
 from __future__ import annotations
 
 import typing
-from collections.abc import Mapping
-from typing import Any, TypeVar, overload
+from collections.abc import (
+    Callable,
+    Hashable,
+    ItemsView,
+    Iterable,
+    Iterator,
+    KeysView,
+    Mapping,
+    MutableMapping,
+    Sequence,
+    ValuesView,
+)
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Final, TypeVar, overload
 
-from immutabledict import immutabledict
+from arcticfreeze._internal.derived import get_derived
+from arcticfreeze._internal.pydantic_hooks import (
+    get_frozen_core_schema,
+    get_frozen_serializer,
+)
 
-from arcticfreeze._internal.utils import PYDANTIC_V2_INSTALLED
+if TYPE_CHECKING:
+    from pydantic import GetCoreSchemaHandler
+    from pydantic_core import CoreSchema, SchemaSerializer
 
 _K = TypeVar("_K")
 _V_co = TypeVar("_V_co", covariant=True)
+_V = TypeVar("_V")
+_T = TypeVar("_T")
+
+# The maximum number of items of FrozenDicts using the compact tuple layout. Key
+# tables with up to this number of keys are searched linearly as well:
+SMALL_SIZE_THRESHOLD: Final = 8
+
+# The maximum number of distinct key tables created during a single freeze:
+KEY_TABLE_CACHE_SIZE: Final = 1024
+
+
+# A marker for keys not yet looked up in a cache of key tables:
+_UNKNOWN_KEYS: Final = object()
+
+
+def _find_key(keys: tuple, key: object, stop: int) -> int:
+    """Get the position of the key among the first `stop` keys or -1 if it is not
+    found. Keys are matched like in a dict, i.e., by hash and equality, raising a
+    TypeError if the key is not hashable.
+    """
+    key_hash = hash(key)
+    start = 0
+    while True:
+        try:
+            position = keys.index(key, start, stop)
+        except ValueError:
+            return -1
+        if hash(keys[position]) == key_hash:
+            return position
+        start = position + 1
+
+
+class _KeyTable:
+    """The keys shared by FrozenDicts with the same keys in the same order, which only
+    store their values (similar to the split-table layout of CPython dicts).
+    """
+
+    __slots__ = ("index", "keys")
+
+    def __init__(self, keys: tuple):
+        self.keys = keys
+        # The position of each key, only for tables too large to be searched linearly:
+        self.index: dict | None = (
+            {key: position for position, key in enumerate(keys)}
+            if len(keys) > SMALL_SIZE_THRESHOLD
+            else None
+        )
+
+    def position(self, key: object) -> int:
+        """Get the position of the key or -1 if it is not part of the table."""
+        if self.index is None:
+            return _find_key(self.keys, key, len(self.keys))
+        return self.index.get(key, -1)
+
+
+def create_key_table(keys: tuple) -> _KeyTable | None:
+    """Create a key table for the provided keys or return `None` if the keys are not
+    suitable for sharing. Only keys that are all exactly of type `str` and unique are
+    shared, so that keys that compare equal despite being of different types (like
+    `1` and `True`) are never exchanged for each other.
+    """
+    if not set(map(type, keys)) <= {str} or len(set(keys)) != len(keys):
+        return None
+    return _KeyTable(keys)
+
+
+class _CompactValuesView(ValuesView):
+    """A values view iterating the compact or split layout of FrozenDicts directly."""
+
+    __slots__ = ()
+
+    def __iter__(self):
+        mapping = self._mapping  # type: ignore[attr-defined]
+        items = mapping._items
+        if mapping._keys is not None:
+            return iter(items)
+        return islice(items, len(items) // 2, None)
+
+
+class _CompactItemsView(ItemsView):
+    """An items view iterating the compact or split layout of FrozenDicts directly."""
+
+    __slots__ = ()
 
+    def __iter__(self):
+        mapping = self._mapping  # type: ignore[attr-defined]
+        items = mapping._items
+        if mapping._keys is not None:
+            return zip(mapping._keys.keys, items)
+        size = len(items) // 2
+        return zip(islice(items, size), islice(items, size, None))
 
-class FrozenDict(immutabledict[_K, _V_co]):
+
+class FrozenDict(Mapping[_K, _V_co]):
     """A Mapping type that does not provide any additional methods for modification of
     its content after construction.
 
     It has first class support for type hints. Moreover, it is ready to be used in
     Pydantic v2 models, yet, does not require Pydantic as a dependency.
 
+    To keep the memory footprint low, instances use `__slots__`. Moreover, small
+    instances (with up to `SMALL_SIZE_THRESHOLD` items) do not use a hash table but
+    store keys and values in a single compact tuple that is searched linearly. Larger
+    instances are backed by a dict. When freezing many mappings with the same string
+    keys (e.g. records), the resulting instances share a single table of keys and
+    only store a tuple of their values. This saves the most memory for larger
+    records, e.g. more than half for 16 keys. Small records already store their keys
+    compactly, thus they only save about 10 to 25 percent (see the `key-sharing`
+    benchmark of the repository).
+
     Examples:
     ```python
     from arcticfreeze import FrozenDict
@@ -52,6 +171,22 @@ class FrozenDict(immutabledict[_K, _V_co]):
     ```
     """
 
+    __slots__ = ("__weakref__", "_derived", "_dict", "_hash", "_items", "_keys")
+
+    # The dict backing large instances or `None` for other instances:
+    _dict: dict[_K, _V_co] | None
+    # For small instances, a tuple of all keys followed by all values in the same
+    # order. For instances sharing a key table, a tuple of the values in the order of
+    # the keys. `None` for large instances:
+    _items: tuple | None
+    # The shared key table or `None` if not sharing keys:
+    _keys: _KeyTable | None
+    # The cached hash or `None` if not computed yet:
+    _hash: int | None
+    # A cache for data derived from the (immutable) content, e.g. by other modules of
+    # this package, or `None` if nothing was cached yet:
+    _derived: dict[Hashable, Any] | None
+
     @overload
     def __new__(cls, arg: Mapping[_K, _V_co]) -> FrozenDict[_K, _V_co]: ...
 
@@ -59,16 +194,254 @@ class FrozenDict(immutabledict[_K, _V_co]):
     def __new__(cls, **kwargs: _V_co) -> FrozenDict[str, _V_co]: ...
 
     def __new__(cls, *args: Any, **kwargs: Any) -> FrozenDict:
-        return super().__new__(cls, *args, **kwargs)  # type: ignore
+        if not kwargs and len(args) == 1 and isinstance(args[0], FrozenDict):
+            # the storage of other instances can be shared as it is immutable:
+            other = args[0]
+            return cls._from_storage(other._dict, other._items, other._keys)
+        return cls._from_dict(dict(*args, **kwargs))
 
+    @classmethod
+    def _from_storage(
+        cls,
+        dict_: dict[_K, _V_co] | None,
+        items: tuple | None,
+        keys: _KeyTable | None = None,
+    ) -> FrozenDict[_K, _V_co]:
+        """Create a new instance directly from its internal storage."""
+        instance = object.__new__(cls)
+        instance._dict = dict_
+        instance._items = items
+        instance._keys = keys
+        instance._hash = None
+        instance._derived = None
+        return instance
 
-if PYDANTIC_V2_INSTALLED:
-    from pydantic import GetCoreSchemaHandler
-    from pydantic_core import SchemaSerializer, core_schema
+    @classmethod
+    def _from_dict(cls, dict_: dict[_K, _V_co]) -> FrozenDict[_K, _V_co]:
+        """Create a new instance taking ownership of the provided dict. The dict must
+        not be modified afterwards.
+        """
+        if len(dict_) > SMALL_SIZE_THRESHOLD:
+            return cls._from_storage(dict_, None)
+        return cls._from_storage(None, (*dict_, *dict_.values()))
+
+    @classmethod
+    def _from_keys_and_values(
+        cls,
+        keys: Sequence[_K],
+        values: Sequence[_V_co],
+        *,
+        key_tables: dict[tuple, _KeyTable | None],
+    ) -> FrozenDict[_K, _V_co]:
+        """Create a new instance from keys and values of the same length, sharing a key
+        table with other instances having the same keys. The key tables are looked up
+        in (and added to) the provided cache, which maps tuples of keys to the shared
+        key table or `None` if the keys are not suitable for sharing.
+        """
+        keys = tuple(keys)
+        table = key_tables.get(keys, _UNKNOWN_KEYS)
+        if table is _UNKNOWN_KEYS:
+            if len(key_tables) >= KEY_TABLE_CACHE_SIZE:
+                table = None
+            else:
+                table = key_tables.setdefault(keys, create_key_table(keys))
+        if table is None:
+            return cls._from_dict(dict(zip(keys, values)))
+        return cls._from_storage(None, tuple(values), table)  # type: ignore[arg-type]
+
+    def _get_derived(self, key: Hashable, compute: Callable[[], _T]) -> _T:
+        """Get data derived from the (immutable) content of this instance. It is
+        computed using the provided callable on first access and cached afterwards.
+        """
+        return get_derived(self, key, compute)
+
+    def _as_dict(self) -> dict[_K, _V_co]:
+        """Get the content as dict. Must not be modified as it may be the storage of
+        this instance.
+        """
+        if self._dict is not None:
+            return self._dict
+        items = self._items
+        if self._keys is not None:
+            return dict(zip(self._keys.keys, items))  # type: ignore
+        size = len(items) // 2  # type: ignore
+        return dict(zip(items[:size], items[size:]))  # type: ignore
+
+    def __getitem__(self, key: _K) -> _V_co:
+        if self._dict is not None:
+            return self._dict[key]
+        items = self._items
+        if self._keys is not None:
+            position = self._keys.position(key)
+            if position < 0:
+                raise KeyError(key)
+            return items[position]  # type: ignore
+        size = len(items) // 2  # type: ignore
+        position = _find_key(items, key, size)  # type: ignore
+        if position < 0:
+            raise KeyError(key)
+        return items[position + size]  # type: ignore
+
+    def get(self, key: _K, default: Any = None) -> Any:
+        """Return the value for key if key is in the FrozenDict, else default."""
+        if self._dict is not None:
+            return self._dict.get(key, default)
+        items = self._items
+        if self._keys is not None:
+            position = self._keys.position(key)
+            return default if position < 0 else items[position]  # type: ignore
+        size = len(items) // 2  # type: ignore
+        position = _find_key(items, key, size)  # type: ignore
+        return default if position < 0 else items[position + size]  # type: ignore
+
+    def __contains__(self, key: object) -> bool:
+        if self._dict is not None:
+            return key in self._dict
+        if self._keys is not None:
+            return self._keys.position(key) >= 0
+        items = self._items
+        return _find_key(items, key, len(items) // 2) >= 0  # type: ignore
+
+    def __iter__(self) -> Iterator[_K]:
+        if self._dict is not None:
+            return iter(self._dict)
+        if self._keys is not None:
+            return iter(self._keys.keys)
+        items = self._items
+        return islice(items, len(items) // 2)  # type: ignore
+
+    def __len__(self) -> int:
+        if self._dict is not None:
+            return len(self._dict)
+        if self._keys is not None:
+            return len(self._items)  # type: ignore
+        return len(self._items) // 2  # type: ignore
+
+    def keys(self) -> KeysView[_K]:
+        if self._dict is not None:
+            return self._dict.keys()
+        return KeysView(self)
+
+    def values(self) -> ValuesView[_V_co]:
+        if self._dict is not None:
+            return self._dict.values()
+        return _CompactValuesView(self)
+
+    def items(self) -> ItemsView[_K, _V_co]:
+        if self._dict is not None:
+            return self._dict.items()
+        return _CompactItemsView(self)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, FrozenDict):
+            if self is other:
+                return True
+            # Hashes are cached after the first computation. If both are known and
+            # differ, the content cannot be equal:
+            if (
+                self._hash is not None
+                and other._hash is not None
+                and self._hash != other._hash
+            ):
+                return False
+            if self._keys is not None and self._keys is other._keys:
+                return self._items == other._items
+            return (
+                self._items is not None
+                and self._keys is None
+                and other._keys is None
+                and self._items == other._items
+            ) or self._as_dict() == other._as_dict()
+        if isinstance(other, Mapping):
+            return self._as_dict() == dict(other.items())
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            hash_ = 0
+            for item in self.items():
+                hash_ ^= hash(item)
+            self._hash = hash_
+        return self._hash
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._as_dict()!r})"
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # The cached hash is not pickled as it might differ between interpreters:
+        return (self.__class__, (self._as_dict(),))
 
-    def get_pydantic_core_schema(
+    @classmethod
+    def builder(cls, *args: Any, **kwargs: Any) -> FrozenDictBuilder:
+        """Get a builder to construct an instance of this class by mutating it in
+        place, see the documentation of `FrozenDictBuilder`. Optionally, the builder
+        starts with the items of the provided arguments, which are the same as for
+        constructing a FrozenDict.
+        """
+        return FrozenDictBuilder(cls, dict(*args, **kwargs))
+
+    @classmethod
+    def fromkeys(cls, keys: Iterable[_K], value: Any = None) -> FrozenDict[_K, Any]:
+        return cls._from_dict(dict.fromkeys(keys, value))
+
+    def copy(self) -> FrozenDict[_K, _V_co]:
+        return self.__class__(self)
+
+    def __or__(self, other: Any) -> FrozenDict:
+        if not isinstance(other, (dict, FrozenDict)):
+            return NotImplemented
+        new = dict(self._as_dict())
+        new.update(other)
+        return self.__class__._from_dict(new)
+
+    def __ror__(self, other: Any) -> dict:
+        if not isinstance(other, (dict, FrozenDict)):
+            return NotImplemented
+        new = dict(other)
+        new.update(self._as_dict())
+        return new
+
+    def __ior__(self, other: Any) -> FrozenDict:
+        raise TypeError(f"'{self.__class__.__name__}' object is not mutable")
+
+    def set(self, key: _K, value: Any) -> FrozenDict:
+        """Return a new FrozenDict where the item at the given key is set to the given
+        value.
+        """
+        new = dict(self._as_dict())
+        new[key] = value
+        return self.__class__._from_dict(new)
+
+    def delete(self, key: _K) -> FrozenDict[_K, _V_co]:
+        """Return a new FrozenDict without the item at the given key. Raises a
+        KeyError if the key is not present.
+        """
+        new = dict(self._as_dict())
+        del new[key]
+        return self.__class__._from_dict(new)
+
+    def discard(self, key: _K) -> FrozenDict[_K, _V_co]:
+        """Return a new FrozenDict without the item at the given key or this instance
+        if the key is not present.
+        """
+        if key not in self:
+            return self
+        return self.delete(key)
+
+    def update(self, other: Mapping[_K, _V_co]) -> FrozenDict[_K, _V_co]:
+        """Return a new FrozenDict updated with the items of the provided mapping."""
+        new = dict(self._as_dict())
+        new.update(other)
+        return self.__class__._from_dict(new)
+
+    # The following hooks are only ever called by Pydantic v2, which is imported lazily
+    # by the helpers. This way, importing this module stays cheap even if Pydantic is
+    # installed.
+
+    @classmethod
+    def __get_pydantic_core_schema__(
         cls, source: Any, handler: GetCoreSchemaHandler
-    ) -> core_schema.CoreSchema:
+    ) -> CoreSchema:
         """Get the pydantic core schema for this type."""
         args = typing.get_args(source)
         if not args:
@@ -85,62 +458,97 @@ if PYDANTIC_V2_INSTALLED:
         validation_schema = handler.generate_schema(
             Mapping[key_type, value_type]  # type: ignore
         )
-
-        python_serialization_schema = core_schema.plain_serializer_function_ser_schema(
-            lambda x: x, return_schema=core_schema.any_schema()
-        )
-        python_schema = core_schema.no_info_after_validator_function(
-            function=cls,
-            schema=validation_schema,
-            serialization=python_serialization_schema,
-        )
-
-        json_serialization_schema = core_schema.plain_serializer_function_ser_schema(
-            dict, return_schema=validation_schema, when_used="json"
-        )
-        json_schema = core_schema.no_info_after_validator_function(
-            function=cls,
-            schema=validation_schema,
-            serialization=json_serialization_schema,
-        )
-
-        schema = core_schema.json_or_python_schema(
-            json_schema=json_schema,
-            python_schema=python_schema,
+        return get_frozen_core_schema(
+            cls, validation_schema=validation_schema, to_builtin=dict
         )
 
-        return schema
-
-    def pydantic_serializer(self) -> SchemaSerializer:
+    @property
+    def __pydantic_serializer__(self) -> SchemaSerializer:
         """This is needed due to issue:
         https://github.com/pydantic/pydantic/issues/7779
         """
-        validation_schema = core_schema.any_schema()
+        return get_frozen_serializer(dict)
 
-        python_serialization_schema = core_schema.plain_serializer_function_ser_schema(
-            lambda x: x, return_schema=validation_schema
-        )
-        python_schema = core_schema.any_schema(
-            serialization=python_serialization_schema,
-        )
 
-        json_serialization_schema = core_schema.plain_serializer_function_ser_schema(
-            dict, return_schema=validation_schema, when_used="json"
-        )
-        json_schema = core_schema.any_schema(
-            serialization=json_serialization_schema,
-        )
+class FrozenDictBuilder(MutableMapping[_K, _V]):
+    """A transient, mutable mapping to construct a FrozenDict incrementally, e.g. with
+    many items. Calling `freeze` seals the builder in O(1): the returned FrozenDict
+    takes over the storage of the builder without copying it. Afterwards, any access
+    through the builder raises a TypeError.
 
-        schema = core_schema.json_or_python_schema(
-            json_schema=json_schema,
-            python_schema=python_schema,
-        )
+    Examples:
+    ```python
+    from arcticfreeze import FrozenDict
+
+    builder = FrozenDict.builder()
+    for index in range(100):
+        builder[f"key{index}"] = index
+    frozen = builder.freeze()
+
+    assert frozen["key42"] == 42
+    ```
+    """
+
+    __slots__ = ("_cls", "_dict")
+
+    # The class of the FrozenDict to build:
+    _cls: type[FrozenDict]
+    # The items added so far or `None` once frozen:
+    _dict: dict[_K, _V] | None
 
-        return SchemaSerializer(schema)
+    def __init__(self, cls: type[FrozenDict], dict_: dict[_K, _V]):
+        """Initialize the builder taking ownership of the provided dict."""
+        self._cls = cls
+        self._dict = dict_
+
+    def _storage(self) -> dict[_K, _V]:
+        if self._dict is None:
+            raise TypeError("The builder was frozen and cannot be used anymore.")
+        return self._dict
+
+    def __getitem__(self, key: _K) -> _V:
+        return self._storage()[key]
+
+    def __setitem__(self, key: _K, value: _V) -> None:
+        # this is the hot path while building, thus the check is only done on errors:
+        try:
+            self._dict[key] = value  # type: ignore[index]
+            return
+        except TypeError:
+            if self._dict is not None:
+                raise
+        self._storage()
+
+    def __delitem__(self, key: _K) -> None:
+        del self._storage()[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._storage()
+
+    def __iter__(self) -> Iterator[_K]:
+        return iter(self._storage())
+
+    def __len__(self) -> int:
+        return len(self._storage())
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        """Add the items of the provided mapping, iterable of pairs, or keyword
+        arguments like `dict.update`.
+        """
+        self._storage().update(*args, **kwargs)
+
+    def freeze(self) -> FrozenDict[_K, _V]:
+        """Seal the builder and return a FrozenDict with its items without copying
+        them.
+
+        Raises:
+            TypeError: If the builder was already frozen.
+        """
+        dict_ = self._storage()
+        self._dict = None
+        return self._cls._from_dict(dict_)
 
-    FrozenDict.__get_pydantic_core_schema__ = classmethod(  # type: ignore
-        get_pydantic_core_schema
-    )
-    FrozenDict.__pydantic_serializer__ = property(  # type: ignore
-        pydantic_serializer
-    )
+    def __repr__(self) -> str:
+        if self._dict is None:
+            return f"<frozen {self.__class__.__name__}>"
+        return f"{self.__class__.__name__}({self._dict!r})"
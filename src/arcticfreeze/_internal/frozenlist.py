@@ -0,0 +1,207 @@
+# Copyright 2024 Kersten Henrik Breuer
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""An implementation of a frozen list supporting slicing without copying. It provides
+support for Pydantic v2 models without requiring Pydantic as a dependency.
+"""
+
+from __future__ import annotations
+
+import typing
+from collections.abc import Callable, Hashable, Iterable, Iterator, Sequence
+from itertools import islice
+from typing import TYPE_CHECKING, Any, TypeVar, overload
+
+from arcticfreeze._internal.derived import get_derived
+from arcticfreeze._internal.pydantic_hooks import (
+    get_frozen_core_schema,
+    get_frozen_serializer,
+)
+
+if TYPE_CHECKING:
+    from pydantic import GetCoreSchemaHandler
+    from pydantic_core import CoreSchema, SchemaSerializer
+
+_T_co = TypeVar("_T_co", covariant=True)
+_T = TypeVar("_T")
+
+
+class FrozenList(Sequence[_T_co]):
+    """A Sequence type that does not provide any methods for modification of its
+    content after construction.
+
+    In contrast to a tuple, slicing a FrozenList does not copy the selected items but
+    returns a view sharing the storage of the sliced FrozenList in O(1). Moreover, the
+    hash is cached after the first computation. A FrozenList compares equal to tuples
+    and other FrozenLists with equal items and has the same hash as an equal tuple.
+
+    It has first class support for type hints. Moreover, it is ready to be used in
+    Pydantic v2 models, yet, does not require Pydantic as a dependency.
+
+    Examples:
+    ```python
+    from arcticfreeze import FrozenList
+
+    items = FrozenList(range(1_000_000))
+
+    # Slicing is cheap as the storage is shared:
+    page = items[1000:2000]
+
+    assert page[0] == 1000
+    assert page == tuple(range(1000, 2000))
+    ```
+    """
+
+    __slots__ = ("__weakref__", "_derived", "_hash", "_indices", "_items")
+
+    # The (potentially shared) storage:
+    _items: tuple
+    # The indices of the storage that are part of this view or `None` if all items
+    # are part of it:
+    _indices: range | None
+    # The cached hash or `None` if not computed yet:
+    _hash: int | None
+    # A cache for data derived from the (immutable) content, e.g. by other modules of
+    # this package, or `None` if nothing was cached yet:
+    _derived: dict[Hashable, Any] | None
+
+    def __new__(cls, iterable: Iterable[_T_co] = ()) -> FrozenList[_T_co]:
+        if isinstance(iterable, FrozenList):
+            return cls._from_storage(iterable._items, iterable._indices)
+        return cls._from_storage(tuple(iterable), None)
+
+    @classmethod
+    def _from_storage(cls, items: tuple, indices: range | None) -> FrozenList[_T_co]:
+        """Create a new instance directly from its internal storage."""
+        instance = object.__new__(cls)
+        instance._items = items
+        instance._indices = indices
+        instance._hash = None
+        instance._derived = None
+        return instance
+
+    def _get_derived(self, key: Hashable, compute: Callable[[], _T]) -> _T:
+        """Get data derived from the (immutable) content of this instance. It is
+        computed using the provided callable on first access and cached afterwards.
+        """
+        return get_derived(self, key, compute)
+
+    def _as_tuple(self) -> tuple:
+        """Get the content as tuple. Only copies if this instance is a view on a
+        part of its storage.
+        """
+        if self._indices is None:
+            return self._items
+        indices = self._indices
+        if indices.step == 1:
+            return self._items[indices.start : indices.stop]
+        return tuple(map(self._items.__getitem__, indices))
+
+    @overload
+    def __getitem__(self, index: int) -> _T_co: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> FrozenList[_T_co]: ...
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            indices = (
+                range(len(self._items)) if self._indices is None else self._indices
+            )
+            return self._from_storage(self._items, indices[index])
+        if self._indices is None:
+            return self._items[index]
+        return self._items[self._indices[index]]
+
+    def __len__(self) -> int:
+        if self._indices is None:
+            return len(self._items)
+        return len(self._indices)
+
+    def __iter__(self) -> Iterator[_T_co]:
+        indices = self._indices
+        if indices is None:
+            return iter(self._items)
+        if indices.step == 1:
+            return islice(self._items, indices.start, indices.stop)
+        return map(self._items.__getitem__, indices)
+
+    def __contains__(self, value: object) -> bool:
+        if self._indices is None:
+            return value in self._items
+        return any(item is value or item == value for item in self)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, FrozenList):
+            if self is other:
+                return True
+            # Hashes are cached after the first computation. If both are known and
+            # differ, the content cannot be equal:
+            if (
+                self._hash is not None
+                and other._hash is not None
+                and self._hash != other._hash
+            ):
+                return False
+            return len(self) == len(other) and self._as_tuple() == other._as_tuple()
+        if isinstance(other, tuple):
+            return self._as_tuple() == other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash(self._as_tuple())
+        return self._hash
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self)!r})"
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Only the items of the view are pickled, not the entire storage:
+        return (self.__class__, (self._as_tuple(),))
+
+    # The following hooks are only ever called by Pydantic v2, which is imported lazily
+    # by the helpers. This way, importing this module stays cheap even if Pydantic is
+    # installed.
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: Any, handler: GetCoreSchemaHandler
+    ) -> CoreSchema:
+        """Get the pydantic core schema for this type."""
+        args = typing.get_args(source)
+        if not args:
+            item_type = Any
+        elif len(args) == 1:
+            (item_type,) = args
+        else:
+            raise TypeError(
+                "Expected exactly one (or no) type argument for FrozenList, got"
+                + f" {len(args)}"
+            )
+
+        validation_schema = handler.generate_schema(
+            tuple[item_type, ...]  # type: ignore
+        )
+        return get_frozen_core_schema(
+            cls, validation_schema=validation_schema, to_builtin=tuple
+        )
+
+    @property
+    def __pydantic_serializer__(self) -> SchemaSerializer:
+        """This is needed due to issue:
+        https://github.com/pydantic/pydantic/issues/7779
+        """
+        return get_frozen_serializer(tuple)
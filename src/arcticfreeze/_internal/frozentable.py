@@ -0,0 +1,250 @@
+# Copyright 2024 Kersten Henrik Breuer
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""An implementation of a frozen, column-oriented table of records."""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Callable, Hashable, Iterable, Iterator, Mapping, Sequence
+from typing import Any, TypeVar, Union, overload
+
+from arcticfreeze._internal.derived import get_derived
+from arcticfreeze._internal.frozendict import FrozenDict
+
+_T = TypeVar("_T")
+
+Column = Union[tuple, array]
+
+
+def create_column(values: Sequence[Any]) -> Column:
+    """Store the values of a column compactly. Columns of ints (fitting into 64 bits)
+    or floats only are stored as arrays, all other columns as tuples.
+    """
+    value_types = set(map(type, values))
+    if value_types == {float}:
+        return array("d", values)
+    if value_types == {int}:
+        try:
+            return array("q", values)
+        except OverflowError:
+            pass
+    return tuple(values)
+
+
+class FrozenRow(Mapping[str, Any]):
+    """A lightweight, read-only view of a single row of a FrozenTable. It behaves like
+    (and compares equal to) a FrozenDict with the same items, including the hash.
+    """
+
+    __slots__ = ("_position", "_table")
+
+    def __init__(self, table: FrozenTable, position: int):
+        self._table = table
+        self._position = position
+
+    def __getitem__(self, key: str) -> Any:
+        table = self._table
+        return table._columns[table._index[key]][self._position]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._table._names)
+
+    def __len__(self) -> int:
+        return len(self._table._names)
+
+    def __hash__(self) -> int:
+        hash_ = 0
+        for item in self.items():
+            hash_ ^= hash(item)
+        return hash_
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({dict(self.items())!r})"
+
+    def to_frozen_dict(self) -> FrozenDict[str, Any]:
+        """Copy the row to a FrozenDict."""
+        return FrozenDict(dict(self.items()))
+
+
+class FrozenTable(Sequence[FrozenRow]):
+    """An immutable sequence of records with the same (string) keys, which are stored
+    column-wise. Columns of ints or floats are stored as arrays, other columns as
+    tuples. Compared to a tuple of FrozenDicts, this needs considerably less memory
+    and columns can be scanned without accessing each record.
+
+    Accessing a row returns a `FrozenRow`, a lightweight view that behaves like a
+    FrozenDict. A FrozenTable compares equal to (and has the same hash as) a tuple of
+    FrozenDicts with equal items.
+
+    Examples:
+    ```python
+    from arcticfreeze import FrozenTable, freeze
+
+    table = freeze(
+        [{"name": "a", "price": 1.5}, {"name": "b", "price": 2.5}],
+        sequence_type=FrozenTable,
+    )
+
+    assert table[1]["name"] == "b"
+    assert sum(table.column("price")) == 4.0
+    assert table.to_records() == ({"name": "a", "price": 1.5}, {"name": "b", "price": 2.5})
+    ```
+    """
+
+    __slots__ = (
+        "__weakref__",
+        "_columns",
+        "_derived",
+        "_hash",
+        "_index",
+        "_length",
+        "_names",
+    )
+
+    # The keys of all records:
+    _names: tuple[str, ...]
+    # The position of each key in `_names` and `_columns`:
+    _index: dict[str, int]
+    # The values of all records per key:
+    _columns: tuple[Column, ...]
+    # The number of records:
+    _length: int
+    # The cached hash or `None` if not computed yet:
+    _hash: int | None
+    # A cache for data derived from the (immutable) content, e.g. by other modules of
+    # this package, or `None` if nothing was cached yet:
+    _derived: dict[Hashable, Any] | None
+
+    def __new__(cls, records: Iterable[Mapping[str, Any]] = ()) -> FrozenTable:
+        """Create a table from records, which must all have the same keys in the same
+        order. Their values are taken as is, i.e. should already be frozen.
+
+        Raises:
+            ValueError: If the records do not have the same keys.
+        """
+        records = list(records)
+        names = tuple(records[0]) if records else ()
+        if any(tuple(record) != names for record in records):
+            raise ValueError("All records of a FrozenTable must have the same keys.")
+        columns = [[record[name] for record in records] for name in names]
+        return cls._from_columns(names, columns, len(records))
+
+    @classmethod
+    def _from_columns(
+        cls, names: tuple[str, ...], columns: Iterable[Sequence[Any]], length: int
+    ) -> FrozenTable:
+        """Create a new instance from the keys and the values per key."""
+        instance = object.__new__(cls)
+        instance._names = names
+        instance._index = {name: position for position, name in enumerate(names)}
+        instance._columns = tuple(map(create_column, columns))
+        instance._length = length
+        instance._hash = None
+        instance._derived = None
+        return instance
+
+    def _get_derived(self, key: Hashable, compute: Callable[[], _T]) -> _T:
+        """Get data derived from the (immutable) content of this instance. It is
+        computed using the provided callable on first access and cached afterwards.
+        """
+        return get_derived(self, key, compute)
+
+    @property
+    def column_names(self) -> tuple[str, ...]:
+        """The keys of all records."""
+        return self._names
+
+    def column(self, name: str) -> Sequence[Any]:
+        """Get the values of all records for the given key, either as tuple or (for
+        columns stored as arrays) as read-only memoryview.
+
+        Raises:
+            KeyError: If the key does not exist.
+        """
+        column = self._columns[self._index[name]]
+        if isinstance(column, array):
+            return memoryview(column).toreadonly()
+        return column
+
+    def to_records(self) -> tuple[FrozenDict[str, Any], ...]:
+        """Convert the table to a tuple of FrozenDicts, i.e. to the form `freeze`
+        produces by default.
+        """
+        names = self._names
+        return tuple(
+            FrozenDict._from_dict(dict(zip(names, values)))
+            for values in zip(*self._columns)
+        ) or ((FrozenDict(),) * self._length)
+
+    @overload
+    def __getitem__(self, index: int) -> FrozenRow: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> FrozenTable: ...
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            positions = range(self._length)[index]
+            return self._from_columns(
+                self._names,
+                (column[index] for column in self._columns),
+                len(positions),
+            )
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("FrozenTable index out of range")
+        return FrozenRow(self, index)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[FrozenRow]:
+        return (FrozenRow(self, position) for position in range(self._length))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, FrozenTable):
+            if self is other:
+                return True
+            if (
+                self._hash is not None
+                and other._hash is not None
+                and self._hash != other._hash
+            ):
+                return False
+            if self._names == other._names and self._length == other._length:
+                return all(
+                    column == other_column
+                    if type(column) is type(other_column)
+                    else tuple(column) == tuple(other_column)
+                    for column, other_column in zip(self._columns, other._columns)
+                )
+        elif not isinstance(other, tuple):
+            return NotImplemented
+        return len(self) == len(other) and all(
+            row == other_row for row, other_row in zip(self, other)
+        )
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash(tuple(self))
+        return self._hash
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(map(dict, self))!r})"
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (self.__class__, (self.to_records(),))
@@ -0,0 +1,210 @@
+# Copyright 2024 Kersten Henrik Breuer
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A flattened index for fast lookups of deeply nested values in frozen data
+structures via string paths.
+"""
+
+import re
+import threading
+from bisect import bisect_left
+from collections.abc import Callable, Mapping
+from fnmatch import translate
+from functools import lru_cache
+from typing import Final, Optional
+
+from arcticfreeze._internal.frozendict import FrozenDict
+from arcticfreeze._internal.frozenlist import FrozenList
+from arcticfreeze._internal.frozentable import FrozenTable
+
+DEFAULT_SEPARATOR: Final = "."
+
+# The maximum number of compiled glob patterns cached (shared by all indices):
+GLOB_PATTERN_CACHE_SIZE: Final = 256
+
+# The maximum number of glob results cached per index:
+GLOB_RESULT_CACHE_SIZE: Final = 64
+
+# The maximum number of indices of tuple roots cached, see `index_paths`:
+TUPLE_INDEX_CACHE_SIZE: Final = 32
+
+
+@lru_cache(maxsize=GLOB_PATTERN_CACHE_SIZE)
+def _compile_glob(pattern: str) -> Callable[[str], Optional[re.Match]]:
+    """Compile a shell-style wildcard pattern to a function matching paths."""
+    return re.compile(translate(pattern)).match
+
+
+class FrozenIndex:
+    """A read-only index mapping string paths to the values of a frozen data
+    structure.
+
+    A path consists of the keys (for mappings) and indices (for sequences) leading from
+    the root to a value, converted to strings and joined by a separator, e.g.
+    `"db.replicas.0.host"`. Both leaf values and intermediate containers are indexed,
+    the root itself is not. Since the indexed structure is immutable, the index is
+    built only once, lazily on first use. Please note that paths are ambiguous if keys
+    contain the separator or if different keys share the same string representation.
+
+    Examples:
+    ```python
+    from arcticfreeze import freeze, index_paths
+
+    config = freeze({"db": {"replicas": [{"host": "a"}, {"host": "b"}]}})
+    index = index_paths(config)
+
+    assert index["db.replicas.0.host"] == "a"
+    assert list(index.glob("*.host").values()) == ["a", "b"]
+    ```
+    """
+
+    def __init__(self, root: object, *, separator: str = DEFAULT_SEPARATOR):
+        self._root = root
+        self._separator = separator
+        self._flat: Optional[dict[str, object]] = None
+        self._sorted_paths: Optional[list[str]] = None
+        self._glob_cache: dict[str, FrozenDict[str, object]] = {}
+        self._glob_lock = threading.Lock()
+
+    @property
+    def root(self) -> object:
+        """The indexed frozen data structure."""
+        return self._root
+
+    def _build(self) -> dict[str, object]:
+        """Flatten the indexed structure into a mapping of paths to values."""
+        values: dict[str, object] = {}
+        separator = self._separator
+        stack: list[tuple[str, object]] = [("", self._root)]
+        while stack:
+            path, node = stack.pop()
+            if isinstance(node, Mapping):
+                children = ((str(key), value) for key, value in node.items())
+            elif isinstance(node, (tuple, FrozenList, FrozenTable)):
+                children = ((str(index), value) for index, value in enumerate(node))
+            else:
+                continue
+
+            prefix = path + separator if path else ""
+            child_entries = [(prefix + key, value) for key, value in children]
+            values.update(child_entries)
+            # reversed so that siblings are visited in their original order:
+            stack.extend(reversed(child_entries))
+        return values
+
+    @property
+    def flat(self) -> Mapping[str, object]:
+        """All indexed values by path."""
+        flat = self._flat
+        if flat is None:
+            flat = self._flat = self._build()
+        return flat
+
+    def __getitem__(self, path: str) -> object:
+        return self.flat[path]
+
+    def __contains__(self, path: object) -> bool:
+        return path in self.flat
+
+    def __len__(self) -> int:
+        return len(self.flat)
+
+    def get(self, path: str, default: object = None) -> object:
+        """Get the value at the given path or the default if the path does not
+        exist.
+        """
+        return self.flat.get(path, default)
+
+    def prefix(self, path: str) -> FrozenDict[str, object]:
+        """Get the value at the given path and all values nested below it by path."""
+        if self._sorted_paths is None:
+            self._sorted_paths = sorted(self.flat)
+        sorted_paths = self._sorted_paths
+
+        result = {path: self.flat[path]} if path in self.flat else {}
+        child_prefix = path + self._separator if path else ""
+        for position in range(bisect_left(sorted_paths, child_prefix), len(self)):
+            child_path = sorted_paths[position]
+            if not child_path.startswith(child_prefix):
+                break
+            result[child_path] = self.flat[child_path]
+        return FrozenDict(result)
+
+    def glob(self, pattern: str) -> FrozenDict[str, object]:
+        """Get all values whose path matches the given shell-style wildcard pattern
+        (as understood by the `fnmatch` module) by path. Please note that `*` also
+        matches the separator, e.g. `*.host` matches `db.host` as well as
+        `db.replicas.0.host`. The results of the `GLOB_RESULT_CACHE_SIZE` most recently
+        added patterns are cached.
+        """
+        glob_cache = self._glob_cache
+        with self._glob_lock:
+            cached = glob_cache.get(pattern)
+        if cached is not None:
+            return cached
+
+        # matched without holding the lock, so that other patterns can be looked up:
+        match = _compile_glob(pattern)
+        result = FrozenDict(
+            {path: value for path, value in self.flat.items() if match(path)}
+        )
+        with self._glob_lock:
+            cached = glob_cache.get(pattern)
+            if cached is not None:
+                return cached
+            if len(glob_cache) >= GLOB_RESULT_CACHE_SIZE:
+                # evict the oldest result (dicts preserve the insertion order):
+                del glob_cache[next(iter(glob_cache))]
+            glob_cache[pattern] = result
+        return result
+
+
+class _ByIdentity:
+    """A reference to an object that is hashed and compared by identity."""
+
+    __slots__ = ("obj",)
+
+    def __init__(self, obj: object):
+        self.obj = obj
+
+    def __hash__(self) -> int:
+        return id(self.obj)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _ByIdentity) and other.obj is self.obj
+
+
+@lru_cache(maxsize=TUPLE_INDEX_CACHE_SIZE)
+def _index_tuple(root: _ByIdentity, separator: str) -> FrozenIndex:
+    return FrozenIndex(root.obj, separator=separator)
+
+
+def index_paths(frozen: object, *, separator: str = DEFAULT_SEPARATOR) -> FrozenIndex:
+    """Get the `FrozenIndex` of the provided frozen data structure.
+
+    Repeated calls for the same root (and separator) return the same index. If the
+    root is a FrozenDict, FrozenList, or FrozenTable, the index is cached on the root
+    and released together with it. Since tuples cannot hold a cache (nor be referenced
+    weakly), the indices of the `TUPLE_INDEX_CACHE_SIZE` most recently used tuple
+    roots are cached instead, keeping these roots alive until they are evicted. For
+    other roots, a new index is returned on every call, hold on to it to benefit from
+    its caching.
+    """
+    if isinstance(frozen, (FrozenDict, FrozenList, FrozenTable)):
+        return frozen._get_derived(
+            (FrozenIndex, separator), lambda: FrozenIndex(frozen, separator=separator)
+        )
+    if type(frozen) is tuple:
+        return _index_tuple(_ByIdentity(frozen), separator)
+    return FrozenIndex(frozen, separator=separator)
@@ -0,0 +1,97 @@
+# Copyright 2024 Kersten Henrik Breuer
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Functionality for bounding the resources used for freezing untrusted input."""
+
+import sys
+from dataclasses import replace
+from typing import Callable, Literal
+
+from arcticfreeze._internal._converters import Converter
+from arcticfreeze._internal._converters.base import add_transforms, set_freeze_context
+from arcticfreeze._internal.options import FreezeOptions
+
+Limit = Literal["max_nodes", "max_depth", "max_bytes"]
+
+
+class FreezeLimitExceededError(Exception):
+    """An exception indicating that freezing an object was aborted as it exceeded one
+    of the configured limits.
+
+    Attributes:
+        limit:
+            The name of the exceeded limit, i.e. "max_nodes", "max_depth", or
+            "max_bytes".
+        maximum:
+            The configured value of the exceeded limit.
+    """
+
+    def __init__(self, *, limit: Limit, maximum: int):
+        super().__init__(
+            f"Freezing was aborted as the object exceeds the limit {limit}={maximum}."
+        )
+        self.limit = limit
+        self.maximum = maximum
+
+
+def create_limited_freezer(
+    resolve: Callable[[type], Converter],
+    options: FreezeOptions,
+) -> Callable[[object], object]:
+    """Create a callable to freeze an object and its children that keeps track of the
+    number of visited nodes, the current depth, and the estimated size of the visited
+    nodes. It raises a `FreezeLimitExceededError` as soon as one of the limits of the
+    provided options (if not `None`) is exceeded.
+
+    The size of each node is estimated using `sys.getsizeof` before converting the
+    node (but after transforming it), i.e. without the size of its children, which
+    are accounted for when visiting them. Mapping keys are nodes as well. See
+    `create_freezer` regarding the transforms.
+    """
+    max_nodes, max_depth, max_bytes = (
+        options.max_nodes,
+        options.max_depth,
+        options.max_bytes,
+    )
+    nodes = 0
+    depth = 0
+    size = 0
+    max_nodes_ = sys.maxsize if max_nodes is None else max_nodes
+    max_depth_ = sys.maxsize if max_depth is None else max_depth
+    max_bytes_ = sys.maxsize if max_bytes is None else max_bytes
+    getsizeof = sys.getsizeof if max_bytes is not None else None
+
+    def freeze_node(node):
+        nonlocal nodes, depth, size
+        nodes += 1
+        if nodes > max_nodes_:
+            raise FreezeLimitExceededError(limit="max_nodes", maximum=max_nodes_)
+        if depth >= max_depth_:
+            raise FreezeLimitExceededError(limit="max_depth", maximum=max_depth_)
+        if getsizeof is not None:
+            size += getsizeof(node)
+            if size > max_bytes_:
+                raise FreezeLimitExceededError(limit="max_bytes", maximum=max_bytes_)
+
+        depth += 1
+        try:
+            return resolve(type(node)).convert(node, freeze_child)
+        finally:
+            depth -= 1
+
+    freeze_child, context = add_transforms(freeze_node, options)
+    # converters must not bypass the engine for nodes such as records of tables:
+    set_freeze_context(freeze_child, replace(context, key_tables={}, limited=True))
+    return freeze_child
@@ -0,0 +1,150 @@
+# Copyright 2024 Kersten Henrik Breuer
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Options for customizing how objects are frozen."""
+
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any, Callable, Final, Optional
+
+from arcticfreeze._internal.cache import FreezeCache
+
+
+@dataclass(frozen=True)
+class FreezeOptions:
+    """Options for customizing how an object is frozen, to be passed to the `freeze`
+    function via its `options` argument. The options are immutable and hashable, so
+    that they can be defined once and reused by many calls.
+
+    Attributes:
+        cache:
+            Optionally provide a cache to look up the result of freezing the same
+            (unchanged) object before, e.g. if a long-lived mutable object is frozen
+            repeatedly. See the documentation of `FreezeCache` for how changes of
+            the object are detected. Results are cached per set of options (other
+            than the cache itself).
+        max_nodes:
+            Optionally limit the number of nodes (the object itself, all its children,
+            and mapping keys) to be frozen, e.g. when freezing untrusted input.
+        max_depth:
+            Optionally limit the nesting depth, where the object itself has depth 1.
+        max_bytes:
+            Optionally limit the estimated size of the object in bytes, which is the
+            sum of `sys.getsizeof` of all nodes.
+
+            All limits are enforced while traversing the object, so that freezing is
+            aborted as soon as a limit is exceeded. If any limit is set, batch
+            conversion is not used.
+        consume:
+            If `True`, the provided object is consumed to reduce the peak memory
+            usage, i.e. it must not be used anymore afterwards. While freezing, the
+            items of nested lists and deques and the values of nested dicts are
+            replaced in place by their frozen counterparts, so that each mutable
+            container is released as soon as its frozen counterpart exists (unless it
+            is still referenced elsewhere, e.g. by a variable of the caller). Items
+            dropped via `drop_if` are removed from the dicts. If the object itself is
+            a list, deque, dict, or set, it is cleared in the end.
+            Objects handled by custom converters are not modified. If freezing fails,
+            the object may be left partially frozen. It cannot be combined with a
+            cache.
+        include:
+            Optionally freeze only the parts of the object at the provided paths
+            (including everything below them). Paths consist of the (not yet
+            transformed) keys (for mappings) and indices (for sequences) leading to a
+            value joined by ".", e.g. "db.replicas.0.host", as used by `FrozenIndex`.
+            Shell-style wildcards are supported per key, e.g. "db.*.host" (in
+            contrast to `FrozenIndex.glob`, "*" does not match "."). Mappings and
+            sequences on the way to selected values are kept with the selected
+            children only, containers without any are dropped.
+        exclude:
+            Optionally drop the parts of the object at the provided paths (see
+            `include`), even if they are included.
+
+            Only mappings and sequences handled by the standard converters are
+            walked by path, other objects are selected as a whole. Parts that are not
+            selected are skipped without visiting them. Sequences that lose items are
+            compacted, so that the indices of the following items change.
+        key_transform:
+            Optionally transform each mapping key before freezing it, e.g.
+            `str.lower`. If multiple keys of a mapping are transformed to the same
+            key, the last one wins.
+        value_transform:
+            Optionally transform every object (the object itself and all its
+            children except mapping keys) before freezing it, e.g. to convert
+            numeric strings to numbers. The converter is resolved for the
+            transformed object. If set, batch conversion is not used.
+        drop_if:
+            Optionally drop the items of mappings whose (not yet transformed) value
+            satisfies the provided predicate, e.g. `lambda value: value is None`.
+        intern_keys:
+            If `True`, string mapping keys are interned using `sys.intern` (after
+            applying `key_transform`), so that keys repeated across many mappings
+            (and calls) share memory.
+
+            The transforms are applied within the single traversal of the object, so
+            that no intermediate data structure is created.
+
+    Raises:
+        ValueError:
+            If `consume` is combined with a cache.
+        TypeError:
+            If `include` or `exclude` is a single string instead of an iterable of
+            paths.
+    """
+
+    # the cache does not change the result, so the options of a cached result compare
+    # equal regardless of it:
+    cache: Optional[FreezeCache] = field(default=None, compare=False)
+    max_nodes: Optional[int] = None
+    max_depth: Optional[int] = None
+    max_bytes: Optional[int] = None
+    consume: bool = False
+    include: Optional[Iterable[str]] = None
+    exclude: Optional[Iterable[str]] = None
+    key_transform: Optional[Callable[[Any], object]] = None
+    value_transform: Optional[Callable[[Any], object]] = None
+    drop_if: Optional[Callable[[Any], bool]] = None
+    intern_keys: bool = False
+
+    def __post_init__(self):
+        if self.consume and self.cache is not None:
+            raise ValueError("A cache cannot be used when consuming the object.")
+        # store the paths as tuples to keep the options immutable and hashable:
+        for name in ("include", "exclude"):
+            paths = getattr(self, name)
+            if isinstance(paths, (str, bytes)):
+                raise TypeError(
+                    f"The `{name}` option expects an iterable of paths, not a single"
+                    + f" path, e.g. `{name}=[{paths!r}]`."
+                )
+            if paths is not None and type(paths) is not tuple:
+                object.__setattr__(self, name, tuple(paths))
+
+    @property
+    def limited(self) -> bool:
+        """Whether any limit is set."""
+        return (
+            self.max_nodes is not None
+            or self.max_depth is not None
+            or self.max_bytes is not None
+        )
+
+    @property
+    def projected(self) -> bool:
+        """Whether only parts of the object are selected via `include` or `exclude`."""
+        return self.include is not None or self.exclude is not None
+
+
+DEFAULT_OPTIONS: Final = FreezeOptions()
@@ -0,0 +1,210 @@
+# Copyright 2024 Kersten Henrik Breuer
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Functionality for freezing only the parts of an object selected by paths."""
+
+import re
+from collections.abc import Iterable, Mapping
+from fnmatch import translate
+from typing import Any, Callable, Final, NamedTuple, Optional
+
+from arcticfreeze._internal._converters import Converter
+from arcticfreeze._internal._converters.base import (
+    FreezeContext,
+    get_freeze_context,
+    set_freeze_context,
+)
+from arcticfreeze._internal._converters.standard import (
+    assemble_frozen_table,
+    convert_mapping,
+    convert_sequence,
+    convert_to_frozen_list,
+    convert_to_frozen_table,
+)
+from arcticfreeze._internal.index import DEFAULT_SEPARATOR
+
+# A pattern split into one callable per key checking whether a key matches:
+Pattern = tuple[Callable[[str], object], ...]
+
+# The converts of containers whose children are selected by path. Other objects are
+# selected (and frozen) as a whole:
+_CONTAINER_CONVERTS: Final = (
+    convert_mapping,
+    convert_sequence,
+    convert_to_frozen_list,
+    convert_to_frozen_table,
+)
+
+# Returned for objects of which nothing is selected:
+_SKIP: Final = object()
+
+# The characters starting a wildcard in patterns understood by the `fnmatch` module:
+_WILDCARDS: Final = re.compile(r"[*?\[]")
+
+
+def compile_pattern(pattern: str) -> Pattern:
+    """Split a path pattern into its keys and compile the shell-style wildcard
+    patterns among them.
+    """
+    return tuple(
+        re.compile(translate(key)).match if _WILDCARDS.search(key) else key.__eq__
+        for key in pattern.split(DEFAULT_SEPARATOR)
+    )
+
+
+class _Selection(NamedTuple):
+    """The state of the selection of an object while walking it by path."""
+
+    # the include patterns that may match the children of the object:
+    include: tuple[Pattern, ...]
+    # the exclude patterns that may match the children of the object:
+    exclude: tuple[Pattern, ...]
+    # whether the object is included as a whole:
+    included: bool
+
+
+def _advance(
+    patterns: tuple[Pattern, ...], depth: int, key: str
+) -> tuple[tuple[Pattern, ...], bool]:
+    """Match the key of a child at the given depth against the patterns matching its
+    parent. Returns the patterns that may match the children of the child and
+    whether any pattern matches the child itself.
+    """
+    if not patterns:
+        return patterns, False
+    below = []
+    matched = False
+    for pattern in patterns:
+        if pattern[depth](key):
+            if len(pattern) > depth + 1:
+                below.append(pattern)
+            else:
+                matched = True
+    return tuple(below), matched
+
+
+class _Projector:
+    """Freezes the parts of an object selected by include and exclude patterns."""
+
+    def __init__(
+        self,
+        freeze_child: Callable[[object], object],
+        resolve: Callable[[type], Converter],
+        *,
+        include: Optional[Iterable[str]],
+        exclude: Optional[Iterable[str]],
+    ):
+        self._freeze_child = freeze_child
+        self._resolve = resolve
+        # the transforms and filters supported by the freeze engine:
+        context = get_freeze_context(freeze_child)
+        self._freeze_key = context.freeze_key or freeze_child
+        self._value_transform = context.value_transform
+        self._drop_if = context.drop_if
+        self._include = (
+            None if include is None else tuple(map(compile_pattern, include))
+        )
+        self._exclude = () if exclude is None else tuple(map(compile_pattern, exclude))
+
+        # assembles containers of already frozen children:
+        def keep_child(child):
+            return child
+
+        set_freeze_context(keep_child, FreezeContext(key_tables=context.key_tables))
+        self._keep_child = keep_child
+
+    def freeze(self, obj: object) -> object:
+        """Freeze the selected parts of the object, which itself is always kept."""
+        if self._include is None:
+            return self._project_children(obj, 0, _Selection((), self._exclude, True))
+        return self._project_children(
+            obj, 0, _Selection(self._include, self._exclude, False)
+        )
+
+    def _project(self, obj: object, key: str, depth: int, parent: _Selection) -> object:
+        """Freeze the selected parts of a child with the given key (at the given depth
+        counting from zero) or return `_SKIP` if nothing of it is selected. The
+        selection is the one of the parent of the child.
+        """
+        exclude, excluded = _advance(parent.exclude, depth, key)
+        if excluded:
+            return _SKIP
+        include, included = parent.include, parent.included
+        if not included:
+            include, included = _advance(include, depth, key)
+
+        if included and not exclude:
+            return self._freeze_child(obj)
+        if not included and not include:
+            return _SKIP
+
+        return self._project_children(
+            obj, depth + 1, _Selection(include, exclude, included)
+        )
+
+    def _project_children(self, obj: Any, depth: int, selection: _Selection) -> object:
+        """Freeze a mapping or sequence with only its selected children or any other
+        object as a whole. Returns `_SKIP` if neither the object (unless it is the
+        root) nor any of its children is selected.
+        """
+        if self._value_transform is not None:
+            obj = self._value_transform(obj)
+        converter = self._resolve(type(obj))
+        if converter.convert not in _CONTAINER_CONVERTS:
+            # the object is already transformed, thus it is converted directly:
+            if selection.included or not depth:
+                return converter.convert(obj, self._freeze_child)
+            return _SKIP
+
+        selected: Any
+        if isinstance(obj, Mapping):
+            selected = {}
+            for key, value in obj.items():
+                if self._drop_if is not None and self._drop_if(value):
+                    continue
+                frozen = self._project(value, str(key), depth, selection)
+                if frozen is not _SKIP:
+                    selected[self._freeze_key(key)] = frozen
+        else:
+            selected = [
+                frozen
+                for index, child in enumerate(obj)
+                if (frozen := self._project(child, str(index), depth, selection))
+                is not _SKIP
+            ]
+
+        # containers are only selected for their children unless selected themselves:
+        if not selected and not selection.included and depth:
+            return _SKIP
+        if converter.convert is convert_to_frozen_table:
+            # the records are frozen already:
+            return assemble_frozen_table(tuple(selected))
+        return converter.convert(selected, self._keep_child)
+
+
+def freeze_projected(
+    obj: object,
+    freeze_child: Callable[[object], object],
+    resolve: Callable[[type], Converter],
+    *,
+    include: Optional[Iterable[str]],
+    exclude: Optional[Iterable[str]],
+) -> object:
+    """Freeze only the parts of the object selected by the patterns, see the
+    documentation of the `include` and `exclude` attributes of `FreezeOptions`. Parts
+    that are not selected are not visited at all.
+    """
+    projector = _Projector(freeze_child, resolve, include=include, exclude=exclude)
+    return projector.freeze(obj)
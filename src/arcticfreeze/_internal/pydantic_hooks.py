@@ -0,0 +1,137 @@
+# Copyright 2024 Kersten Henrik Breuer
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Helpers for integrating the frozen container types of this package with Pydantic
+v2. Pydantic is only imported when these helpers are called, which only happens
+from within hooks invoked by Pydantic itself.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable
+
+if TYPE_CHECKING:
+    from pydantic_core import CoreSchema, SchemaSerializer
+
+
+def get_frozen_core_schema(
+    cls: Callable[[Any], Any],
+    *,
+    validation_schema: CoreSchema,
+    to_builtin: Callable[[Any], Any],
+) -> CoreSchema:
+    """Get the pydantic core schema for a frozen container type.
+
+    Args:
+        cls:
+            The frozen container type (or any callable creating it) that is applied
+            after validation.
+        validation_schema:
+            The schema for validating the input, e.g. for an equivalent builtin type.
+        to_builtin:
+            A callable converting an instance to a JSON-serializable builtin type.
+    """
+    from pydantic_core import core_schema
+
+    python_serialization_schema = core_schema.plain_serializer_function_ser_schema(
+        lambda x: x, return_schema=core_schema.any_schema()
+    )
+    python_schema = core_schema.no_info_after_validator_function(
+        function=cls,
+        schema=validation_schema,
+        serialization=python_serialization_schema,
+    )
+
+    json_serialization_schema = core_schema.plain_serializer_function_ser_schema(
+        to_builtin, return_schema=validation_schema, when_used="json"
+    )
+    json_schema = core_schema.no_info_after_validator_function(
+        function=cls,
+        schema=validation_schema,
+        serialization=json_serialization_schema,
+    )
+
+    return core_schema.json_or_python_schema(
+        json_schema=json_schema,
+        python_schema=python_schema,
+    )
+
+
+def get_memoized_core_schema(
+    schema: CoreSchema, *, validate: Callable[[Any, Callable[[Any], Any]], Any]
+) -> CoreSchema:
+    """Wrap the provided pydantic core schema with a validator function, e.g. to look
+    up the result of validating an input before delegating to the original schema.
+
+    Args:
+        schema:
+            The original schema, which is used for serialization as well.
+        validate:
+            A callable taking the input and a handler validating it using the
+            original schema.
+    """
+    from pydantic_core import core_schema
+
+    return core_schema.no_info_wrap_validator_function(
+        function=validate, schema=schema, serialization=schema.get("serialization")
+    )
+
+
+# The serializers by builtin type, see `get_frozen_serializer`:
+_serializers: dict[Callable[[Any], Any], SchemaSerializer] = {}
+
+
+def get_frozen_serializer(to_builtin: Callable[[Any], Any]) -> SchemaSerializer:
+    """Get the serializer used for instances of a frozen container type that are not
+    announced in a Pydantic model. This is needed due to issue:
+    https://github.com/pydantic/pydantic/issues/7779
+    It is independent of the instance, thus only created once per builtin type. The
+    lookup does not acquire any lock so that serializing from many threads does not
+    contend for it. If multiple threads create the serializer concurrently, all of
+    them use the one stored first.
+    """
+    try:
+        return _serializers[to_builtin]
+    except KeyError:
+        return _serializers.setdefault(
+            to_builtin, _create_frozen_serializer(to_builtin)
+        )
+
+
+def _create_frozen_serializer(to_builtin: Callable[[Any], Any]) -> SchemaSerializer:
+    from pydantic_core import SchemaSerializer, core_schema
+
+    validation_schema = core_schema.any_schema()
+
+    python_serialization_schema = core_schema.plain_serializer_function_ser_schema(
+        lambda x: x, return_schema=validation_schema
+    )
+    python_schema = core_schema.any_schema(
+        serialization=python_serialization_schema,
+    )
+
+    json_serialization_schema = core_schema.plain_serializer_function_ser_schema(
+        to_builtin, return_schema=validation_schema, when_used="json"
+    )
+    json_schema = core_schema.any_schema(
+        serialization=json_serialization_schema,
+    )
+
+    schema = core_schema.json_or_python_schema(
+        json_schema=json_schema,
+        python_schema=python_schema,
+    )
+
+    return SchemaSerializer(schema)
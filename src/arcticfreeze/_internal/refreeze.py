@@ -0,0 +1,195 @@
+# Copyright 2024 Kersten Henrik Breuer
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Functionality for incrementally freezing a mutable object given the frozen result
+of a previous version of that object.
+"""
+
+from collections.abc import Mapping, Sequence
+from typing import Optional
+
+from arcticfreeze._internal._converters import Converter
+from arcticfreeze._internal._converters.standard import (
+    convert_mapping,
+    convert_sequence,
+    convert_to_frozen_list,
+)
+from arcticfreeze._internal.freeze import assemble_converters
+from arcticfreeze._internal.frozendict import FrozenDict
+from arcticfreeze._internal.frozenlist import FrozenList
+from arcticfreeze._internal.resolve import get_converter_resolver
+
+_MISSING = object()
+
+
+def _is_same_frozen(new: object, previous: object) -> bool:
+    """Check whether a freshly frozen object can be replaced by a previous one."""
+    return new is previous or (type(new) is type(previous) and new == previous)
+
+
+class _Refreezer:
+    """Walks a mutable object alongside the previous frozen result."""
+
+    def __init__(self, *, converters: Sequence[Converter], by_superclass: bool):
+        self._resolve = get_converter_resolver(
+            converters, by_superclass=by_superclass
+        ).resolve
+
+    def freeze(self, obj: object) -> object:
+        """Freeze an object for which no previous counterpart exists."""
+        return self._resolve(type(obj)).convert(obj, self.freeze)
+
+    def refreeze(self, obj: object, previous: object) -> object:
+        """Freeze an object reusing the previous frozen counterpart where possible."""
+        converter = self._resolve(type(obj))
+
+        if converter.convert is convert_mapping and isinstance(previous, FrozenDict):
+            return self._refreeze_mapping(obj, previous)  # type: ignore
+        if converter.convert is convert_sequence and type(previous) is tuple:
+            return self._refreeze_sequence(obj, previous)  # type: ignore
+        if converter.convert is convert_to_frozen_list and isinstance(
+            previous, FrozenList
+        ):
+            frozen_items = self._refreeze_sequence(obj, previous._as_tuple())  # type: ignore
+            if frozen_items is previous._as_tuple():
+                return previous
+            return FrozenList._from_storage(frozen_items, None)
+
+        frozen = converter.convert(obj, self.freeze)
+        return previous if _is_same_frozen(frozen, previous) else frozen
+
+    def _refreeze_mapping(self, obj: Mapping, previous: FrozenDict) -> FrozenDict:
+        """Refreeze a mapping matching children to the previous version by key."""
+        reusable = len(obj) == len(previous)
+        previous_keys = iter(previous)
+        frozen_items = {}
+        for key, value in obj.items():
+            frozen_key = self.freeze(key)
+            previous_value = previous.get(frozen_key, _MISSING)
+            if previous_value is _MISSING:
+                frozen_value = self.freeze(value)
+                reusable = False
+            else:
+                frozen_value = self.refreeze(value, previous_value)
+                # the order of keys must be preserved for the previous mapping
+                # to be reusable:
+                reusable = (
+                    reusable
+                    and frozen_value is previous_value
+                    and _is_same_frozen(frozen_key, next(previous_keys))
+                )
+            frozen_items[frozen_key] = frozen_value
+
+        return previous if reusable else FrozenDict(frozen_items)
+
+    def _refreeze_sequence(self, obj: Sequence, previous: tuple) -> tuple:
+        """Refreeze a sequence matching children to the previous version by index.
+        Returns the previous tuple if nothing changed.
+        """
+        frozen = tuple(
+            self.refreeze(child, previous[index])
+            if index < len(previous)
+            else self.freeze(child)
+            for index, child in enumerate(obj)
+        )
+        if len(frozen) == len(previous) and all(
+            new_child is previous_child
+            for new_child, previous_child in zip(frozen, previous)
+        ):
+            return previous
+        return frozen
+
+
+def custom_refreeze(
+    obj: object,
+    previous: object,
+    *,
+    converters: Sequence[Converter],
+    by_superclass: bool = False,
+) -> object:
+    """Deep freeze the provided object using the provided converters while reusing
+    unchanged parts of a previously frozen version of the object.
+
+    Args:
+        obj:
+            The object to be deep frozen.
+        previous:
+            The result of freezing a previous version of the object.
+        converters:
+            See the documentation of the `custom_freeze` function.
+        by_superclass:
+            See the documentation of the `custom_freeze` function.
+
+    Raises:
+        ConverterNotFoundError:
+            If no converter for the given object type could be found.
+    """
+    refreezer = _Refreezer(converters=converters, by_superclass=by_superclass)
+    return refreezer.refreeze(obj, previous)
+
+
+def refreeze(
+    obj: object,
+    previous: object,
+    *,
+    add_converters: Optional[Sequence[Converter]] = None,
+    by_superclass: bool = False,
+    sequence_type: type = tuple,
+) -> object:
+    """Deep freeze the provided object while reusing unchanged parts of a previously
+    frozen version of the object.
+
+    Mappings and sequences handled by the standard converters are walked alongside
+    their previous frozen counterparts (matching children by key or index,
+    respectively). Frozen subtrees and primitive values that did not change are taken
+    over from the previous result so that the new result shares memory with it.
+    Only the paths leading to changes are rebuilt. If nothing changed at all, the
+    previous result is returned as is. Objects handled by other converters are frozen
+    as usual and replaced by their previous counterpart if both compare equal.
+
+    Args:
+        obj:
+            The (mutable) object to be deep frozen.
+        previous:
+            The result of freezing a previous version of the object, e.g. using the
+            `freeze` function or a previous call to this function.
+        add_converters:
+            See the documentation of the `freeze` function.
+        by_superclass:
+            See the documentation of the `freeze` function.
+        sequence_type:
+            See the documentation of the `freeze` function.
+
+    Raises:
+        ConverterNotFoundError:
+            If no converter for the given object type could be found.
+
+    Examples:
+    ```python
+    from arcticfreeze import freeze, refreeze
+
+    config = {"db": {"host": "a"}, "cache": {"size": 1}}
+    previous = freeze(config)
+
+    config["db"]["host"] = "b"
+    current = refreeze(config, previous)
+
+    assert current["db"]["host"] == "b"
+    assert current["cache"] is previous["cache"]
+    ```
+    """
+    converters = assemble_converters(add_converters, sequence_type=sequence_type)
+    return custom_refreeze(
+        obj, previous, converters=converters, by_superclass=by_superclass
+    )
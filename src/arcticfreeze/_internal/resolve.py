@@ -14,10 +14,16 @@
 
 """Functionality for resolving the converter matching a given object."""
 
+import threading
 from collections.abc import Mapping, Sequence
+from functools import lru_cache
+from typing import Final, Optional
 
 from arcticfreeze._internal._converters import Converter
 
+# The maximum number of distinct converter sequences for which resolvers are cached:
+RESOLVER_CACHE_SIZE: Final = 64
+
 
 class ConverterNotFoundError(Exception):
     """An exception indicating that a converter for a given type could not be found."""
@@ -46,6 +52,135 @@ def sort_and_deduplicate_converters(
     return sorted_deduplicated_converters, converters_by_input_type
 
 
+class ConverterResolver:
+    """Resolves the converter for object types given a fixed sequence of converters.
+
+    Resolved converters are cached per concrete object type, so that the (more
+    expensive) resolution by superclass is only performed once per type. Instances
+    are safe to be shared between threads (also without the GIL): cache lookups do
+    not acquire any lock and concurrent resolutions of the same type store the same
+    result.
+    """
+
+    def __init__(self, converters: Sequence[Converter], *, by_superclass: bool):
+        """Initialize the resolver.
+
+        Args:
+            converters:
+                A sequence of converters, see the documentation of the `custom_freeze`
+                function for details.
+            by_superclass:
+                Consider superclasses for matching converter, see the documentation of
+                the `freeze` function for details.
+        """
+        self._by_superclass = by_superclass
+        sorted_converters, converters_by_input_type = sort_and_deduplicate_converters(
+            converters
+        )
+        self._converters_by_input_type = converters_by_input_type
+        self._ranks = {
+            converter.input_type: rank
+            for rank, converter in enumerate(sorted_converters)
+        }
+        # The input types of these converters use a custom metaclass (e.g. ABCMeta)
+        # that may consider types as subclasses that do not list the input type in
+        # their MRO (e.g. virtual subclasses registered with an ABC):
+        self._subclass_hook_converters = tuple(
+            converter
+            for converter in sorted_converters
+            if type(converter.input_type) is not type
+        )
+        # These converters match subclasses even if not resolving by superclass:
+        self._subclass_converters = tuple(
+            converter for converter in sorted_converters if converter.match_subclasses
+        )
+        self._cache: dict[type, Optional[Converter]] = dict(converters_by_input_type)
+        self.has_batch_converters = any(
+            converter.convert_batch is not None for converter in sorted_converters
+        )
+
+    def _resolve_by_superclass(self, input_type: type) -> Optional[Converter]:
+        """Find the converter of highest rank matching a superclass of the given type.
+        This is equivalent to testing all converters in the order of their rank using
+        `issubclass` but only needs to check types in the MRO of the given type and
+        converters with a custom subclass hook.
+        """
+        candidates = [
+            self._converters_by_input_type[superclass]
+            for superclass in input_type.__mro__
+            if superclass in self._converters_by_input_type
+        ]
+        candidates.extend(
+            converter
+            for converter in self._subclass_hook_converters
+            if issubclass(input_type, converter.input_type)
+        )
+        if not candidates:
+            return None
+        return min(candidates, key=lambda converter: self._ranks[converter.input_type])
+
+    def resolve(self, input_type: type) -> Converter:
+        """Get the converter for the given object type.
+
+        Raises:
+            ConverterNotFoundError:
+                If no converter for the given object type could be found.
+        """
+        try:
+            converter = self._cache[input_type]
+        except KeyError:
+            if self._by_superclass:
+                converter = self._resolve_by_superclass(input_type)
+            elif self._subclass_converters:
+                converter = next(
+                    (
+                        converter
+                        for converter in self._subclass_converters
+                        if issubclass(input_type, converter.input_type)
+                    ),
+                    None,
+                )
+            else:
+                raise ConverterNotFoundError(input_type=input_type) from None
+            self._cache[input_type] = converter
+
+        if converter is None:
+            raise ConverterNotFoundError(input_type=input_type)
+        return converter
+
+
+@lru_cache(maxsize=RESOLVER_CACHE_SIZE)
+def _get_cached_converter_resolver(
+    converters: tuple[Converter, ...], by_superclass: bool
+) -> ConverterResolver:
+    return ConverterResolver(converters, by_superclass=by_superclass)
+
+
+# The most recently used resolver per thread, see `get_converter_resolver`:
+_last_used = threading.local()
+
+
+def get_converter_resolver(
+    converters: Sequence[Converter], *, by_superclass: bool
+) -> ConverterResolver:
+    """Get a resolver for the given converters. Resolvers are cached (and with them the
+    converters resolved per type) for the most recently used sequences of converters.
+
+    Additionally, the most recently used resolver is remembered per thread. Thus,
+    repeatedly passing the same tuple of converters neither requires hashing the
+    converters nor contending with other threads for the shared cache. Other
+    sequences (e.g. lists) are always looked up by value as they may have been
+    modified in the meantime.
+    """
+    last = getattr(_last_used, "entry", None)
+    if last is not None and last[0] is converters and last[1] == by_superclass:
+        return last[2]
+    resolver = _get_cached_converter_resolver(tuple(converters), by_superclass)
+    if type(converters) is tuple:
+        _last_used.entry = (converters, by_superclass, resolver)
+    return resolver
+
+
 def get_converter_by_type(
     *,
     input_type: type,
@@ -68,18 +203,5 @@ def get_converter_by_type(
         ConverterNotFoundError:
             If no converter for the given object type could be found.
     """
-    converters, converters_by_input_type = sort_and_deduplicate_converters(converters)
-
-    # try to match by exact type:
-    try:
-        return converters_by_input_type[input_type]
-    except KeyError as error:
-        if not by_superclass:
-            raise ConverterNotFoundError(input_type=input_type) from error
-
-    # match by superclass:
-    for converter in converters:
-        if issubclass(input_type, converter.input_type):
-            return converter
-
-    raise ConverterNotFoundError(input_type=input_type)
+    resolver = get_converter_resolver(converters, by_superclass=by_superclass)
+    return resolver.resolve(input_type)
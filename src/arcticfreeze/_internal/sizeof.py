@@ -0,0 +1,166 @@
+# Copyright 2024 Kersten Henrik Breuer
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Functionality for measuring the memory used by frozen data structures."""
+
+import sys
+from collections import Counter
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+
+from arcticfreeze._internal.frozendict import FrozenDict, _KeyTable
+from arcticfreeze._internal.frozenlist import FrozenList
+from arcticfreeze._internal.frozentable import FrozenTable
+
+
+@dataclass(frozen=True)
+class MemoryUsage:
+    """The memory used by a frozen data structure.
+
+    Attributes:
+        total_bytes:
+            The total size of all distinct objects (as measured by `sys.getsizeof`)
+            that are part of the data structure. Objects referenced multiple times
+            are only counted once.
+        nodes_by_type:
+            The number of distinct objects per type.
+        shared_bytes:
+            The number of bytes saved by sharing objects, i.e. the difference between
+            the size that the data structure would have if every reference to a shared
+            object referred to a separate copy of it and the total size.
+    """
+
+    total_bytes: int
+    nodes_by_type: Mapping[type, int]
+    shared_bytes: int
+
+
+def _table_size_and_children(table: FrozenTable) -> tuple[int, list[object]]:
+    """Get the size of a FrozenTable excluding its children and the children. Rows are
+    views created on access, thus only the columns are counted.
+    """
+    size = sum(
+        map(sys.getsizeof, (table, table._names, table._index, table._columns))
+    ) + sum(map(sys.getsizeof, table._columns))
+    children: list[object] = [*table._names]
+    for column in table._columns:
+        if type(column) is tuple:
+            children.extend(column)
+    return size, children
+
+
+def _shallow_size_and_children(obj: object) -> tuple[int, Iterable[object]]:
+    """Get the size of the provided object excluding its children and the children.
+    The internal storage of FrozenDicts and FrozenLists is part of their size, except
+    for key tables shared between FrozenDicts, which are separate nodes.
+    """
+    if isinstance(obj, FrozenDict):
+        storage: object
+        if obj._dict is not None:
+            storage, children = obj._dict, (*obj._dict, *obj._dict.values())
+        elif obj._keys is not None:
+            # the key table is measured as a separate (usually shared) object:
+            storage, children = obj._items, (obj._keys, *obj._items)  # type: ignore
+        else:
+            # the compact layout stores keys and values in a single tuple:
+            storage, children = obj._items, obj._items  # type: ignore
+        return sys.getsizeof(obj) + sys.getsizeof(storage), children
+    if isinstance(obj, FrozenList):
+        # the entire storage of views is kept alive, thus it is counted as well:
+        return sys.getsizeof(obj) + sys.getsizeof(obj._items), obj._items
+    if isinstance(obj, FrozenTable):
+        return _table_size_and_children(obj)
+    if isinstance(obj, _KeyTable):
+        size = sys.getsizeof(obj) + sys.getsizeof(obj.keys)
+        if obj.index is not None:
+            size += sys.getsizeof(obj.index)
+        return size, obj.keys
+    if type(obj) in (tuple, frozenset, set):
+        return sys.getsizeof(obj), obj  # type: ignore
+    return sys.getsizeof(obj), ()
+
+
+def _measure(frozen: object) -> MemoryUsage:
+    """Walk the data structure once (iteratively) and measure its memory usage."""
+    # the size of each distinct object including its children, which is needed to
+    # compute the savings due to sharing:
+    tree_sizes: dict[int, int] = {}
+    children_by_id: dict[int, tuple[object, ...]] = {}
+    nodes_by_type: Counter = Counter()
+    total_bytes = 0
+
+    # entries are (object, children visited):
+    stack: list[tuple[object, bool]] = [(frozen, False)]
+    while stack:
+        obj, children_visited = stack.pop()
+        obj_id = id(obj)
+        if children_visited:
+            tree_sizes[obj_id] += sum(
+                tree_sizes[id(child)] for child in children_by_id.pop(obj_id)
+            )
+            continue
+        if obj_id in tree_sizes:
+            continue
+
+        size, children = _shallow_size_and_children(obj)
+        tree_sizes[obj_id] = size
+        total_bytes += size
+        nodes_by_type[type(obj)] += 1
+        children = tuple(children)
+        if children:
+            children_by_id[obj_id] = children
+            stack.append((obj, True))
+            stack.extend((child, False) for child in children)
+
+    return MemoryUsage(
+        total_bytes=total_bytes,
+        nodes_by_type=FrozenDict(nodes_by_type),
+        shared_bytes=tree_sizes[id(frozen)] - total_bytes,
+    )
+
+
+def measure_memory(frozen: object) -> MemoryUsage:
+    """Measure the memory used by a frozen data structure, counting objects that are
+    referenced multiple times (e.g. due to `refreeze`) only once.
+
+    The data structure is walked once. For FrozenDicts, FrozenLists, and FrozenTables,
+    the result is cached on the instance, so that measuring the same instance again is
+    cheap. Tuples, frozensets, sets, FrozenDicts, FrozenLists, and FrozenTables are
+    walked recursively, all other objects are measured using `sys.getsizeof` only.
+
+    Args:
+        frozen: The frozen data structure.
+
+    Examples:
+    ```python
+    from arcticfreeze import freeze, measure_memory
+
+    shared = freeze({"a": list(range(100))})
+    usage = measure_memory((shared, shared))
+
+    assert usage.shared_bytes > 0
+    ```
+    """
+    if isinstance(frozen, (FrozenDict, FrozenList, FrozenTable)):
+        return frozen._get_derived(MemoryUsage, lambda: _measure(frozen))
+    return _measure(frozen)
+
+
+def deep_sizeof(frozen: object) -> int:
+    """Get the total size in bytes of a frozen data structure including all its
+    children, counting objects that are referenced multiple times only once. See the
+    documentation of `measure_memory` for details.
+    """
+    return measure_memory(frozen).total_bytes
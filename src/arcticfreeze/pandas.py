@@ -0,0 +1,42 @@
+# Copyright 2024 Kersten Henrik Breuer
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Optional converters for freezing pandas DataFrames and Series. Requires pandas to
+be installed, e.g. via the `pandas` extra of this package.
+
+Examples:
+```python
+import pandas as pd
+
+from arcticfreeze import freeze
+from arcticfreeze.pandas import PANDAS_CONVERTERS
+
+frozen = freeze(pd.DataFrame({"a": [1, 2]}), add_converters=PANDAS_CONVERTERS)
+assert frozen["a"] == (1, 2)
+assert frozen.records[0] == {"a": 1}
+```
+"""
+
+from ._internal._converters.pandas import (
+    PANDAS_CONVERTERS,
+    FrozenColumns,
+    get_pandas_converters,
+)
+
+__all__ = [
+    "PANDAS_CONVERTERS",
+    "FrozenColumns",
+    "get_pandas_converters",
+]
@@ -14,7 +14,15 @@
 
 """Test cases describing input and expected output."""
 
+import collections
+import datetime
+import enum
+import pathlib
+import uuid
+from array import array
 from dataclasses import dataclass
+from decimal import Decimal
+from fractions import Fraction
 from typing import Any
 
 from arcticfreeze import ConverterNotFoundError, FrozenDict
@@ -48,6 +56,37 @@ NESTED_IMMUTABLE_EXAMPLE: Any = FrozenDict(
     {"a": tuple(frozenset(SEQUENCE_OF_PRIMITIVES_EXAMPLE))}
 )
 
+
+class Color(enum.Enum):
+    """An enum for testing enum members."""
+
+    RED = 1
+    GREEN = 2
+
+
+class Permission(enum.IntFlag):
+    """A flag for testing combined flag members."""
+
+    READ = 1
+    WRITE = 2
+
+
+STDLIB_IMMUTABLE_EXAMPLE = (
+    1 + 2j,
+    range(3),
+    Decimal("1.5"),
+    Fraction(1, 3),
+    uuid.UUID(int=1),
+    datetime.date(2024, 1, 1),
+    datetime.datetime(2024, 1, 1, 12, tzinfo=datetime.timezone.utc),
+    datetime.time(12),
+    datetime.timedelta(days=1),
+    pathlib.PurePosixPath("a/b"),
+    pathlib.Path("a/b"),
+    Color.RED,
+    Permission.READ | Permission.WRITE,
+)
+
 VALID_CASES = (
     # Single primitive values:
     ValidTestCase(
@@ -159,6 +198,32 @@ VALID_CASES = (
         inputs={"a": list(set(SEQUENCE_OF_PRIMITIVES_EXAMPLE))},
         expected_outputs=NESTED_IMMUTABLE_EXAMPLE,
     ),
+    # Values of types from the standard library:
+    ValidTestCase(
+        name="stdlib_immutable_values",
+        inputs=STDLIB_IMMUTABLE_EXAMPLE,
+        expected_outputs=STDLIB_IMMUTABLE_EXAMPLE,
+    ),
+    ValidTestCase(
+        name="stdlib_mappings",
+        inputs=collections.OrderedDict(
+            a=collections.defaultdict(list, b=[1]),
+            c=collections.Counter("xx"),
+            d=collections.ChainMap({"e": 1}, {"e": 2, "f": 3}),
+            g=collections.UserDict(h=[2]),
+        ),
+        expected_outputs=FrozenDict(
+            a=FrozenDict(b=(1,)),
+            c=FrozenDict(x=2),
+            d=FrozenDict(e=1, f=3),
+            g=FrozenDict(h=(2,)),
+        ),
+    ),
+    ValidTestCase(
+        name="stdlib_sequences",
+        inputs=collections.UserList([array("i", [1, 2]), [3]]),
+        expected_outputs=((1, 2), (3,)),
+    ),
 )
 
 unkown_value = object()
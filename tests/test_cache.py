@@ -0,0 +1,145 @@
+# Copyright 2024 Kersten Henrik Breuer
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Test caching the results of freezing objects repeatedly."""
+
+import gc
+
+import pytest
+from arcticfreeze import Converter, FreezeCache, FreezeOptions, FrozenList, freeze
+
+
+class Registry(dict):
+    """A dict subclass supporting weak references and tracking a version."""
+
+    version = 0
+
+    def __setitem__(self, key, value):
+        """Set the item and increment the version."""
+        super().__setitem__(key, value)
+        self.version += 1
+
+
+def test_cache_hit():
+    """Test that freezing an unchanged object again returns the cached result."""
+    obj = {"a": [1, 2]}
+    cache = FreezeCache()
+
+    frozen = freeze(obj, options=FreezeOptions(cache=cache))
+
+    assert freeze(obj, options=FreezeOptions(cache=cache)) is frozen
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_cache_fingerprint_change():
+    """Test that changing the length invalidates the result with the default
+    fingerprint.
+    """
+    obj = {"a": 1}
+    cache = FreezeCache()
+    freeze(obj, options=FreezeOptions(cache=cache))
+
+    obj["b"] = 2
+
+    assert freeze(obj, options=FreezeOptions(cache=cache)) == {"a": 1, "b": 2}
+    assert len(cache) == 1
+
+
+def test_cache_custom_fingerprint():
+    """Test that a custom fingerprint detects changes not affecting the length."""
+    registry = Registry(a=1)
+    cache = FreezeCache(fingerprint=lambda obj: obj.version)
+    freeze(registry, by_superclass=True, options=FreezeOptions(cache=cache))
+
+    registry["a"] = 2
+
+    assert freeze(registry, by_superclass=True, options=FreezeOptions(cache=cache)) == {
+        "a": 2
+    }
+    assert cache.hits == 0
+
+
+def test_cache_depends_on_options():
+    """Test that results for different converters or options are cached separately."""
+    obj = [1]
+    cache = FreezeCache()
+
+    as_tuple = freeze(obj, options=FreezeOptions(cache=cache))
+    as_frozen_list = freeze(
+        obj, sequence_type=FrozenList, options=FreezeOptions(cache=cache)
+    )
+    as_string = freeze(
+        obj,
+        add_converters=[Converter(input_type=int, convert=lambda x, _: str(x))],
+        options=FreezeOptions(cache=cache),
+    )
+
+    assert type(as_tuple) is tuple
+    assert type(as_frozen_list) is FrozenList
+    assert as_string == ("1",)
+    assert len(cache) == 3
+
+
+def test_cache_eviction():
+    """Test that the least recently used entries are evicted."""
+    objs = [[index] for index in range(3)]
+    cache = FreezeCache(maxsize=2)
+
+    for obj in objs:
+        freeze(obj, options=FreezeOptions(cache=cache))
+    freeze(objs[1], options=FreezeOptions(cache=cache))
+
+    assert len(cache) == 2
+    assert cache.hits == 1
+    freeze(objs[0], options=FreezeOptions(cache=cache))
+    assert cache.hits == 1
+
+
+def test_cache_weak_references():
+    """Test that entries of garbage collected objects are removed."""
+    registry = Registry(a=1)
+    cache = FreezeCache()
+    freeze(registry, by_superclass=True, options=FreezeOptions(cache=cache))
+    assert len(cache) == 1
+
+    del registry
+    gc.collect()
+
+    assert len(cache) == 0
+
+
+def test_cache_uncacheable():
+    """Test that objects without a fingerprint are frozen without caching."""
+    cache = FreezeCache()
+
+    assert freeze(1, options=FreezeOptions(cache=cache)) == 1
+    assert len(cache) == 0
+
+
+def test_cache_clear():
+    """Test clearing the cache."""
+    cache = FreezeCache()
+    freeze([1], options=FreezeOptions(cache=cache))
+
+    cache.clear()
+
+    assert len(cache) == 0
+    assert cache.misses == 0
+
+
+def test_cache_invalid_size():
+    """Test that the maximum size must be positive."""
+    with pytest.raises(ValueError):
+        FreezeCache(maxsize=0)
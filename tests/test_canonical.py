@@ -0,0 +1,274 @@
+# Copyright 2024 Kersten Henrik Breuer
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Test the canonical encoding and content digests of frozen data structures."""
+
+import datetime
+import enum
+import math
+import pathlib
+import sys
+import uuid
+from decimal import Decimal
+from fractions import Fraction
+
+import pytest
+from arcticfreeze import (
+    FrozenDict,
+    FrozenList,
+    content_digest,
+    encode_canonical,
+    freeze,
+    iter_canonical,
+)
+from arcticfreeze._internal import canonical
+
+
+def _length(length):
+    return length.to_bytes(8, "big")
+
+
+class Color(enum.Enum):
+    """An enum for testing."""
+
+    RED = 1
+
+
+_UTC_PLUS_ONE = datetime.timezone(datetime.timedelta(hours=1))
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (None, b"N"),
+        (True, b"T"),
+        (False, b"F"),
+        (0, b"i" + _length(1) + b"\x00"),
+        (-1, b"i" + _length(1) + b"\xff"),
+        (255, b"i" + _length(2) + b"\x00\xff"),
+        (1.5, b"f" + bytes.fromhex("3ff8000000000000")),
+        (-0.0, b"f" + bytes(8)),
+        ("é", b"s" + _length(2) + "é".encode()),
+        (b"\x00", b"b" + _length(1) + b"\x00"),
+        (
+            (1, "a"),
+            b"l" + _length(2) + b"i" + _length(1) + b"\x01s" + _length(1) + b"a",
+        ),
+        (
+            frozenset({b"b", b"a"}),
+            b"S" + _length(2) + b"b" + _length(1) + b"ab" + _length(1) + b"b",
+        ),
+        (
+            FrozenDict({"b": None, "a": True}),
+            b"d" + _length(2) + b"s" + _length(1) + b"aTs" + _length(1) + b"bN",
+        ),
+        (1.5 - 0j, b"c" + bytes.fromhex("3ff8000000000000") + bytes(8)),
+        (
+            range(1, 4, 2),
+            b"r" + _length(1) + b"\x02" + _length(1) + b"\x01" + _length(1) + b"\x02",
+        ),
+        (Decimal("-1.50"), b"D" + _length(6) + b"-15E-1"),
+        (Fraction(-1, 2), b"Q" + _length(1) + b"\xff" + _length(1) + b"\x02"),
+        (uuid.UUID(int=1), b"U" + bytes(15) + b"\x01"),
+        (datetime.date(1, 1, 2), b"y" + _length(1) + b"\x02"),
+        (
+            datetime.datetime(2024, 1, 2, 3, 4, 5),
+            b"Y" + _length(19) + b"2024-01-02T03:04:05",
+        ),
+        (
+            datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=_UTC_PLUS_ONE),
+            b"Z" + _length(19) + b"2024-01-02T02:04:05",
+        ),
+        (datetime.time(0, 0, 0, 255), b"h" + _length(2) + b"\x00\xff"),
+        (
+            datetime.time(1, tzinfo=_UTC_PLUS_ONE),
+            b"H" + _length(1) + b"\x00",
+        ),
+        (datetime.timedelta(microseconds=-1), b"e" + _length(1) + b"\xff"),
+        (datetime.timezone.utc, b"z" + _length(1) + b"\x00"),
+        (pathlib.PurePosixPath("a//b"), b"p" + _length(3) + b"a/b"),
+        (pathlib.PureWindowsPath("A/b"), b"w" + _length(3) + b"a\\b"),
+        (
+            Color.RED,
+            b"E"
+            + _length(len(__name__))
+            + __name__.encode()
+            + _length(5)
+            + b"Color"
+            + _length(3)
+            + b"RED",
+        ),
+    ],
+)
+def test_encoding(value, expected):
+    """Test the encoding of all supported types, which must never change."""
+    assert encode_canonical(value) == expected
+    assert b"".join(iter_canonical(value)) == expected
+
+
+def test_encoding_nan():
+    """Test that all NaNs have the same encoding."""
+    assert encode_canonical(math.nan) == encode_canonical(-math.nan)
+
+
+@pytest.mark.parametrize(
+    ("first", "second"),
+    [
+        (1 + 0j, complex(1.0, -0.0)),
+        (range(0), range(3, 1)),
+        (range(0, 3, 2), range(0, 4, 2)),
+        (range(5, 6), range(5, 7, 9)),
+        (Decimal("1.0"), Decimal("1")),
+        (Decimal("100"), Decimal("1E+2")),
+        (Decimal("-0"), Decimal("0.00")),
+        (
+            datetime.datetime(2024, 1, 1, 1, tzinfo=_UTC_PLUS_ONE),
+            datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc),
+        ),
+        (
+            datetime.time(1, tzinfo=_UTC_PLUS_ONE),
+            datetime.time(0, tzinfo=datetime.timezone.utc),
+        ),
+        (datetime.timezone.utc, datetime.timezone(datetime.timedelta(0), "Z")),
+        (pathlib.PurePosixPath("a/b"), pathlib.PosixPath("a/b")),
+        (pathlib.PureWindowsPath("A/B"), pathlib.PureWindowsPath("a\\b")),
+    ],
+)
+def test_encoding_of_equal_values(first, second):
+    """Test that equal values of the same kind have equal encodings even if they are
+    represented differently.
+    """
+    assert first == second
+    assert encode_canonical(first) == encode_canonical(second)
+    assert content_digest(first) == content_digest(second)
+
+
+def test_encoding_of_frozen_standard_types():
+    """Test that all immutable types frozen as is by the standard converters can be
+    encoded.
+    """
+    frozen = freeze(
+        {
+            "complex": 1j,
+            "range": range(3),
+            "decimal": Decimal("1.5"),
+            "fraction": Fraction(1, 3),
+            "uuid": uuid.UUID(int=0),
+            "date": datetime.date(2024, 1, 1),
+            "datetime": datetime.datetime(2024, 1, 1),
+            "time": datetime.time(12),
+            "timedelta": datetime.timedelta(days=1),
+            "timezone": datetime.timezone.utc,
+            "path": pathlib.Path("a"),
+            "enum": Color.RED,
+        }
+    )
+
+    assert b"".join(iter_canonical(frozen)) == encode_canonical(frozen)
+    assert len(content_digest(frozen)) == canonical.DIGEST_SIZE
+
+
+def test_encoding_is_order_independent():
+    """Test that the order of mapping items and set items does not matter."""
+    first = freeze({"a": {1, 2}, "b": [{"x": 1, "y": 2}]})
+    second = freeze({"b": [{"y": 2, "x": 1}], "a": {2, 1}})
+
+    assert encode_canonical(first) == encode_canonical(second)
+    assert content_digest(first) == content_digest(second)
+
+
+def test_encoding_distinguishes_types():
+    """Test that equal values of different types have different encodings."""
+    values = [1, 1.0, True, "1", b"1", (1,), frozenset({1}), Decimal(1), 1 + 0j]
+
+    assert len({encode_canonical(value) for value in values}) == len(values)
+    assert len({content_digest(value) for value in values}) == len(values)
+
+
+def test_sequence_types_are_equivalent():
+    """Test that tuples and FrozenLists (being equal) have equal digests."""
+    obj = {"a": [1, [2, 3]]}
+
+    as_tuples = freeze(obj)
+    as_frozen_lists = freeze(obj, sequence_type=FrozenList)
+
+    assert encode_canonical(as_tuples) == encode_canonical(as_frozen_lists)
+    assert content_digest(as_tuples) == content_digest(as_frozen_lists)
+
+
+def test_unsupported_type():
+    """Test that unsupported types are rejected."""
+    with pytest.raises(TypeError):
+        encode_canonical(FrozenDict(a=(object(),)))
+    with pytest.raises(TypeError):
+        content_digest((object(),))
+
+
+def test_digest_is_stable():
+    """Test the digest of an example, which must never change."""
+    frozen = freeze({"a": [1, 2], "b": {b"x", b"y"}, "c": -0.0})
+
+    assert content_digest(frozen).hex() == (
+        "48c7616dc5df3e0ea9cd1a7ea96a35d40ac4859ebd421080c2910761b7dac08f"
+    )
+
+
+def test_digest_is_cached(monkeypatch):
+    """Test that digests of shared FrozenDicts are only computed once."""
+    shared = freeze({"a": [1, 2]})
+    frozen = (shared, FrozenDict(b=shared))
+    calls = []
+    original_compute_digest = canonical._compute_digest
+
+    def compute_digest(obj):
+        calls.append(obj)
+        return original_compute_digest(obj)
+
+    monkeypatch.setattr(canonical, "_compute_digest", compute_digest)
+
+    content_digest(frozen)
+    content_digest(frozen)
+
+    assert sum(obj is shared for obj in calls) == 1
+    assert sum(type(obj) is tuple and obj is frozen for obj in calls) == 2
+
+
+def test_lazy_encoders_are_added_atomically(monkeypatch):
+    """Test that adding lazy encoders does not modify the leaf encoders in place, so
+    that other threads may iterate them concurrently.
+    """
+
+    class Custom:
+        """A type of a lazily imported module."""
+
+    module = type(sys)("custom_module")
+    module.Custom = Custom  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "custom_module", module)
+    monkeypatch.setattr(canonical, "_LEAF_ENCODERS", dict(canonical._LEAF_ENCODERS))
+    monkeypatch.setattr(
+        canonical,
+        "_LAZY_LEAF_ENCODERS",
+        {"custom_module": lambda module: {module.Custom: lambda _: b"C"}},
+    )
+
+    encoders = canonical._LEAF_ENCODERS
+    for index, _ in enumerate(encoders.items()):
+        if index == 0:
+            # e.g. by another thread while this one iterates the encoders:
+            assert canonical._add_lazy_leaf_encoders()
+
+    assert Custom not in encoders
+    assert encode_canonical(Custom()) == b"C"
+    assert not canonical._LAZY_LEAF_ENCODERS
@@ -0,0 +1,148 @@
+# Copyright 2024 Kersten Henrik Breuer
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Test the command line interface."""
+
+import io
+import json
+
+import pytest
+from arcticfreeze._internal import cli
+from arcticfreeze._internal.cli import find_unconvertible, main
+
+
+@pytest.fixture
+def data_files(tmp_path):
+    """Create data files of all supported formats."""
+    json_path = tmp_path / "data.json"
+    json_path.write_text(json.dumps({"a": [1, 2, {"b": None}]}))
+
+    jsonl_path = tmp_path / "data.jsonl"
+    jsonl_path.write_text('{"a": 1}\n\n[1, 2]\n')
+
+    yaml_path = tmp_path / "data.yaml"
+    yaml_path.write_text("a:\n  created: 2024-01-01\n  tags: [x, y]\n")
+
+    return json_path, jsonl_path, yaml_path
+
+
+def test_freeze_files(data_files, capsys):
+    """Test freezing valid files with statistics."""
+    json_path, jsonl_path, _ = data_files
+
+    assert main([str(json_path), str(jsonl_path), "--stats"]) == 0
+
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0].startswith(f"{json_path}: ok (documents: 1, nodes: 8,")
+    assert "max depth: 4" in lines[0]
+    assert lines[1].startswith(f"{jsonl_path}: ok (documents: 2, nodes: 6,")
+
+
+def test_check_dates(data_files, capsys):
+    """Test that files containing dates pass the check."""
+    pytest.importorskip("yaml")
+    _, _, yaml_path = data_files
+
+    assert main(["--check", str(yaml_path)]) == 0
+    assert capsys.readouterr().out == f"{yaml_path}: ok\n"
+
+
+def test_freeze_from_stdin(capsys):
+    """Test freezing all types produced by YAML, reading from stdin."""
+    pytest.importorskip("yaml")
+    stdin = io.StringIO("- !!binary aGVsbG8=\n- {b: !!set {x}, c: 2024-01-01}\n")
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr("sys.stdin", stdin)
+        assert main(["--format", "yaml"]) == 0
+
+    assert capsys.readouterr().out == "-: ok\n"
+
+
+def test_find_unconvertible():
+    """Test that values that cannot be frozen are reported with their location."""
+    obj = {"a": [1, {"b": object()}], "c": {object}}
+
+    assert sorted(find_unconvertible(obj, by_superclass=False)) == [
+        "a.1.b: no converter for type <class 'object'>",
+        "c.*: no converter for type <class 'type'>",
+    ]
+
+
+def test_parse_error(tmp_path, capsys):
+    """Test that invalid files are reported."""
+    path = tmp_path / "invalid.json"
+    path.write_text("{")
+
+    assert main([str(path)]) == 1
+    assert "failed to parse" in capsys.readouterr().out
+
+
+def test_jsonl_parse_error(tmp_path, capsys):
+    """Test that invalid lines of JSONL files are reported with their line number
+    while the following lines are still processed.
+    """
+    path = tmp_path / "data.jsonl"
+    path.write_text('{"a": 1}\n{"a": \n[{}]\n')
+
+    assert main([str(path), "--stats"]) == 1
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0].startswith(f"{path}: 1 problem(s) (documents: 2,")
+    assert lines[1] == f"  {path}:2: failed to parse: Expecting value (column 8)"
+
+
+def test_freeze_error(data_files, monkeypatch, capsys):
+    """Test that errors raised while freezing are not reported as parse errors."""
+    _, jsonl_path, _ = data_files
+
+    def custom_freeze(obj, **_):
+        raise ValueError("invalid value")
+
+    monkeypatch.setattr(cli, "custom_freeze", custom_freeze)
+
+    assert main([str(jsonl_path)]) == 1
+    assert capsys.readouterr().out.splitlines()[1:] == [
+        "  line 1: failed to freeze: invalid value",
+        "  line 3: failed to freeze: invalid value",
+    ]
+
+
+def test_read_error(data_files, tmp_path, capsys):
+    """Test that unreadable files are reported without aborting the other files."""
+    json_path, _, _ = data_files
+    missing_path = tmp_path / "missing.json"
+
+    assert main([str(missing_path), str(json_path)]) == 1
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0] == f"{missing_path}: 1 problem(s)"
+    assert lines[1].startswith("  failed to read:")
+    assert lines[2] == f"{json_path}: ok"
+
+
+def test_check_with_stats(data_files):
+    """Test that statistics cannot be requested when only checking."""
+    json_path, _, _ = data_files
+
+    with pytest.raises(SystemExit) as exc_info:
+        main(["--check", "--stats", str(json_path)])
+    assert exc_info.value.code == 2
+
+
+def test_parallel_workers(data_files, capsys):
+    """Test processing multiple files in parallel."""
+    json_path, jsonl_path, _ = data_files
+
+    assert main(["--workers", "2", str(json_path), str(jsonl_path)]) == 0
+    assert capsys.readouterr().out == f"{json_path}: ok\n{jsonl_path}: ok\n"
@@ -0,0 +1,156 @@
+# Copyright 2024 Kersten Henrik Breuer
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Test compiling freezers for type hints."""
+
+import collections
+import dataclasses
+from collections.abc import Mapping, Sequence
+from typing import Annotated, Any, NewType, Optional, TypedDict, Union
+
+import pytest
+from arcticfreeze import (
+    Converter,
+    ConverterNotFoundError,
+    FrozenDict,
+    FrozenList,
+    compile_freezer,
+    freeze,
+)
+
+from tests.cases import VALID_CASES, ValidTestCase
+
+UserId = NewType("UserId", int)
+
+
+class Item(TypedDict):
+    """An item with nested containers."""
+
+    name: str
+    tags: list[str]
+    counts: dict[str, int]
+
+
+class Node(TypedDict, total=False):
+    """A recursive node of a tree."""
+
+    value: int
+    children: list["Node"]
+
+
+@dataclasses.dataclass
+class Point:
+    """A class without a standard converter."""
+
+    x: int
+
+
+HINTED_CASES = [
+    (str, "a"),
+    (Optional[int], None),
+    (bytes, b"a"),
+    (list[int], [1, 2, 3]),
+    (list[int], (1, 2)),
+    (tuple[int, ...], [1, 2]),
+    (tuple[int, str], (1, "a")),
+    (tuple, (1, [2])),
+    (Sequence[float], collections.deque([1.0])),
+    (list[list[str]], [["a"], [], ["b", "c"]]),
+    (dict[str, int], {"a": 1}),
+    (dict, {"a": [1]}),
+    (Mapping[str, list[int]], FrozenDict(a=[1])),
+    (set[str], {"a", "b"}),
+    (frozenset[int], frozenset({1})),
+    (Item, {"name": "a", "tags": ["b"], "counts": {"c": 1}}),
+    (dict[str, list[Item]], {"x": [{"name": "a", "tags": [], "counts": {}}]}),
+    (Node, {"value": 1, "children": [{"value": 2, "children": []}]}),
+    (Annotated[list[int], "meta"], [1]),
+    (list[UserId], [UserId(1)]),
+    (Any, {"a": [{1}]}),
+    (Union[int, list[int]], [1]),
+]
+
+
+@pytest.mark.parametrize(("hint", "obj"), HINTED_CASES)
+def test_compiled_freezer(hint, obj):
+    """Test that compiled freezers return the same as the generic freeze function."""
+    frozen = compile_freezer(hint)(obj)
+
+    assert frozen == freeze(obj)
+    assert type(frozen) is type(freeze(obj))
+
+
+@pytest.mark.parametrize(
+    ("hint", "obj"),
+    [
+        (list[int], ["a", [1], {"b": 2}]),
+        (dict[str, int], {1: "a", "b": [2]}),
+        (Item, {"name": ["a"], "unknown": {"b": [1]}}),
+        (Item, ["not", "a", "mapping"]),
+        (tuple[int, int], (1, 2, 3)),
+        (set[int], ["a"]),
+        (str, [1]),
+    ],
+)
+def test_compiled_freezer_mismatching_objects(hint, obj):
+    """Test that objects not matching the hint are frozen using the generic
+    conversion.
+    """
+    assert compile_freezer(hint)(obj) == freeze(obj)
+
+
+@pytest.mark.parametrize(
+    "test_case",
+    VALID_CASES,
+    ids=lambda test_case: test_case.name,
+)
+def test_compiled_freezer_any(test_case: ValidTestCase):
+    """Test the generic fallback with the test cases of the freeze function."""
+    assert compile_freezer(Any)(test_case.inputs) == test_case.expected_outputs
+
+
+def test_compiled_freezer_sequence_type():
+    """Test that the sequence type is respected."""
+    frozen = compile_freezer(dict[str, list[list[int]]], sequence_type=FrozenList)(
+        {"a": [[1]]}
+    )
+
+    assert isinstance(frozen, FrozenDict)
+    assert type(frozen["a"]) is FrozenList
+    assert type(frozen["a"][0]) is FrozenList
+
+
+def test_compiled_freezer_add_converters():
+    """Test that custom converters are respected for hinted types."""
+    converters: list[Converter] = [
+        Converter(input_type=int, convert=lambda obj, _: str(obj)),
+        Converter(input_type=list, convert=lambda obj, _: len(obj), priority=-200),
+        Converter(input_type=Point, convert=lambda obj, _: obj.x),
+    ]
+    freeze_compiled = compile_freezer(
+        dict[str, tuple[int, ...]], add_converters=converters
+    )
+    obj = {"a": (1, 2), "b": [3], "c": Point(4)}
+
+    frozen = freeze_compiled(obj)
+
+    assert frozen == {"a": ("1", "2"), "b": 1, "c": 4}
+    assert frozen == freeze(obj, add_converters=converters)
+
+
+def test_compiled_freezer_unsupported_type():
+    """Test that objects that cannot be frozen are still rejected."""
+    with pytest.raises(ConverterNotFoundError):
+        compile_freezer(list[Point])([Point(1)])
@@ -15,7 +15,14 @@
 """Test the standard converters."""
 
 import pytest
-from arcticfreeze._internal._converters import STANDARD_CONVERTERS
+from arcticfreeze import (
+    STANDARD_CONVERTERS,
+    Converter,
+    FreezeContext,
+    FreezeOptions,
+    get_freeze_context,
+)
+from arcticfreeze._internal.freeze import custom_freeze
 from arcticfreeze._internal.resolve import sort_and_deduplicate_converters
 
 
@@ -26,3 +33,37 @@ def test_converter_sequences(converters):
     """
     expected_converters, _ = sort_and_deduplicate_converters(converters)
     assert expected_converters == converters
+
+
+class _Record:
+    def __init__(self, value):
+        self.value = value
+
+
+def test_freeze_context():
+    """Make sure that custom converters can retrieve the context of the freeze engine
+    from the callable passed to them.
+    """
+    contexts = []
+
+    def convert_record(obj, freeze_child):
+        contexts.append(get_freeze_context(freeze_child))
+        return freeze_child(obj.__dict__)
+
+    converters = (*STANDARD_CONVERTERS, Converter(_Record, convert_record))
+    record = _Record(None)
+
+    def drop_if(value):
+        return value is None
+
+    custom_freeze(record, converters=converters)
+    custom_freeze(record, converters=converters, options=FreezeOptions(drop_if=drop_if))
+    custom_freeze(record, converters=converters, options=FreezeOptions(max_nodes=10))
+    default, dropping, limited = contexts
+    assert isinstance(default.key_tables, dict)
+    assert default.drop_if is None
+    assert not default.limited
+    assert dropping.drop_if is drop_if
+    assert limited.limited
+
+    assert get_freeze_context(lambda child: child) == FreezeContext()
@@ -0,0 +1,85 @@
+# Copyright 2024 Kersten Henrik Breuer
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Test the frozen_diff function."""
+
+from arcticfreeze import Change, FrozenDict, freeze, frozen_diff
+
+
+def test_diff_identical():
+    """Test that no changes are reported for equal or identical structures."""
+    frozen = freeze({"a": [1, 2, {"b": 3}], "c": {1, 2}})
+
+    assert list(frozen_diff(frozen, frozen)) == []
+    assert list(frozen_diff(frozen, freeze({"a": [1, 2, {"b": 3}], "c": {1, 2}}))) == []
+
+
+def test_diff_nested_changes():
+    """Test that added, removed, and changed values are located by their path."""
+    old = freeze({"db": {"host": "a", "replicas": ["x", "y"]}, "debug": True})
+    new = freeze({"db": {"host": "b", "replicas": ["x"]}, "log": "info"})
+
+    assert list(frozen_diff(old, new)) == [
+        Change(path=("db", "host"), kind="changed", old="a", new="b"),
+        Change(path=("db", "replicas", 1), kind="removed", old="y"),
+        Change(path=("debug",), kind="removed", old=True),
+        Change(path=("log",), kind="added", new="info"),
+    ]
+
+
+def test_diff_type_changes():
+    """Test that values that compare equal but differ in type are reported and that
+    a container replaced by another kind of container is reported as a whole.
+    """
+    old = freeze({"a": 1, "b": [1]})
+    new = freeze({"a": True, "b": {"0": 1}})
+
+    assert list(frozen_diff(old, new)) == [
+        Change(path=("a",), kind="changed", old=1, new=True),
+        Change(path=("b",), kind="changed", old=(1,), new=FrozenDict({"0": 1})),
+    ]
+
+
+def test_diff_skips_shared_subtrees():
+    """Test that subtrees shared between both structures are not traversed."""
+
+    class Unequal:
+        """Fails loudly if compared."""
+
+        def __eq__(self, other):
+            raise AssertionError("shared subtree was traversed")
+
+        __hash__ = object.__hash__
+
+    shared = FrozenDict({"x": Unequal()})
+    old = FrozenDict({"shared": shared, "value": 1})
+    new = FrozenDict({"shared": shared, "value": 2})
+
+    assert [change.path for change in frozen_diff(old, new)] == [("value",)]
+
+
+def test_frozen_dict_equality_uses_cached_hash():
+    """Test that FrozenDicts with differing cached hashes compare unequal and that
+    equality with plain mappings is preserved.
+    """
+    first = FrozenDict({"a": 1})
+    second = FrozenDict({"a": 2})
+    hash(first)
+    hash(second)
+
+    assert first != second
+    assert first == FrozenDict({"a": 1})
+    assert first == {"a": 1}
+    assert {"a": 1} == first
@@ -14,10 +14,34 @@
 
 """Test the freeze function."""
 
+import collections
+import copy
+import itertools
+import sys
+from collections.abc import Sequence
+from dataclasses import replace
+from decimal import Decimal
+
 import pytest
-from arcticfreeze import freeze
+from arcticfreeze import (
+    Converter,
+    ConverterNotFoundError,
+    FreezeCache,
+    FreezeLimitExceededError,
+    FreezeOptions,
+    FrozenDict,
+    FrozenList,
+    FrozenTable,
+    freeze,
+)
 
-from tests.cases import INVALID_CASES, VALID_CASES, InvalidTestCase, ValidTestCase
+from tests.cases import (
+    INVALID_CASES,
+    STDLIB_IMMUTABLE_EXAMPLE,
+    VALID_CASES,
+    InvalidTestCase,
+    ValidTestCase,
+)
 
 
 @pytest.mark.parametrize(
@@ -39,3 +63,360 @@ def test_invalid_inputs(test_case: InvalidTestCase):
     """Test the arctic freeze function with invalid inputs."""
     with pytest.raises(test_case.expected_exception_type):
         freeze(test_case.inputs)
+
+
+@pytest.mark.parametrize("value", STDLIB_IMMUTABLE_EXAMPLE, ids=repr)
+def test_immutable_values_are_not_copied(value):
+    """Test that immutable values of the standard library are frozen as is."""
+    assert freeze(value) is value
+
+
+def test_output_types():
+    """Test that mappings and sets of the standard library are frozen to hashable
+    immutable types.
+    """
+    frozen = freeze({"a": collections.OrderedDict(b={1}), "c": collections.Counter()})
+
+    assert isinstance(frozen, FrozenDict)
+    assert type(frozen["a"]) is FrozenDict
+    assert type(frozen["a"]["b"]) is frozenset
+    assert type(frozen["c"]) is FrozenDict
+    assert hash(frozen) == hash(freeze({"a": {"b": frozenset({1})}, "c": {}}))
+
+
+@pytest.mark.parametrize(
+    ("create_iterator", "expected"),
+    [
+        (lambda: (index * 2 for index in range(3)), (0, 2, 4)),
+        (lambda: iter([[1], {2}]), ((1,), frozenset({2}))),
+        (lambda: reversed([1, 2]), (2, 1)),
+        (lambda: iter({"a": 1}.items()), (("a", 1),)),
+        (lambda: map(str, range(2)), ("0", "1")),
+        (lambda: zip("ab", [[1], [2]]), (("a", (1,)), ("b", (2,)))),
+        (lambda: enumerate("a"), ((0, "a"),)),
+        (lambda: itertools.chain([1], iter([2])), (1, 2)),
+        (lambda: itertools.islice(itertools.count(), 2), (0, 1)),
+        (lambda: iter(()), ()),
+    ],
+)
+def test_iterators(create_iterator, expected: tuple):
+    """Test that iterators (including nested ones) are consumed into tuples."""
+    assert freeze(create_iterator()) == expected
+    assert freeze({"a": create_iterator()}) == FrozenDict({"a": expected})
+    assert freeze(create_iterator(), sequence_type=FrozenList) == FrozenList(expected)
+
+
+def test_iterators_of_records():
+    """Test that iterators of records are converted to FrozenTables if requested."""
+    frozen = freeze(
+        ({"a": index, "b": [index]} for index in range(3)), sequence_type=FrozenTable
+    )
+
+    assert type(frozen) is FrozenTable
+    assert frozen == tuple(
+        FrozenDict({"a": index, "b": (index,)}) for index in range(3)
+    )
+
+
+def test_infinite_iterators_are_not_supported():
+    """Test that iterators that may be infinite are rejected instead of consumed."""
+    with pytest.raises(ConverterNotFoundError):
+        freeze(itertools.count())
+
+
+def test_iterators_wrapping_infinite_iterators_are_limited():
+    """Test that iterators wrapping infinite ones are aborted by the node limit."""
+    with pytest.raises(FreezeLimitExceededError):
+        freeze(map(str, itertools.count()), options=FreezeOptions(max_nodes=100))
+
+
+@pytest.mark.parametrize(
+    "test_case",
+    VALID_CASES,
+    ids=lambda test_case: test_case.name,
+)
+def test_consume_valid_inputs(test_case: ValidTestCase):
+    """Test that consuming the input does not change the result."""
+    inputs = copy.deepcopy(test_case.inputs)
+
+    assert (
+        freeze(inputs, options=FreezeOptions(consume=True))
+        == test_case.expected_outputs
+    )
+
+
+def test_consume():
+    """Test that nested containers are frozen in place and the object is cleared."""
+    inner = [1, {"a": [2]}]
+    obj = {"list": inner, "deque": collections.deque([[3], [4]])}
+
+    frozen = freeze(obj, options=FreezeOptions(consume=True))
+
+    assert frozen == {"list": (1, {"a": (2,)}), "deque": ((3,), (4,))}
+    assert obj == {}
+    # the caller still references the nested list, whose items were frozen:
+    assert inner == [1, frozen["list"][1]]
+
+
+def test_consume_shared_children():
+    """Test that children referenced multiple times are frozen correctly."""
+    shared = [1, [2]]
+    obj = [shared, {"a": shared}, shared]
+
+    frozen = freeze(obj, sequence_type=FrozenList, options=FreezeOptions(consume=True))
+
+    assert frozen == ((1, (2,)), {"a": (1, (2,))}, (1, (2,)))
+    assert type(frozen[0]) is FrozenList
+    assert obj == []
+
+
+def test_consume_custom_converter():
+    """Test that objects handled by custom converters are not modified."""
+    obj = [1, 2]
+    converter = Converter(input_type=list, convert=lambda obj, _: obj, priority=-200)
+
+    assert (
+        freeze(obj, add_converters=[converter], options=FreezeOptions(consume=True))
+        is obj
+    )
+    assert obj == [1, 2]
+
+
+def test_consume_with_drop_if():
+    """Test that dropped items are removed from consumed dicts, whose remaining
+    values are still frozen in place.
+    """
+    inner = {"a": [1], "b": None}
+    obj = [inner]
+
+    options = FreezeOptions(consume=True, drop_if=lambda value: value is None)
+    frozen = freeze(obj, options=options)
+
+    assert frozen == (FrozenDict({"a": (1,)}),)
+    assert obj == []
+    # the caller still references the nested dict, whose values were frozen:
+    assert inner == {"a": (1,)}
+
+
+def test_consume_with_cache():
+    """Test that consuming cannot be combined with a cache."""
+    with pytest.raises(ValueError):
+        FreezeOptions(consume=True, cache=FreezeCache())
+
+
+def test_batch_conversion():
+    """Test that runs of children handled by a converter with batch conversion are
+    converted at once in sequences, sets, mappings, and iterators.
+    """
+    batches = []
+
+    def convert_batch(objs, _):
+        batches.append(list(objs))
+        return [Decimal(obj) for obj in objs]
+
+    converter = Converter(
+        input_type=Decimal,
+        convert=lambda obj, _: Decimal(obj),
+        convert_batch=convert_batch,
+    )
+    obj = {
+        "sequence": [Decimal(1), Decimal(2), "x", Decimal(3)],
+        "mapping": {"a": Decimal(4), "b": Decimal(5)},
+        "iterator": iter([Decimal(6), Decimal(7)]),
+    }
+
+    frozen = freeze(obj, add_converters=[converter])
+
+    assert frozen == {
+        "sequence": (Decimal(1), Decimal(2), "x", Decimal(3)),
+        "mapping": {"a": Decimal(4), "b": Decimal(5)},
+        "iterator": (Decimal(6), Decimal(7)),
+    }
+    assert batches == [
+        [Decimal(1), Decimal(2)],
+        [Decimal(3)],
+        [Decimal(4), Decimal(5)],
+        [Decimal(6), Decimal(7)],
+    ]
+
+
+def test_batch_conversion_invalid_length():
+    """Test that batch conversions returning the wrong number of objects are
+    rejected.
+    """
+    converter = Converter(
+        input_type=Decimal, convert_batch=lambda objs, _: list(objs)[1:]
+    )
+
+    with pytest.raises(ValueError):
+        freeze([Decimal(1), Decimal(2)], add_converters=[converter])
+
+
+def _parse_number(value):
+    return int(value) if isinstance(value, str) and value.isdigit() else value
+
+
+def test_transforms():
+    """Test that keys and values are transformed and items are dropped within
+    freezing.
+    """
+    obj = {"Name": "x", "Count": "12", "Tags": ["1", "a"], "Missing": None, 3: "4"}
+
+    options = FreezeOptions(
+        key_transform=lambda key: key.lower() if isinstance(key, str) else key,
+        value_transform=_parse_number,
+        drop_if=lambda value: value is None,
+    )
+    frozen = freeze(obj, options=options)
+
+    assert frozen == FrozenDict({"name": "x", "count": 12, "tags": (1, "a"), 3: 4})
+    assert obj["Count"] == "12"
+
+
+def test_value_transform_is_not_applied_to_keys():
+    """Test that keys are only passed to the key transform."""
+    transformed = []
+
+    def value_transform(value):
+        transformed.append(value)
+        return value
+
+    options = FreezeOptions(value_transform=value_transform)
+    assert freeze({"1": "2"}, options=options) == FrozenDict({"1": "2"})
+    assert transformed == [{"1": "2"}, "2"]
+
+
+def test_value_transform_changes_type():
+    """Test that the converter is resolved for the transformed object."""
+    options = FreezeOptions(
+        value_transform=lambda value: (
+            [value.real, value.imag] if isinstance(value, complex) else value
+        ),
+    )
+    frozen = freeze({"a": 1 + 2j}, options=options)
+
+    assert frozen == FrozenDict({"a": (1.0, 2.0)})
+
+
+def test_colliding_keys():
+    """Test that the last item wins if transformed keys collide."""
+    frozen = freeze({"a": 1, "A": 2}, options=FreezeOptions(key_transform=str.lower))
+
+    assert frozen == FrozenDict({"a": 2})
+
+
+def test_intern_keys():
+    """Test that string keys are interned (after transforming them)."""
+    key = "".join(["long ", "key"])
+    assert key is not sys.intern("long key")
+
+    frozen = freeze([{key: 1}], options=FreezeOptions(intern_keys=True))
+    assert isinstance(frozen, tuple)
+    assert next(iter(frozen[0])) is sys.intern("long key")
+
+    options = FreezeOptions(key_transform=str.lower, intern_keys=True)
+    frozen = freeze({key.upper(): 1}, options=options)
+    assert isinstance(frozen, FrozenDict)
+    assert next(iter(frozen)) is sys.intern("long key")
+
+
+@pytest.mark.parametrize(
+    "sequence_type",
+    [tuple, FrozenList, FrozenTable],
+)
+def test_transforms_of_records(sequence_type: type):
+    """Test that the transforms are applied to records of all sequence types."""
+    records = [{"A": "1", "B": None}, {"A": "2", "B": "x"}]
+
+    options = FreezeOptions(
+        key_transform=str.lower,
+        value_transform=_parse_number,
+        drop_if=lambda value: value is None,
+    )
+    frozen = freeze(records, sequence_type=sequence_type, options=options)
+
+    assert isinstance(frozen, Sequence)
+    assert list(frozen) == [FrozenDict({"a": 1}), FrozenDict({"a": 2, "b": "x"})]
+
+
+def test_transformed_table_columns():
+    """Test that FrozenTables get transformed column names unless they collide."""
+    records = [{"A": 1, "b": 2}, {"A": 3, "b": 4}]
+
+    options = FreezeOptions(key_transform=str.lower)
+    frozen = freeze(records, sequence_type=FrozenTable, options=options)
+    assert type(frozen) is FrozenTable
+    assert frozen.column_names == ("a", "b")
+
+    options = FreezeOptions(key_transform=lambda _: "k")
+    frozen = freeze(records, sequence_type=FrozenTable, options=options)
+    assert frozen == (FrozenDict({"k": 2}), FrozenDict({"k": 4}))
+
+
+def test_value_transform_of_table():
+    """Test that the value transform is applied to the records of FrozenTables and
+    their values.
+    """
+    records = [{"a": "1", "b": "x"}, {"a": "2", "b": "y"}]
+    options = FreezeOptions(value_transform=_parse_number)
+
+    frozen = freeze(records, sequence_type=FrozenTable, options=options)
+    assert type(frozen) is FrozenTable
+    assert list(frozen) == [{"a": 1, "b": "x"}, {"a": 2, "b": "y"}]
+
+    options = FreezeOptions(
+        value_transform=lambda value: (
+            {"a": value["a"]} if isinstance(value, dict) else value
+        )
+    )
+    frozen = freeze(records, sequence_type=FrozenTable, options=options)
+    assert type(frozen) is FrozenTable
+    assert frozen.column_names == ("a",)
+
+
+def test_value_transform_of_table_is_applied_once():
+    """Test that the value transform is applied once per object if the sequence is
+    not converted to a FrozenTable.
+    """
+    transformed = []
+
+    def value_transform(value):
+        transformed.append(value)
+        return value
+
+    options = FreezeOptions(value_transform=value_transform)
+    assert freeze([1, 2], sequence_type=FrozenTable, options=options) == (1, 2)
+    assert transformed == [[1, 2], 1, 2]
+
+
+def test_transforms_with_other_options():
+    """Test that the transforms are supported with limits, projections, batch
+    converters, and caches.
+    """
+    obj = {"A": {"B": "1", "C": None}, "D": "2"}
+    options = FreezeOptions(
+        key_transform=str.lower,
+        value_transform=_parse_number,
+        drop_if=lambda value: value is None,
+    )
+    expected = FrozenDict({"a": {"b": 1}, "d": 2})
+
+    assert freeze(obj, options=replace(options, max_nodes=10)) == expected
+    assert freeze(obj, options=replace(options, include=["A", "D"])) == expected
+    assert freeze(obj, options=replace(options, exclude=["A.C"])) == expected
+    assert freeze(obj, options=replace(options, include=["A.B"])) == FrozenDict(
+        {"a": {"b": 1}}
+    )
+
+    converter = Converter(
+        input_type=Decimal, convert_batch=lambda objs, _: [obj + 1 for obj in objs]
+    )
+    assert freeze([Decimal(1)], add_converters=[converter], options=options) == (
+        Decimal(1),
+    )
+
+    cache = FreezeCache()
+    assert freeze(obj, options=replace(options, cache=cache)) == expected
+    assert freeze(obj, options=FreezeOptions(cache=cache)) == FrozenDict(
+        {"A": {"B": "1", "C": None}, "D": "2"}
+    )
@@ -0,0 +1,275 @@
+# Copyright 2024 Kersten Henrik Breuer
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Test the FrozenDict class independent of the Pydantic integration."""
+
+import pickle
+import tracemalloc
+
+import pytest
+from arcticfreeze import FrozenDict, freeze
+from arcticfreeze._internal.frozendict import SMALL_SIZE_THRESHOLD
+
+SIZES = (0, 1, SMALL_SIZE_THRESHOLD, SMALL_SIZE_THRESHOLD + 1, 100)
+
+
+def make_dict(size: int) -> dict:
+    """Create a dict of the given size."""
+    return {f"key{index}": index for index in range(size)}
+
+
+def freeze_sharing_keys(reference: dict) -> FrozenDict:
+    """Create a FrozenDict sharing its keys with another one."""
+    frozen = freeze([reference, dict(reference)])
+    assert isinstance(frozen, tuple)
+    first, second = frozen
+    assert first._keys is second._keys is not None
+    return second
+
+
+@pytest.mark.parametrize("create", [FrozenDict, freeze_sharing_keys])
+@pytest.mark.parametrize("size", SIZES)
+def test_mapping_interface(size: int, create):
+    """Test that FrozenDicts of all sizes and layouts behave like the dict they were
+    created from.
+    """
+    reference = make_dict(size)
+    frozen = create(reference)
+
+    assert len(frozen) == size
+    assert list(frozen) == list(reference)
+    assert list(frozen.keys()) == list(reference.keys())
+    assert list(frozen.values()) == list(reference.values())
+    assert list(frozen.items()) == list(reference.items())
+    assert frozen.items() == reference.items()
+    for key, value in reference.items():
+        assert key in frozen
+        assert frozen[key] == value
+        assert frozen.get(key) == value
+    assert "missing" not in frozen
+    assert frozen.get("missing", 42) == 42
+    with pytest.raises(KeyError):
+        frozen["missing"]
+
+
+@pytest.mark.parametrize("create", [FrozenDict, freeze_sharing_keys])
+@pytest.mark.parametrize("size", SIZES)
+def test_equality_and_hash(size: int, create):
+    """Test equality and hashing across different orders, layouts, and input
+    types.
+    """
+    reference = make_dict(size)
+    frozen = create(reference)
+    reversed_frozen = FrozenDict(dict(reversed(reference.items())))
+
+    assert frozen == reversed_frozen
+    assert hash(frozen) == hash(reversed_frozen)
+    assert frozen == FrozenDict(reference)
+    assert frozen != create({**reference, "key0": -1})
+    assert frozen == reference
+    assert reference == frozen
+    assert frozen != FrozenDict({**reference, "other": 1})
+    assert frozen != [1]
+
+
+def test_shared_keys():
+    """Test that same-shaped mappings frozen together share their keys."""
+    records = freeze(
+        [
+            {"a": 1, "b": 2},
+            {"a": 3, "b": 4},
+            {"b": 5, "a": 6},
+            {1: "x"},
+            {1: "y"},
+        ]
+    )
+
+    assert isinstance(records, tuple)
+    assert records[0]._keys is records[1]._keys
+    assert records[0]._keys is not records[2]._keys
+    assert list(records[2]) == ["b", "a"]
+    # only string keys are shared:
+    assert records[3]._keys is None
+    assert records[3] == {True: "x"}
+    assert pickle.loads(pickle.dumps(records[0])) == records[0]
+
+
+def test_memory_per_instance_sharing_keys():
+    """Test that records sharing their keys need less than half the memory of
+    separate FrozenDicts.
+    """
+    reference = make_dict(SMALL_SIZE_THRESHOLD + 4)
+    records = [dict.fromkeys(reference, index) for index in range(1000)]
+
+    def measure(factory) -> int:
+        tracemalloc.start()
+        instances = factory(records)
+        allocated, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del instances
+        return allocated
+
+    assert measure(freeze) < 0.5 * measure(lambda obj: list(map(FrozenDict, obj)))
+
+
+class EqualToAll:
+    """An object comparing equal to all other objects but having its own hash."""
+
+    def __eq__(self, other: object) -> bool:
+        """Compare equal to everything."""
+        return True
+
+    def __hash__(self) -> int:
+        """Hash by identity."""
+        return id(self)
+
+
+@pytest.mark.parametrize("create", [FrozenDict, freeze_sharing_keys])
+@pytest.mark.parametrize("size", SIZES)
+def test_key_lookup_uses_hash(size: int, create):
+    """Test that keys are looked up by hash and equality in all layouts, like in a
+    dict, which rejects unhashable keys.
+    """
+    frozen = create(make_dict(size))
+    key = EqualToAll()
+
+    assert key not in frozen
+    assert frozen.get(key) is None
+    with pytest.raises(KeyError):
+        frozen[key]
+    with pytest.raises(TypeError):
+        [] in frozen  # noqa: B015
+    with pytest.raises(TypeError):
+        frozen.get([])
+    with pytest.raises(TypeError):
+        frozen[[]]
+
+
+def test_equal_keys_of_different_type():
+    """Test that keys are matched like in a dict."""
+    frozen: FrozenDict = FrozenDict({1: "a"})
+
+    assert frozen[True] == "a"
+    assert frozen[1.0] == "a"
+    assert FrozenDict({1: "a"}) == FrozenDict({1.0: "a"})
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_pickle(size: int):
+    """Test pickling and unpickling."""
+    frozen = FrozenDict(make_dict(size))
+
+    assert pickle.loads(pickle.dumps(frozen)) == frozen
+
+
+def test_copy_shares_storage():
+    """Test that constructing a FrozenDict from another one is cheap."""
+    frozen = FrozenDict(make_dict(3))
+    copied = FrozenDict(frozen)
+
+    assert copied == frozen
+    assert copied._items is frozen._items
+
+
+def test_immutability():
+    """Test that the content cannot be modified."""
+    frozen = FrozenDict(a=1)
+
+    with pytest.raises(TypeError):
+        frozen["a"] = 2  # type: ignore
+    with pytest.raises(TypeError):
+        frozen |= {"b": 2}
+    with pytest.raises(AttributeError):
+        frozen.other = 1  # type: ignore
+
+
+def test_derived_copies():
+    """Test the methods returning modified copies."""
+    frozen = FrozenDict(a=1, b=2)
+
+    assert frozen.set("c", 3) == {"a": 1, "b": 2, "c": 3}
+    assert frozen.delete("a") == {"b": 2}
+    assert frozen.discard("missing") is frozen
+    assert frozen.update({"a": 3}) == {"a": 3, "b": 2}
+    assert frozen | {"c": 3} == FrozenDict(a=1, b=2, c=3)
+    assert {"c": 3} | frozen == {"c": 3, "a": 1, "b": 2}
+    assert FrozenDict.fromkeys(["a", "b"]) == {"a": None, "b": None}
+    assert repr(frozen) == "FrozenDict({'a': 1, 'b': 2})"
+    assert frozen == {"a": 1, "b": 2}
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_builder(size: int):
+    """Test building a FrozenDict in place."""
+    builder = FrozenDict.builder(make_dict(size))
+    builder["extra"] = 1
+    builder.update(other=2)
+    del builder["other"]
+
+    assert len(builder) == size + 1
+    assert builder["extra"] == 1
+    assert "other" not in builder
+    assert builder.pop("extra") == 1
+
+    frozen = builder.freeze()
+
+    assert type(frozen) is FrozenDict
+    assert frozen == make_dict(size)
+
+
+def test_builder_takes_over_storage():
+    """Test that freezing a builder does not copy large dicts."""
+    builder = FrozenDict.builder()
+    builder.update(make_dict(SMALL_SIZE_THRESHOLD + 1))
+    storage = builder._dict
+
+    assert builder.freeze()._dict is storage
+
+
+def test_builder_sealed():
+    """Test that a builder cannot be used after freezing it."""
+    builder = FrozenDict.builder(a=1)
+    frozen = builder.freeze()
+
+    for use in (
+        lambda: builder.__setitem__("a", 2),
+        lambda: builder.update(b=2),
+        lambda: builder["a"],
+        lambda: len(builder),
+        builder.freeze,
+    ):
+        with pytest.raises(TypeError):
+            use()
+    assert frozen == {"a": 1}
+    assert repr(builder) == "<frozen FrozenDictBuilder>"
+    with pytest.raises(TypeError):
+        FrozenDict.builder()[[1]] = 2
+
+
+def test_memory_per_instance():
+    """Test that small FrozenDicts need considerably less memory than the
+    immutabledict class that FrozenDict was based on before.
+    """
+    immutabledict = pytest.importorskip("immutabledict").immutabledict
+
+    def measure(factory) -> int:
+        tracemalloc.start()
+        instances = [factory({"a": index, "b": index}) for index in range(1000)]
+        allocated, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del instances
+        return allocated
+
+    assert measure(FrozenDict) < 0.75 * measure(immutabledict)
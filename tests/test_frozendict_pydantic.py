@@ -15,11 +15,11 @@
 """Test the Pydantic integration of the FrozenDict class."""
 
 import json
-from typing import Any
+from typing import Annotated, Any
 
 import pydantic
 import pytest
-from arcticfreeze import FrozenDict
+from arcticfreeze import FrozenDict, FrozenList, ValidationCache
 from pydantic import BaseModel, ConfigDict
 
 
@@ -183,3 +183,87 @@ def test_frozen_dict_serialization_when_not_announced():
     expected_json_output = [{"a": [1, 2]}]
     observed_json_output = json.loads(dumped_json)["frozen_tuple"]
     assert observed_json_output == expected_json_output
+
+
+def test_validation_cache():
+    """Test that validating the same frozen input repeatedly is cached."""
+    cache = ValidationCache(maxsize=4)
+
+    class TestModel(BaseModel):
+        config: Annotated[FrozenDict[str, int], cache]
+        other: Annotated[FrozenDict[str, str], cache] = FrozenDict()
+
+    config: Any = FrozenDict(a="1")
+    first = TestModel(config=config)
+    second = TestModel.model_validate({"config": config})
+
+    assert first.config == {"a": 1}
+    assert second.config is first.config
+    assert (cache.hits, cache.misses) == (1, 1)
+    # the results are cached per annotated type:
+    assert TestModel(config=config, other=config).other == {"a": "1"}
+    assert json.loads(second.model_dump_json()) == {"config": {"a": 1}, "other": {}}
+
+
+@pytest.mark.parametrize(
+    "config",
+    [{"a": [1]}, FrozenDict(a=[1]), FrozenDict(a=FrozenDict())],
+    ids=["mutable", "unhashable", "invalid"],
+)
+def test_validation_cache_skipped(config: Any):
+    """Test that mutable, unhashable, and invalid inputs are not cached."""
+    cache = ValidationCache()
+
+    class TestModel(BaseModel):
+        config: Annotated[FrozenDict[str, list], cache]
+
+    for _ in range(2):
+        try:
+            TestModel(config=config)
+        except pydantic.ValidationError:
+            pass
+
+    assert len(cache) == 0
+
+
+def test_validation_cache_mutable_results():
+    """Test that mutable results are not shared, unlike immutable ones."""
+    cache = ValidationCache()
+
+    class Item(BaseModel):
+        name: str
+
+    class FrozenItem(BaseModel):
+        model_config = ConfigDict(frozen=True)
+
+        name: str
+
+    class TestModel(BaseModel):
+        items: Annotated[tuple[Item, ...], cache]
+        frozen_items: Annotated[tuple[FrozenItem, ...], cache] = ()
+
+    items: Any = (FrozenDict(name="a"),)
+    first = TestModel(items=items, frozen_items=items)
+    second = TestModel(items=items, frozen_items=items)
+
+    first.items[0].name = "b"
+    assert second.items[0].name == "a"
+    assert second.frozen_items is first.frozen_items
+    assert len(cache) == 1
+
+
+def test_validation_cache_eviction():
+    """Test that entries are evicted and removed once the input is collected."""
+    cache = ValidationCache(maxsize=2)
+
+    class TestModel(BaseModel):
+        items: Annotated[FrozenList[int], cache]
+
+    inputs = [FrozenList([index]) for index in range(3)]
+    for items in inputs:
+        TestModel(items=items)
+    del items
+
+    assert len(cache) == 2
+    del inputs[2]
+    assert len(cache) == 1
@@ -0,0 +1,173 @@
+# Copyright 2024 Kersten Henrik Breuer
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Test the FrozenList class and its Pydantic integration."""
+
+import collections
+import json
+import pickle
+
+import pydantic
+import pytest
+from arcticfreeze import (
+    FrozenDict,
+    FrozenList,
+    freeze,
+    frozen_diff,
+    index_paths,
+    refreeze,
+)
+from pydantic import BaseModel
+
+SLICES = (
+    slice(None),
+    slice(2, 7),
+    slice(None, None, 3),
+    slice(-3, None),
+    slice(8, 2, -2),
+    slice(5, 5),
+    slice(20, 30),
+)
+
+
+@pytest.mark.parametrize("slice_", SLICES)
+def test_slicing(slice_):
+    """Test that slicing (including slicing of views) behaves like for tuples."""
+    items = tuple(range(10))
+    frozen = FrozenList(items)
+
+    view = frozen[slice_]
+
+    assert isinstance(view, FrozenList)
+    assert view == items[slice_]
+    assert tuple(view) == items[slice_]
+    assert len(view) == len(items[slice_])
+    for nested in SLICES:
+        assert view[nested] == items[slice_][nested]
+
+
+def test_slicing_shares_storage():
+    """Test that slicing does not copy the items."""
+    frozen = FrozenList(range(100))
+
+    view = frozen[10:90][5:10]
+
+    assert view._items is frozen._items
+    assert view[0] == 15
+    assert view[-1] == 19
+    with pytest.raises(IndexError):
+        view[5]
+
+
+def test_equality_and_hash():
+    """Test that FrozenLists compare equal to tuples and other FrozenLists."""
+    frozen = FrozenList([1, 2, 3])
+
+    assert frozen == (1, 2, 3)
+    assert (1, 2, 3) == frozen
+    assert frozen == FrozenList((0, 1, 2, 3))[1:]
+    assert frozen != FrozenList([1, 2])
+    assert frozen != [1, 2, 3]
+    assert hash(frozen) == hash((1, 2, 3)) == hash(FrozenList((0, 1, 2, 3))[1:])
+    lookup: dict[object, str] = {frozen: "value"}
+    assert lookup[(1, 2, 3)] == "value"
+
+
+def test_sequence_methods():
+    """Test the methods provided by the Sequence base class."""
+    view = FrozenList("abcabc")[1:]
+
+    assert "a" in view
+    assert "x" not in view
+    assert view.index("c") == 1
+    assert view.count("b") == 2
+    assert list(reversed(view)) == list("cbacb")
+    assert repr(view) == "FrozenList(['b', 'c', 'a', 'b', 'c'])"
+
+
+def test_pickle():
+    """Test that only the items of a view are pickled."""
+    view = FrozenList(range(1000))[10:12]
+
+    unpickled = pickle.loads(pickle.dumps(view))
+
+    assert unpickled == view
+    assert len(unpickled._items) == 2
+
+
+def test_freeze_sequence_type():
+    """Test that lists and deques are frozen to FrozenLists if requested."""
+    obj = {"a": [1, [2, 3]], "b": collections.deque([4]), "c": (5,)}
+
+    frozen = freeze(obj, sequence_type=FrozenList)
+
+    assert isinstance(frozen, FrozenDict)
+    assert type(frozen["a"]) is FrozenList
+    assert type(frozen["a"][1]) is FrozenList
+    assert type(frozen["b"]) is FrozenList
+    assert type(frozen["c"]) is tuple
+    assert frozen == freeze(obj)
+    assert freeze(frozen) == frozen
+
+
+def test_freeze_sequence_type_invalid():
+    """Test that other sequence types are rejected."""
+    with pytest.raises(ValueError):
+        freeze([1], sequence_type=list)
+
+
+def test_refreeze_sequence_type():
+    """Test that unchanged FrozenLists are reused by refreeze."""
+    obj: dict = {"a": [1, 2], "b": [[3]]}
+    previous = freeze(obj, sequence_type=FrozenList)
+
+    obj["b"][0].append(4)
+    current = refreeze(obj, previous, sequence_type=FrozenList)
+
+    assert isinstance(previous, FrozenDict)
+    assert isinstance(current, FrozenDict)
+    assert current["a"] is previous["a"]
+    assert type(current["b"]) is FrozenList
+    assert current["b"] == ((3, 4),)
+    assert refreeze(obj, current, sequence_type=FrozenList) is current
+
+
+def test_diff_and_index():
+    """Test that FrozenLists are walked like tuples by frozen_diff and index_paths."""
+    old = freeze({"a": [1, 2]}, sequence_type=FrozenList)
+    new = freeze({"a": [1, 3, 4]}, sequence_type=FrozenList)
+
+    assert [(change.path, change.kind) for change in frozen_diff(old, new)] == [
+        (("a", 1), "changed"),
+        (("a", 2), "added"),
+    ]
+    assert index_paths(new)["a.2"] == 4
+
+
+def test_pydantic_validation_and_serialization():
+    """Test FrozenList fields in pydantic models."""
+
+    class TestModel(BaseModel):
+        items: FrozenList[int]
+
+    model = TestModel.model_validate({"items": ["1", 2]})
+
+    assert type(model.items) is FrozenList
+    assert model.items == (1, 2)
+    assert model.model_dump() == {"items": (1, 2)}
+    assert json.loads(model.model_dump_json()) == {"items": [1, 2]}
+    assert TestModel.model_validate_json('{"items": [3]}').items == (3,)
+    with pytest.raises(pydantic.ValidationError):
+        TestModel.model_validate({"items": ["invalid"]})
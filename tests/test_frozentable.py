@@ -0,0 +1,204 @@
+# Copyright 2024 Kersten Henrik Breuer
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Test the FrozenTable class and freezing sequences of records to it."""
+
+import collections
+import pickle
+from array import array
+
+import pytest
+from arcticfreeze import (
+    FrozenDict,
+    FrozenTable,
+    content_digest,
+    freeze,
+    frozen_diff,
+    index_paths,
+    measure_memory,
+)
+
+RECORDS = [
+    {"name": "a", "price": 1.5, "count": 1, "tags": ["x"]},
+    {"name": "b", "price": 2.5, "count": 2, "tags": []},
+    {"name": "c", "price": 0.5, "count": 3, "tags": ["y", "z"]},
+]
+
+
+def test_freeze_records():
+    """Test that sequences of records are frozen to FrozenTables if requested."""
+    frozen = freeze({"rows": RECORDS}, sequence_type=FrozenTable)
+    assert isinstance(frozen, FrozenDict)
+    table = frozen["rows"]
+
+    assert type(table) is FrozenTable
+    assert len(table) == 3
+    assert table.column_names == ("name", "price", "count", "tags")
+    assert table[1] == {"name": "b", "price": 2.5, "count": 2, "tags": ()}
+    assert table[-1]["tags"] == ("y", "z")
+    assert next(iter(table[0].items())) == ("name", "a")
+    assert frozen == freeze({"rows": RECORDS})
+    assert freeze(frozen, sequence_type=FrozenTable) == frozen
+
+
+@pytest.mark.parametrize(
+    "obj",
+    (
+        [],
+        [1, 2],
+        [{"a": 1}, {"b": 1}],
+        [{"a": 1, "b": 2}, {"b": 2, "a": 1}],
+        [{"a": 1}, FrozenDict({"a": 1})],
+        [{1: "a"}],
+    ),
+)
+def test_freeze_other_sequences(obj):
+    """Test that sequences which are no homogeneous records are frozen to tuples."""
+    frozen = freeze(obj, sequence_type=FrozenTable)
+
+    assert type(frozen) is tuple
+    assert frozen == freeze(obj)
+
+
+def test_freeze_deque():
+    """Test that deques of records are frozen to FrozenTables as well."""
+    frozen = freeze(collections.deque(RECORDS), sequence_type=FrozenTable)
+
+    assert type(frozen) is FrozenTable
+    assert frozen == freeze(RECORDS)
+
+
+def test_columns():
+    """Test that columns of ints and floats are stored as arrays."""
+    table = freeze(RECORDS, sequence_type=FrozenTable)
+
+    assert isinstance(table, FrozenTable)
+    assert table.column("name") == ("a", "b", "c")
+    assert table.column("tags") == (("x",), (), ("y", "z"))
+    assert isinstance(table._columns[1], array)
+    assert isinstance(table._columns[2], array)
+    assert sum(table.column("price")) == 4.5
+    counts = table.column("count")
+    assert isinstance(counts, memoryview)
+    assert counts.tolist() == [1, 2, 3]
+    assert counts.readonly
+    with pytest.raises(TypeError):
+        counts[0] = 5
+    with pytest.raises(KeyError):
+        table.column("missing")
+
+
+def test_columns_of_mixed_types():
+    """Test that columns of bools, big ints, or mixed types are stored as tuples."""
+    table = FrozenTable(
+        [
+            {"flag": True, "big": 2**70, "mixed": 1},
+            {"flag": False, "big": 1, "mixed": 1.0},
+        ]
+    )
+
+    assert table._columns == ((True, False), (2**70, 1), (1, 1.0))
+    assert type(table[0]["flag"]) is bool
+
+
+def test_create():
+    """Test creating FrozenTables from records."""
+    assert FrozenTable() == ()
+    assert len(FrozenTable([{}, {}])) == 2
+    assert FrozenTable([{}, {}]).to_records() == (FrozenDict(), FrozenDict())
+    with pytest.raises(ValueError):
+        FrozenTable([{"a": 1}, {"a": 1, "b": 2}])
+
+
+def test_rows():
+    """Test that rows behave like FrozenDicts."""
+    table = freeze(RECORDS, sequence_type=FrozenTable)
+    record = freeze(RECORDS[2])
+    assert isinstance(table, FrozenTable)
+    assert isinstance(record, FrozenDict)
+
+    row = table[2]
+
+    assert row == record
+    assert record == row
+    assert hash(row) == hash(record)
+    assert dict(row) == dict(record)
+    assert len(row) == 4
+    assert "price" in row
+    assert row.get("missing") is None
+    assert row.to_frozen_dict() == record
+    assert type(row.to_frozen_dict()) is FrozenDict
+    with pytest.raises(KeyError):
+        row["missing"]
+    with pytest.raises(IndexError):
+        table[3]
+
+
+def test_slicing():
+    """Test that slicing returns FrozenTables."""
+    table = freeze(RECORDS, sequence_type=FrozenTable)
+
+    assert isinstance(table, FrozenTable)
+    assert type(table[1:]) is FrozenTable
+    assert table[1:] == freeze(RECORDS[1:])
+    assert table[::-2] == freeze(RECORDS[::-2])
+    assert table[5:] == ()
+
+
+def test_equality_and_hash():
+    """Test that FrozenTables compare equal to tuples of FrozenDicts."""
+    table = freeze(RECORDS, sequence_type=FrozenTable)
+    records = freeze(RECORDS)
+    assert isinstance(table, FrozenTable)
+    assert isinstance(records, tuple)
+
+    assert table == records
+    assert records == table
+    assert table == table.to_records()
+    assert table.to_records() == records
+    assert all(type(record) is FrozenDict for record in table.to_records())
+    assert hash(table) == hash(records)
+    assert table == FrozenTable(records)
+    assert table != table[1:]
+    assert table != FrozenTable([{"name": "a"}])
+    assert table != list(records)
+
+
+def test_pickle():
+    """Test that FrozenTables can be pickled."""
+    table = freeze(RECORDS, sequence_type=FrozenTable)
+
+    unpickled = pickle.loads(pickle.dumps(table))
+
+    assert type(unpickled) is FrozenTable
+    assert unpickled == table
+
+
+def test_integrations():
+    """Test that FrozenTables are handled like tuples of FrozenDicts by other
+    functions of this package.
+    """
+    old = freeze(RECORDS, sequence_type=FrozenTable)
+    new = freeze([*RECORDS[:2], {**RECORDS[2], "count": 4}], sequence_type=FrozenTable)
+
+    assert [change.path for change in frozen_diff(old, new)] == [(2, "count")]
+    assert index_paths(new)["2.count"] == 4
+    assert content_digest(old) == content_digest(freeze(RECORDS))
+    assert content_digest(new) != content_digest(old)
+    assert (
+        0
+        < measure_memory(old).total_bytes
+        < measure_memory(freeze(RECORDS)).total_bytes
+    )
@@ -0,0 +1,79 @@
+# Copyright 2024 Kersten Henrik Breuer
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Test that importing the package stays cheap."""
+
+import subprocess
+import sys
+
+import pytest
+
+# modules that are expensive to import and only needed for optional functionality:
+LAZILY_IMPORTED_MODULES = (
+    "pydantic",
+    "pydantic_core",
+    "importlib.metadata",
+    "decimal",
+    "fractions",
+    "uuid",
+    "pathlib",
+    "hashlib",
+)
+
+
+def get_imported_modules(statement: str) -> set[str]:
+    """Execute the statement in a fresh interpreter and collect the names of all
+    modules imported in the process using `python -X importtime`.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return {
+        line.rsplit("|", 1)[-1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:")
+    }
+
+
+def test_import_time_baseline():
+    """Make sure that the optional modules are not already imported at interpreter
+    startup, otherwise the following tests would be meaningless.
+    """
+    imported_modules = get_imported_modules("pass")
+
+    assert imported_modules.isdisjoint(LAZILY_IMPORTED_MODULES)
+
+
+@pytest.mark.parametrize("module", LAZILY_IMPORTED_MODULES)
+def test_import_is_lazy(module: str):
+    """Test that importing the package and freezing an object does not import
+    expensive modules that are only needed for optional functionality.
+    """
+    imported_modules = get_imported_modules(
+        "import arcticfreeze; arcticfreeze.freeze({'a': [1, 2]})"
+    )
+
+    assert "arcticfreeze" in imported_modules
+    assert module not in imported_modules
+
+
+def test_version_is_lazy():
+    """Test that the version is still available."""
+    import arcticfreeze
+
+    assert isinstance(arcticfreeze.__version__, str)
@@ -0,0 +1,123 @@
+# Copyright 2024 Kersten Henrik Breuer
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Test the path index of frozen data structures."""
+
+import pytest
+from arcticfreeze import (
+    FrozenDict,
+    FrozenIndex,
+    FrozenList,
+    FrozenTable,
+    freeze,
+    index_paths,
+)
+from arcticfreeze._internal import index as index_module
+
+EXAMPLE = freeze(
+    {
+        "db": {
+            "replicas": [{"host": "a", "port": 1}, {"host": "b", "port": 2}],
+            "host": "main",
+        },
+        "dbx": 1,
+    }
+)
+
+
+def test_index_lookup():
+    """Test lookups of leaves and intermediate containers by path."""
+    index = index_paths(EXAMPLE)
+
+    assert index["db.replicas.1.host"] == "b"
+    assert index["db.replicas.0"] == FrozenDict({"host": "a", "port": 1})
+    assert index.get("db.missing") is None
+    assert "db.host" in index
+    with pytest.raises(KeyError):
+        index["db.replicas.2"]
+
+
+def test_index_custom_separator():
+    """Test indexing using a custom separator."""
+    index = index_paths(EXAMPLE, separator="/")
+
+    assert index["db/replicas/0/port"] == 1
+
+
+@pytest.mark.parametrize("sequence_type", [tuple, FrozenList, FrozenTable])
+def test_index_cached_per_root(sequence_type: type):
+    """Test that the index is cached per root for all frozen container types."""
+    assert index_paths(EXAMPLE) is index_paths(EXAMPLE)
+    assert index_paths(EXAMPLE) is not index_paths(freeze({"a": 1}))
+    assert index_paths(EXAMPLE) is not index_paths(EXAMPLE, separator="/")
+
+    records = [{"a": 1}, {"a": 2}]
+    root = freeze(records, sequence_type=sequence_type)
+    assert type(root) is sequence_type
+    assert index_paths(root) is index_paths(root)
+    # equal roots are not identical, e.g. `(1,)` and `(True,)`:
+    assert index_paths(root) is not index_paths(freeze(records))
+
+
+def test_index_prefix():
+    """Test prefix queries."""
+    index = index_paths(EXAMPLE)
+
+    assert index.prefix("db.replicas.0") == FrozenDict(
+        {
+            "db.replicas.0": FrozenDict({"host": "a", "port": 1}),
+            "db.replicas.0.host": "a",
+            "db.replicas.0.port": 1,
+        }
+    )
+    assert "dbx" not in index.prefix("db")
+    assert len(index.prefix("")) == len(index)
+    assert index.prefix("missing") == FrozenDict()
+
+
+def test_index_glob():
+    """Test glob queries."""
+    index = index_paths(EXAMPLE)
+
+    assert index.glob("*.host") == FrozenDict(
+        {"db.host": "main", "db.replicas.0.host": "a", "db.replicas.1.host": "b"}
+    )
+    assert index.glob("db.replicas.?.port") == FrozenDict(
+        {"db.replicas.0.port": 1, "db.replicas.1.port": 2}
+    )
+
+
+def test_index_glob_caches_are_bounded():
+    """Test that the caches of compiled patterns and glob results are bounded."""
+    index = FrozenIndex(EXAMPLE)
+    size = index_module.GLOB_RESULT_CACHE_SIZE
+
+    for number in range(size + 1):
+        assert index.glob(f"missing.{number}") == FrozenDict()
+
+    assert index.glob(f"missing.{size}") is index.glob(f"missing.{size}")
+    assert len(index._glob_cache) == size
+    assert "missing.0" not in index._glob_cache
+    assert index_module._compile_glob.cache_info().maxsize == (
+        index_module.GLOB_PATTERN_CACHE_SIZE
+    )
+
+
+def test_index_tuple_root():
+    """Test indexing a non-mapping root."""
+    index = FrozenIndex(freeze([{"a": 1}]))
+
+    assert index["0.a"] == 1
+    assert index.root == ({"a": 1},)
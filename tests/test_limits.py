@@ -0,0 +1,142 @@
+# Copyright 2024 Kersten Henrik Breuer
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Test limiting the resources used for freezing."""
+
+import sys
+
+import pytest
+from arcticfreeze import (
+    Converter,
+    FreezeCache,
+    FreezeLimitExceededError,
+    FreezeOptions,
+    FrozenTable,
+    freeze,
+)
+
+
+def _nested(depth):
+    obj: list = []
+    for _ in range(depth - 1):
+        obj = [obj]
+    return obj
+
+
+@pytest.mark.parametrize(
+    ("obj", "max_nodes"),
+    [
+        (1, 1),
+        ([1, 2], 3),
+        ({"a": [1]}, 4),
+    ],
+)
+def test_max_nodes(obj, max_nodes):
+    """Test that the number of nodes including mapping keys is limited."""
+    assert freeze(obj, options=FreezeOptions(max_nodes=max_nodes)) == freeze(obj)
+    with pytest.raises(FreezeLimitExceededError) as exc_info:
+        freeze(obj, options=FreezeOptions(max_nodes=max_nodes - 1))
+    assert exc_info.value.limit == "max_nodes"
+    assert exc_info.value.maximum == max_nodes - 1
+
+
+def test_max_depth():
+    """Test that the nesting depth is limited."""
+    assert freeze(_nested(10), options=FreezeOptions(max_depth=10)) == freeze(
+        _nested(10)
+    )
+    with pytest.raises(FreezeLimitExceededError) as exc_info:
+        freeze(_nested(11), options=FreezeOptions(max_depth=10))
+    assert exc_info.value.limit == "max_depth"
+
+
+def test_max_depth_prevents_recursion_error():
+    """Test that deeply nested input is rejected before hitting the recursion
+    limit.
+    """
+    obj = _nested(sys.getrecursionlimit() * 2)
+    with pytest.raises(FreezeLimitExceededError):
+        freeze(obj, options=FreezeOptions(max_depth=100))
+
+
+def test_max_bytes():
+    """Test that the estimated size is limited."""
+    obj = ["x" * 1000, "y" * 1000]
+    size = sum(map(sys.getsizeof, (obj, *obj)))
+
+    assert freeze(obj, options=FreezeOptions(max_bytes=size)) == freeze(obj)
+    with pytest.raises(FreezeLimitExceededError) as exc_info:
+        freeze(obj, options=FreezeOptions(max_bytes=size - 1))
+    assert exc_info.value.limit == "max_bytes"
+
+
+def test_limits_abort_early():
+    """Test that freezing is aborted without visiting the remaining nodes."""
+    visited = []
+
+    def convert(obj, _):
+        visited.append(obj)
+        return obj
+
+    converter = Converter(input_type=int, convert=convert)
+
+    with pytest.raises(FreezeLimitExceededError):
+        freeze(
+            list(range(1000)),
+            add_converters=[converter],
+            options=FreezeOptions(max_nodes=10),
+        )
+    assert len(visited) == 9
+
+
+def test_limits_with_batch_converter():
+    """Test that nodes handled by batch converters are accounted for as well."""
+    converter = Converter(input_type=int, convert_batch=lambda objs, _: objs)
+
+    with pytest.raises(FreezeLimitExceededError):
+        freeze(
+            list(range(1000)),
+            add_converters=[converter],
+            options=FreezeOptions(max_nodes=10),
+        )
+
+
+def test_limits_of_table():
+    """Test that the records of FrozenTables are accounted for as nodes and levels."""
+    records = [{"a": 1}, {"a": 2}]
+
+    frozen = freeze(
+        records, sequence_type=FrozenTable, options=FreezeOptions(max_nodes=7)
+    )
+    assert type(frozen) is FrozenTable
+    assert frozen == freeze(records, sequence_type=FrozenTable)
+    with pytest.raises(FreezeLimitExceededError):
+        freeze(records, sequence_type=FrozenTable, options=FreezeOptions(max_nodes=6))
+
+    assert freeze(
+        records, sequence_type=FrozenTable, options=FreezeOptions(max_depth=3)
+    ) == freeze(records, sequence_type=FrozenTable)
+    with pytest.raises(FreezeLimitExceededError):
+        freeze(records, sequence_type=FrozenTable, options=FreezeOptions(max_depth=2))
+
+
+def test_limits_with_cache():
+    """Test that results frozen without limits are not reused when limits are set."""
+    obj = list(range(100))
+    cache = FreezeCache()
+    freeze(obj, options=FreezeOptions(cache=cache))
+
+    with pytest.raises(FreezeLimitExceededError):
+        freeze(obj, options=FreezeOptions(cache=cache, max_nodes=10))
@@ -0,0 +1,140 @@
+# Copyright 2024 Kersten Henrik Breuer
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Test the optional pandas converters."""
+
+import datetime
+
+import pytest
+from arcticfreeze import FrozenDict, freeze
+
+pd = pytest.importorskip("pandas")
+np = pytest.importorskip("numpy")
+
+from arcticfreeze.pandas import (
+    PANDAS_CONVERTERS,
+    FrozenColumns,
+    get_pandas_converters,
+)
+
+
+def make_frame():
+    """Create a synthetic DataFrame with columns of different dtypes."""
+    return pd.DataFrame(
+        {
+            "id": np.arange(3),
+            "value": [0.5, 1.5, 2.5],
+            "name": ["a", "b", "c"],
+            "tags": [["x"], [], ["y", "z"]],
+        }
+    )
+
+
+def test_freeze_data_frame():
+    """Test freezing a DataFrame to tuples per column."""
+    frozen = freeze(make_frame(), add_converters=PANDAS_CONVERTERS)
+
+    assert isinstance(frozen, FrozenColumns)
+    assert frozen == FrozenDict(
+        {
+            "id": (0, 1, 2),
+            "value": (0.5, 1.5, 2.5),
+            "name": ("a", "b", "c"),
+            "tags": (("x",), (), ("y", "z")),
+        }
+    )
+    assert type(frozen["id"][0]) is int
+    hash(frozen)
+
+
+def test_freeze_data_frame_as_arrays():
+    """Test freezing a DataFrame to read-only arrays per column."""
+    frame = make_frame()
+    converters = get_pandas_converters(column_format="array")
+    frozen = freeze(frame, add_converters=converters)
+
+    assert isinstance(frozen, FrozenColumns)
+    assert isinstance(frozen["id"], np.ndarray)
+    assert not frozen["id"].flags.writeable
+    with pytest.raises(ValueError):
+        frozen["id"][0] = 42
+
+    # the source is not shared:
+    frame.loc[0, "id"] = 42
+    assert frozen["id"][0] == 0
+
+    # object columns are still frozen element-wise:
+    assert frozen["tags"] == (("x",), (), ("y", "z"))
+
+
+@pytest.mark.parametrize("column_format", ["tuple", "array"])
+def test_records_view(column_format):
+    """Test the lazily materialized records view."""
+    converters = get_pandas_converters(column_format=column_format)
+    frozen = freeze(make_frame(), add_converters=converters)
+    assert isinstance(frozen, FrozenColumns)
+
+    records = frozen.records
+    assert records[1] == FrozenDict({"id": 1, "value": 1.5, "name": "b", "tags": ()})
+    assert type(records[1]["id"]) is int
+    assert frozen.records is records
+
+
+def test_freeze_series():
+    """Test freezing a Series nested in another structure."""
+    frozen = freeze({"s": pd.Series([1, 2])}, add_converters=PANDAS_CONVERTERS)
+
+    assert frozen == FrozenDict({"s": (1, 2)})
+
+
+@pytest.mark.parametrize(
+    ("series", "expected"),
+    [
+        (
+            pd.Series(pd.to_datetime(["2024-01-02 03:04:05", None])),
+            (datetime.datetime(2024, 1, 2, 3, 4, 5), None),
+        ),
+        (
+            pd.Series(pd.to_datetime(["2024-01-02", None], utc=True)),
+            (datetime.datetime(2024, 1, 2, tzinfo=datetime.timezone.utc), None),
+        ),
+        (
+            pd.Series(pd.to_timedelta(["1s", None])),
+            (datetime.timedelta(seconds=1), None),
+        ),
+        (pd.Series([1, None], dtype="Int64"), (1, None)),
+        (pd.Series([True, None], dtype="boolean"), (True, None)),
+        (pd.Series(["a", None], dtype="string"), ("a", None)),
+        (pd.Series(["a", None], dtype="category"), ("a", None)),
+    ],
+)
+def test_freeze_special_dtypes(series, expected):
+    """Test that datetimes, timedeltas, and extension dtypes are converted to
+    standard library objects with missing values as `None`.
+    """
+    frozen = freeze(series, add_converters=PANDAS_CONVERTERS)
+
+    assert isinstance(frozen, tuple)
+    assert frozen == expected
+    assert [type(value) for value in frozen] == [type(value) for value in expected]
+    hash(frozen)
+
+
+def test_freeze_duplicate_columns():
+    """Test that DataFrames with duplicate column names are rejected."""
+    frame = pd.DataFrame([[1, 2]], columns=["a", "a"])
+
+    with pytest.raises(ValueError):
+        freeze(frame, add_converters=PANDAS_CONVERTERS)
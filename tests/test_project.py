@@ -0,0 +1,230 @@
+# Copyright 2024 Kersten Henrik Breuer
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Test freezing only selected paths via the include and exclude arguments."""
+
+import pytest
+from arcticfreeze import (
+    ConverterNotFoundError,
+    FreezeCache,
+    FreezeOptions,
+    FrozenDict,
+    FrozenList,
+    FrozenTable,
+    freeze,
+)
+
+from tests.cases import VALID_CASES, ValidTestCase
+
+CONFIG = {
+    "db": {
+        "host": "a",
+        "port": 1,
+        "replicas": [{"host": "x", "port": 2}, {"host": "y", "port": 3}],
+    },
+    "cache": {"size": 1},
+    "tags": ["t1", "t2"],
+}
+
+
+@pytest.mark.parametrize(
+    "test_case",
+    VALID_CASES,
+    ids=lambda test_case: test_case.name,
+)
+def test_select_everything(test_case: ValidTestCase):
+    """Test that selecting everything gives the same result as freezing."""
+    assert (
+        freeze(test_case.inputs, options=FreezeOptions(include=["*"]))
+        == test_case.expected_outputs
+    )
+    assert (
+        freeze(test_case.inputs, options=FreezeOptions(exclude=[]))
+        == test_case.expected_outputs
+    )
+
+
+@pytest.mark.parametrize(
+    ("include", "expected"),
+    [
+        (["cache"], {"cache": {"size": 1}}),
+        (["db.host", "tags.1"], {"db": {"host": "a"}, "tags": ("t2",)}),
+        (
+            ["db.replicas.*.host"],
+            {"db": {"replicas": ({"host": "x"}, {"host": "y"})}},
+        ),
+        (["db.replicas.1"], {"db": {"replicas": ({"host": "y", "port": 3},)}}),
+        (["db.p?rt", "cache.[st]ize"], {"db": {"port": 1}, "cache": {"size": 1}}),
+        (["missing", "db.host.missing"], {}),
+        ([], {}),
+    ],
+)
+def test_include(include: list[str], expected: dict):
+    """Test that only the included paths and the containers leading to them are
+    kept.
+    """
+    assert freeze(CONFIG, options=FreezeOptions(include=include)) == freeze(expected)
+
+
+@pytest.mark.parametrize(
+    ("exclude", "expected"),
+    [
+        (
+            ["db"],
+            {"cache": {"size": 1}, "tags": ("t1", "t2")},
+        ),
+        (
+            ["db.replicas.*.port", "tags.0", "cache.size"],
+            {
+                "db": {
+                    "host": "a",
+                    "port": 1,
+                    "replicas": ({"host": "x"}, {"host": "y"}),
+                },
+                "cache": {},
+                "tags": ("t2",),
+            },
+        ),
+        (["*"], {}),
+    ],
+)
+def test_exclude(exclude: list[str], expected: dict):
+    """Test that the excluded paths are dropped while empty containers are kept."""
+    assert freeze(CONFIG, options=FreezeOptions(exclude=exclude)) == freeze(expected)
+
+
+def test_wildcards_match_single_keys():
+    """Test that wildcards do not match across the separator."""
+    obj = {"a": {"b": {"c": 1}, "c": 2}}
+
+    assert freeze(obj, options=FreezeOptions(include=["a.*"])) == FrozenDict(obj)
+    assert freeze(obj, options=FreezeOptions(include=["*.c"])) == FrozenDict(
+        {"a": {"c": 2}}
+    )
+    assert freeze(obj, options=FreezeOptions(include=["a.*.c"])) == FrozenDict(
+        {"a": {"b": {"c": 1}}}
+    )
+
+
+@pytest.mark.parametrize("name", ["include", "exclude"])
+@pytest.mark.parametrize("paths", ["db.host", b"db.host"])
+def test_single_path_is_rejected(name: str, paths):
+    """Test that a single path is not mistaken for an iterable of paths."""
+    with pytest.raises(TypeError):
+        FreezeOptions(**{name: paths})
+
+
+def test_include_and_exclude():
+    """Test that exclusions take precedence over inclusions."""
+    frozen = freeze(
+        CONFIG,
+        options=FreezeOptions(include=["db"], exclude=["db.replicas.0", "db.port"]),
+    )
+
+    assert frozen == FrozenDict(
+        {"db": {"host": "a", "replicas": (FrozenDict({"host": "y", "port": 3}),)}}
+    )
+
+
+def test_skipped_parts_are_not_visited():
+    """Test that parts that are not selected are not converted at all, so that they
+    may even contain unconvertible values.
+    """
+    obj = {"a": {"b": 1}, "c": [object()], "d": {"e": object(), "f": 2}}
+
+    assert freeze(obj, options=FreezeOptions(include=["a", "d.f"])) == FrozenDict(
+        {"a": {"b": 1}, "d": {"f": 2}}
+    )
+    assert freeze(obj, options=FreezeOptions(exclude=["c", "d.e"])) == FrozenDict(
+        {"a": {"b": 1}, "d": {"f": 2}}
+    )
+    with pytest.raises(ConverterNotFoundError):
+        freeze(obj, options=FreezeOptions(include=["c"]))
+
+
+def test_other_objects_are_selected_as_a_whole():
+    """Test that objects not handled as mappings or sequences are not walked."""
+    obj = {"a": {1, 2}, "b": "text"}
+
+    assert freeze(obj, options=FreezeOptions(include=["a.0", "b.0"])) == FrozenDict()
+    assert freeze(obj, options=FreezeOptions(include=["a"])) == FrozenDict(
+        {"a": frozenset({1, 2})}
+    )
+
+
+def test_root():
+    """Test that the root object is kept even if nothing of it is selected."""
+    assert freeze([1, [2, 3]], options=FreezeOptions(include=["1.1"])) == ((3,),)
+    assert freeze([], options=FreezeOptions(include=["0"])) == ()
+    assert freeze(1, options=FreezeOptions(include=["a"])) == 1
+
+
+def test_sequence_type():
+    """Test that the sequence type is respected for projected sequences."""
+    frozen = freeze(
+        CONFIG, sequence_type=FrozenList, options=FreezeOptions(include=["tags.1"])
+    )
+
+    assert isinstance(frozen, FrozenDict)
+    assert frozen == FrozenDict({"tags": FrozenList(["t2"])})
+    assert type(frozen["tags"]) is FrozenList
+
+
+def test_table():
+    """Test that projected sequences of records are kept as FrozenTables if the
+    selected records still have the same keys.
+    """
+    records = [{"a": 1, "b": 2}, {"a": 3, "b": 4}]
+    options = FreezeOptions(include=["*.a"])
+
+    frozen = freeze(records, sequence_type=FrozenTable, options=options)
+    assert type(frozen) is FrozenTable
+    assert frozen.column_names == ("a",)
+    assert frozen == (FrozenDict({"a": 1}), FrozenDict({"a": 3}))
+
+    options = FreezeOptions(include=["r.*.a"])
+    frozen = freeze({"r": records}, sequence_type=FrozenTable, options=options)
+    assert isinstance(frozen, FrozenDict)
+    assert frozen == freeze({"r": [{"a": 1}, {"a": 3}]})
+    assert type(frozen["r"]) is FrozenTable
+
+    options = FreezeOptions(exclude=["0.b"])
+    frozen = freeze(records, sequence_type=FrozenTable, options=options)
+    assert frozen == (FrozenDict({"a": 1}), FrozenDict({"a": 3, "b": 4}))
+    assert type(frozen) is tuple
+
+
+def test_cache():
+    """Test that results are cached per selection."""
+    cache = FreezeCache()
+    obj = {"a": {"b": 1}, "c": 2}
+
+    included = freeze(obj, options=FreezeOptions(cache=cache, include=["a"]))
+    assert freeze(obj, options=FreezeOptions(cache=cache, include=["a"])) is included
+    assert freeze(obj, options=FreezeOptions(cache=cache, include=["c"])) == FrozenDict(
+        {"c": 2}
+    )
+    assert freeze(obj, options=FreezeOptions(cache=cache)) == FrozenDict(obj)
+    assert freeze(obj, options=FreezeOptions(cache=cache, include=["a"])) is included
+
+
+def test_consume():
+    """Test that consuming the object is supported."""
+    obj = {"a": [1, 2], "b": [3]}
+
+    assert freeze(
+        obj, options=FreezeOptions(include=["a"], consume=True)
+    ) == FrozenDict({"a": (1, 2)})
+    assert obj == {}
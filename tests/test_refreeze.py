@@ -0,0 +1,97 @@
+# Copyright 2024 Kersten Henrik Breuer
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Test the refreeze function."""
+
+import pytest
+from arcticfreeze import ConverterNotFoundError, FrozenDict, freeze, refreeze
+
+from tests.cases import VALID_CASES, ValidTestCase
+
+
+@pytest.mark.parametrize(
+    "test_case",
+    VALID_CASES,
+    ids=lambda test_case: test_case.name,
+)
+def test_refreeze_matches_freeze(test_case: ValidTestCase):
+    """Test that refreezing against an unrelated previous result gives the same
+    result as freezing.
+    """
+    previous = freeze({"unrelated": [1, 2]})
+    assert refreeze(test_case.inputs, previous) == test_case.expected_outputs
+
+
+def test_refreeze_unchanged():
+    """Test that the previous result is returned if nothing changed."""
+    config = {"a": [1, {"b": "c"}], "d": {1, 2}}
+    previous = freeze(config)
+
+    assert refreeze(config, previous) is previous
+
+
+def test_refreeze_shares_unchanged_subtrees():
+    """Test that only the paths leading to a change are rebuilt."""
+    config: dict = {
+        "db": {"host": "a", "replicas": [{"host": "x"}, {"host": "y"}]},
+        "cache": {"size": 1},
+    }
+    previous = freeze(config)
+
+    config["db"]["replicas"][1]["host"] = "z"
+    current = refreeze(config, previous)
+
+    assert isinstance(previous, FrozenDict)
+    assert isinstance(current, FrozenDict)
+    assert current == freeze(config)
+    assert current is not previous
+    assert current["db"] is not previous["db"]
+    assert current["db"]["replicas"][1] is not previous["db"]["replicas"][1]
+    assert current["cache"] is previous["cache"]
+    assert current["db"]["host"] is previous["db"]["host"]
+    assert current["db"]["replicas"][0] is previous["db"]["replicas"][0]
+
+
+def test_refreeze_structural_changes():
+    """Test added and removed keys and items as well as changed key order."""
+    previous = freeze({"a": [1, 2, 3], "b": {"c": 1}})
+    assert isinstance(previous, FrozenDict)
+
+    assert refreeze({"a": [1, 2]}, previous) == FrozenDict({"a": (1, 2)})
+    assert refreeze({"a": [1, 2, 3, 4]}, previous) == FrozenDict({"a": (1, 2, 3, 4)})
+
+    reordered = refreeze({"b": {"c": 1}, "a": [1, 2, 3]}, previous)
+    assert isinstance(reordered, FrozenDict)
+    assert list(reordered) == ["b", "a"]
+    assert reordered["a"] is previous["a"]
+
+
+def test_refreeze_type_changes():
+    """Test that values equal to their previous counterparts but of a different type
+    are not reused.
+    """
+    previous = freeze({"a": 1})
+    current = refreeze({"a": True}, previous)
+
+    assert isinstance(current, FrozenDict)
+    assert current["a"] is True
+
+
+def test_refreeze_invalid():
+    """Test that unknown types are still rejected."""
+    previous = freeze({"a": 1})
+
+    with pytest.raises(ConverterNotFoundError):
+        refreeze({"a": object()}, previous)
@@ -0,0 +1,147 @@
+# Copyright 2024 Kersten Henrik Breuer
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Test the resolution of converters by object type."""
+
+import collections
+import enum
+from collections.abc import Sequence
+
+import pytest
+from arcticfreeze import Converter, ConverterNotFoundError, freeze
+from arcticfreeze._internal._converters import STANDARD_CONVERTERS
+from arcticfreeze._internal.freeze import custom_freeze
+from arcticfreeze._internal.resolve import ConverterResolver
+
+
+class CustomList(list):
+    """A subclass of list."""
+
+
+class CustomDeque(collections.deque):
+    """A subclass of a subclass of a standard type."""
+
+
+class GrandChildList(CustomList):
+    """A subclass of a subclass of list."""
+
+
+class VirtualSequence:
+    """Registered as virtual subclass of Sequence."""
+
+
+Sequence.register(VirtualSequence)
+
+
+class Color(enum.Enum):
+    """An enum, whose members need to be matched by subclass."""
+
+    RED = 1
+
+
+def test_resolve_exact_type():
+    """Test resolving converters by exact type."""
+    resolver = ConverterResolver(STANDARD_CONVERTERS, by_superclass=False)
+
+    assert resolver.resolve(list).input_type is list
+    with pytest.raises(ConverterNotFoundError):
+        resolver.resolve(CustomList)
+
+
+@pytest.mark.parametrize(
+    "input_type, expected_input_type",
+    [
+        (CustomList, list),
+        (GrandChildList, list),
+        (CustomDeque, collections.deque),
+        (bool, bool),
+    ],
+)
+def test_resolve_by_superclass(input_type: type, expected_input_type: type):
+    """Test resolving converters of subclasses via their MRO."""
+    resolver = ConverterResolver(STANDARD_CONVERTERS, by_superclass=True)
+
+    assert resolver.resolve(input_type).input_type is expected_input_type
+
+
+def test_resolve_by_superclass_honors_priority():
+    """Test that the converter with highest priority wins among all matching
+    superclasses even if it is not the closest one in the MRO.
+    """
+    converters = (
+        Converter(input_type=CustomList, priority=0),
+        Converter(input_type=list, priority=10),
+    )
+    resolver = ConverterResolver(converters, by_superclass=True)
+
+    assert resolver.resolve(GrandChildList).input_type is list
+
+
+def test_resolve_virtual_subclass():
+    """Test that virtual subclasses registered with an ABC are still matched."""
+    converters = (*STANDARD_CONVERTERS, Converter(input_type=Sequence, priority=-200))
+    resolver = ConverterResolver(converters, by_superclass=True)
+
+    assert resolver.resolve(VirtualSequence).input_type is Sequence
+    assert resolver.resolve(CustomList).input_type is list
+
+
+@pytest.mark.parametrize("by_superclass", [False, True])
+def test_resolve_matching_subclasses(by_superclass: bool):
+    """Test that converters matching subclasses are used without resolving by
+    superclass, but converters for the exact type take precedence.
+    """
+    converters = (
+        Converter(input_type=list, priority=0, match_subclasses=True),
+        Converter(input_type=GrandChildList, priority=-10),
+    )
+    resolver = ConverterResolver(converters, by_superclass=by_superclass)
+
+    assert resolver.resolve(CustomList).input_type is list
+    assert resolver.resolve(GrandChildList).input_type is GrandChildList
+    with pytest.raises(ConverterNotFoundError):
+        resolver.resolve(tuple)
+
+
+def test_resolve_enum():
+    """Test that enum members are frozen as is without resolving by superclass."""
+    resolver = ConverterResolver(STANDARD_CONVERTERS, by_superclass=False)
+
+    assert resolver.resolve(Color).input_type is enum.Enum
+    assert freeze([Color.RED]) == (Color.RED,)
+
+
+def test_resolve_not_found_is_cached():
+    """Test that unresolvable types are rejected repeatedly."""
+    resolver = ConverterResolver(STANDARD_CONVERTERS, by_superclass=True)
+
+    for _ in range(2):
+        with pytest.raises(ConverterNotFoundError):
+            resolver.resolve(object)
+
+
+def test_freeze_by_superclass():
+    """Test freezing nested instances of subclasses."""
+    assert freeze(CustomList([CustomDeque([1])]), by_superclass=True) == ((1,),)
+
+
+def test_modified_converters_are_not_ignored():
+    """Test that converters added to a list between calls are considered."""
+    converters = list(STANDARD_CONVERTERS)
+    with pytest.raises(ConverterNotFoundError):
+        custom_freeze(VirtualSequence(), converters=converters)
+
+    converters.append(Converter(input_type=VirtualSequence, convert=lambda *_: "v"))
+    assert custom_freeze(VirtualSequence(), converters=converters) == "v"
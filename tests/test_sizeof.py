@@ -0,0 +1,121 @@
+# Copyright 2024 Kersten Henrik Breuer
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Test measuring the memory used by frozen data structures."""
+
+import sys
+
+import pytest
+from arcticfreeze import (
+    FrozenDict,
+    FrozenList,
+    deep_sizeof,
+    freeze,
+    freeze_measured,
+    measure_memory,
+)
+from arcticfreeze._internal.frozendict import SMALL_SIZE_THRESHOLD
+
+
+def test_leaf():
+    """Test measuring a single primitive value."""
+    value = "x" * 100
+
+    usage = measure_memory(value)
+
+    assert usage.total_bytes == deep_sizeof(value) == sys.getsizeof(value)
+    assert usage.nodes_by_type == {str: 1}
+    assert usage.shared_bytes == 0
+
+
+@pytest.mark.parametrize("size", [1, SMALL_SIZE_THRESHOLD + 1])
+def test_frozen_dict(size):
+    """Test that the storage of FrozenDicts is included for both layouts."""
+    frozen = FrozenDict({f"key{index}": 1000 + index for index in range(size)})
+    storage = frozen._items if frozen._dict is None else frozen._dict
+
+    expected = (
+        sys.getsizeof(frozen)
+        + sys.getsizeof(storage)
+        + sum(map(sys.getsizeof, frozen.keys()))
+        + sum(map(sys.getsizeof, frozen.values()))
+    )
+
+    assert deep_sizeof(frozen) == expected
+    assert measure_memory(frozen).nodes_by_type == {FrozenDict: 1, str: size, int: size}
+
+
+def test_frozen_list_view():
+    """Test that views of FrozenLists account for the entire shared storage."""
+    frozen = FrozenList(range(1000, 1100))
+
+    assert deep_sizeof(frozen[:1]) == deep_sizeof(frozen)
+
+
+def test_shared_subtrees():
+    """Test that shared objects are counted once and the savings are reported."""
+    shared = freeze(["x" * 100, "y" * 100])
+
+    usage = measure_memory((shared, shared, shared))
+
+    assert usage.total_bytes == sys.getsizeof((None,) * 3) + deep_sizeof(shared)
+    assert usage.shared_bytes == 2 * deep_sizeof(shared)
+    assert usage.nodes_by_type == {tuple: 2, str: 2}
+
+
+def test_nested_shared_subtrees():
+    """Test the savings for shared objects within shared objects."""
+    leaf = "x" * 100
+    inner = (leaf, leaf)
+    usage = measure_memory((inner, inner))
+
+    inner_size = sys.getsizeof(inner)
+    leaf_size = sys.getsizeof(leaf)
+    # without sharing: 2 inner tuples with 2 leaves each
+    assert usage.shared_bytes == inner_size + 3 * leaf_size
+
+
+def test_result_is_cached():
+    """Test that measuring the same FrozenDict again returns the cached result."""
+    frozen = freeze({"a": [1, 2]})
+
+    assert measure_memory(frozen) is measure_memory(frozen)
+
+
+def test_freeze_measured():
+    """Test measuring while freezing."""
+    frozen, usage = freeze_measured({"a": [1, 2]}, sequence_type=FrozenList)
+
+    assert isinstance(frozen, FrozenDict)
+    assert frozen == {"a": (1, 2)}
+    assert type(frozen["a"]) is FrozenList
+    assert usage == measure_memory(frozen)
+
+
+def test_shared_key_table():
+    """Test that the key table shared by records is counted once."""
+    records = freeze([{"key": index} for index in range(1000, 1010)])
+
+    usage = measure_memory(records)
+
+    assert usage.nodes_by_type[FrozenDict] == 10
+    assert (
+        sum(
+            count
+            for type_, count in usage.nodes_by_type.items()
+            if type_ not in (FrozenDict, int, tuple)
+        )
+        == 2
+    )  # the key table and the key
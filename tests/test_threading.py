@@ -0,0 +1,105 @@
+# Copyright 2024 Kersten Henrik Breuer
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Stress test using the freeze engine and frozen types from many threads at once."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from arcticfreeze import FreezeCache, FreezeOptions, FrozenDict, freeze, index_paths
+from arcticfreeze._internal.index import GLOB_RESULT_CACHE_SIZE
+
+THREADS = 8
+ROUNDS = 200
+
+
+def _run_concurrently(function):
+    """Run the function on all threads at once and return the results."""
+    barrier = threading.Barrier(THREADS)
+
+    def run(thread_index):
+        barrier.wait()
+        return function(thread_index)
+
+    with ThreadPoolExecutor(max_workers=THREADS) as executor:
+        return list(executor.map(run, range(THREADS)))
+
+
+def test_concurrent_freeze():
+    """Test freezing independent payloads concurrently, also resolving converters
+    by superclass for types first seen concurrently.
+    """
+    subclasses = [type(f"Dict{index}", (dict,), {}) for index in range(ROUNDS)]
+
+    def work(thread_index):
+        results = []
+        for index, subclass in enumerate(subclasses):
+            payload = subclass(thread=thread_index, items=[index, {"x": {index}}])
+            results.append(freeze(payload, by_superclass=True))
+        return results
+
+    for thread_index, results in enumerate(_run_concurrently(work)):
+        assert results == [
+            {"thread": thread_index, "items": (index, {"x": frozenset({index})})}
+            for index in range(ROUNDS)
+        ]
+
+
+def test_concurrent_shared_cache():
+    """Test sharing a freeze cache between threads."""
+    sources = [{"index": index} for index in range(ROUNDS)]
+    cache = FreezeCache(maxsize=ROUNDS // 2)
+
+    def work(_):
+        return [
+            freeze(source, options=FreezeOptions(cache=cache)) for source in sources * 2
+        ]
+
+    for results in _run_concurrently(work):
+        assert results == sources * 2
+    assert len(cache) == ROUNDS // 2
+    assert cache.hits + cache.misses == THREADS * ROUNDS * 2
+
+
+def test_concurrent_derived_data():
+    """Test that data derived from a shared instance is computed consistently."""
+    frozen_dicts = [FrozenDict(a={"b": index}) for index in range(ROUNDS)]
+
+    def work(_):
+        return [index_paths(frozen) for frozen in frozen_dicts]
+
+    all_results = _run_concurrently(work)
+    for results in all_results:
+        # all threads get the same cached index:
+        assert all(
+            result is expected for result, expected in zip(results, all_results[0])
+        )
+    assert [index["a.b"] for index in all_results[0]] == list(range(ROUNDS))
+
+
+def test_concurrent_glob():
+    """Test that the bounded glob cache of a shared index stays consistent."""
+    index = index_paths(FrozenDict({f"key{index}": index for index in range(10)}))
+    size = GLOB_RESULT_CACHE_SIZE
+
+    def work(thread_index):
+        return [
+            index.glob(f"key{(thread_index + round_) % 10}") for round_ in range(ROUNDS)
+        ] + [index.glob(f"missing{thread_index}.{number}") for number in range(size)]
+
+    for results in _run_concurrently(work):
+        assert [len(result) for result in results[:ROUNDS]] == [1] * ROUNDS
+        assert all(result == FrozenDict() for result in results[ROUNDS:])
+    assert len(index._glob_cache) == size